@@ -6,16 +6,39 @@ Character-by-character display with Whisper AI transcription
 import os
 import sys
 import time
+import json
+import shutil
+import subprocess
+import hashlib
+import bisect
 import logging
+import argparse
+import threading
+import select
+import socket
+import statistics
+import tempfile
+import wave
+import queue
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+import urllib.request
+import urllib.error
+import urllib.parse
+import http.client
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Callable
+from dataclasses import dataclass, field, fields, replace
 from contextlib import contextmanager
 from enum import Enum
 
-import pygame
-from yt_dlp import YoutubeDL
-import whisper
+import numpy as np
+
+# pygame, yt_dlp and whisper/torch are imported where their stage runs, so
+# --help, prompts and cached playback start without paying for them
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
 
 
 # ============================================================================
@@ -37,6 +60,27 @@ WHISPER_MODELS = [
 # Best model for speed + accuracy balance
 DEFAULT_MODEL = "large-v3-turbo"  # Fast large model with excellent accuracy
 
+# Relative model size for budget-based selection (aliases share their target's rank)
+MODEL_SIZE_RANK = {
+    'tiny.en': 0, 'tiny': 0, 'base.en': 1, 'base': 1, 'small.en': 2, 'small': 2,
+    'medium.en': 3, 'medium': 3, 'large-v3-turbo': 4, 'turbo': 4,
+    'large-v1': 5.0, 'large-v2': 5.1, 'large-v3': 5.2, 'large': 5.2,
+}
+MODEL_ALIASES = {'large': 'large-v3', 'turbo': 'large-v3-turbo'}
+
+# Transcription engines: openai-whisper (PyTorch) or faster-whisper (CTranslate2)
+BACKENDS = ['whisper', 'faster-whisper']
+DEFAULT_BACKEND = "whisper"
+
+# Persistent cache location (audio, transcripts, profiles)
+DEFAULT_CACHE_DIR = str(
+    Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'karaoke_player'
+)
+
+# Transcription daemon defaults (localhost only)
+DEFAULT_DAEMON_HOST = "127.0.0.1"
+DEFAULT_DAEMON_PORT = 8765
+
 
 # ============================================================================
 # CONFIGURATION
@@ -46,15 +90,42 @@ DEFAULT_MODEL = "large-v3-turbo"  # Fast large model with excellent accuracy
 class Config:
     """Configuration settings for the karaoke player"""
     song_query: str = ""
-    audio_filename: str = "temp_audio.mp3"
-    audio_file_base: str = "temp_audio"
+    audio_file_base: str = "temp_audio"  # Download gets the source extension, playback ".wav"
     whisper_model: str = DEFAULT_MODEL
+    backend: str = DEFAULT_BACKEND
+    compute_type: str = "int8"  # faster-whisper quantization (int8, int8_float16, float16, float32)
+    model_budget: float = 0.0  # Max transcription seconds per audio minute; main() resolves it once
+    quantize: bool = False  # Dynamic int8 Linear layers for the whisper backend on CPU
+    chunk_workers: int = 0  # >1 splits one song at silences and transcribes chunks in parallel
+    chunk_min_seconds: float = 30.0
+    chunk_max_seconds: float = 60.0
+    align_lyrics: bool = False  # Force-align known lyrics instead of transcribing
+    lyrics_file: Optional[str] = None  # Local lyrics for alignment (else Genius)
+    genius_token: Optional[str] = None  # Defaults to $GENIUS_TOKEN
     display_mode: DisplayMode = DisplayMode.CHARACTER
     new_line_threshold: float = 0.5  # Lower = more line breaks
     max_line_length: int = 50  # Maximum characters per line
-    audio_quality: str = "192"
     timing_offset: float = 0.0
+    start_delay: float = 2.0  # Countdown before playback (0 for scripted runs)
     cleanup_on_exit: bool = True
+    report_file: Optional[str] = None  # Per-stage timing/resource report (JSON)
+    report_log: Optional[str] = None  # JSONL log the report is appended to
+    cache_dir: str = DEFAULT_CACHE_DIR
+    use_audio_cache: bool = True
+    audio_cache_max_mb: int = 2048  # LRU eviction above this size
+    use_transcript_cache: bool = True
+    language: str = "en"
+    daemon_url: Optional[str] = None  # e.g. http://127.0.0.1:8765
+    streaming: bool = False  # Start playback before transcription finishes
+    stream_window: float = 30.0  # Longest transcription window; each is cut at a pause past half of it
+    stream_lead: float = 30.0  # Seconds of lyrics ready before playback starts
+    transcribe_workers: int = 1  # Worker processes for queue transcription
+    torch_threads: int = 0  # Threads per worker (0 = split cores evenly)
+    vad: bool = False  # Skip instrumental/silent regions before Whisper
+    vad_padding: float = 0.5  # Seconds kept around each voiced region
+    vad_threshold_db: float = 12.0  # Voice-band energy above the noise floor
+    use_latency_profile: bool = True  # Add the calibrated output latency to timing_offset
+    mixer_buffer: int = 0  # Mixer buffer frames (0 = probe once per host, then cached)
     
     def __post_init__(self):
         """Validate configuration"""
@@ -64,6 +135,17 @@ class Config:
                 f"Using default: {DEFAULT_MODEL}"
             )
             self.whisper_model = DEFAULT_MODEL
+        if not 0 < self.chunk_min_seconds < self.chunk_max_seconds:
+            logger.warning(
+                f"⚠️  Chunk bounds {self.chunk_min_seconds:g}-{self.chunk_max_seconds:g}s invalid "
+                f"(need 0 < min < max). Using 30-60s"
+            )
+            self.chunk_min_seconds, self.chunk_max_seconds = 30.0, 60.0
+        if self.backend not in BACKENDS:
+            logger.warning(
+                f"⚠️  Backend '{self.backend}' unknown. Using default: {DEFAULT_BACKEND}"
+            )
+            self.backend = DEFAULT_BACKEND
 
 
 # ============================================================================
@@ -84,6 +166,9 @@ logger = logging.getLogger(__name__)
 class UI:
     """Console UI utilities"""
     
+    # Per-thread output suppression for background pipeline workers
+    _local = threading.local()
+    
     # Colors
     CYAN = '\033[1;36m'
     GREEN = '\033[1;32m'
@@ -94,6 +179,24 @@ class UI:
     RESET = '\033[0m'
     BOLD = '\033[1m'
     
+    @staticmethod
+    def set_quiet(quiet: bool):
+        """Suppress status output from the calling thread (errors are collected instead)"""
+        UI._local.quiet = quiet
+        UI._local.errors = []
+    
+    @staticmethod
+    def is_quiet() -> bool:
+        """Check whether the calling thread's output is suppressed"""
+        return getattr(UI._local, 'quiet', False)
+    
+    @staticmethod
+    def drain_errors() -> List[str]:
+        """Return and clear the errors collected while quiet"""
+        errors = getattr(UI._local, 'errors', [])
+        UI._local.errors = []
+        return errors
+    
     @staticmethod
     def clear():
         """Clear console screen"""
@@ -110,6 +213,8 @@ class UI:
     @staticmethod
     def print_section(title: str):
         """Print section header"""
+        if UI.is_quiet():
+            return
         print(f"\n{UI.BLUE}{'─' * 60}{UI.RESET}")
         print(f"{UI.BOLD}{title}{UI.RESET}")
         print(f"{UI.BLUE}{'─' * 60}{UI.RESET}\n")
@@ -117,21 +222,30 @@ class UI:
     @staticmethod
     def print_success(message: str):
         """Print success message"""
+        if UI.is_quiet():
+            return
         print(f"{UI.GREEN}✓ {message}{UI.RESET}")
     
     @staticmethod
     def print_error(message: str):
         """Print error message"""
+        if UI.is_quiet():
+            UI._local.errors.append(message)
+            return
         print(f"{UI.RED}✗ {message}{UI.RESET}")
     
     @staticmethod
     def print_info(message: str):
         """Print info message"""
+        if UI.is_quiet():
+            return
         print(f"{UI.CYAN}ℹ {message}{UI.RESET}")
     
     @staticmethod
     def print_warning(message: str):
         """Print warning message"""
+        if UI.is_quiet():
+            return
         print(f"{UI.YELLOW}⚠ {message}{UI.RESET}")
     
     @staticmethod
@@ -165,20 +279,2729 @@ class UI:
                     return idx
                 UI.print_error(f"Please enter a number between 1 and {len(options)}")
             except ValueError:
-                UI.print_error("Please enter a valid number")
+                UI.print_error("Please enter a valid number")
+
+
+# ============================================================================
+# TIMING ENGINE
+# ============================================================================
+
+class TimingTrack:
+    """Array-backed display track: parallel start times, text offsets and newline flags.
+    
+    Token i shows text[offsets[i]:offsets[i + 1]] at starts[i]; newline
+    tokens carry no text. Indexing yields (text, start, is_newline) tuples
+    for convenience, but the playback loop reads the arrays directly.
+    """
+    
+    __slots__ = ('starts', 'offsets', 'newline', 'text', 'deadlines', 'newline_indices')
+    
+    def __init__(self, starts: np.ndarray, offsets: np.ndarray, newline: np.ndarray, text: str):
+        self.starts = starts      # float64 seconds
+        self.offsets = offsets    # int64, len(starts) + 1 entries into text
+        self.newline = newline    # bool, True for line breaks
+        self.text = text
+        # Tokens display in order, so token i is due once every start up to i has passed;
+        # the running maximum is sorted and can be binary-searched
+        self.deadlines = np.maximum.accumulate(starts) if len(starts) else starts
+        self.newline_indices = np.flatnonzero(newline)
+    
+    def due_count(self, t: float) -> int:
+        """Number of leading tokens due at display time t"""
+        return int(np.searchsorted(self.deadlines, t, side='right'))
+    
+    def line_start(self, i: int) -> int:
+        """Index of the first token on the line containing token i"""
+        k = int(np.searchsorted(self.newline_indices, i, side='left'))
+        return int(self.newline_indices[k - 1]) + 1 if k > 0 else 0
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def text_at(self, i: int) -> str:
+        """Text of token i ('\n' for line breaks)"""
+        if self.newline[i]:
+            return '\n'
+        return self.text[self.offsets[i]:self.offsets[i + 1]]
+    
+    def __getitem__(self, i: int) -> Tuple[str, float, bool]:
+        return self.text_at(i), float(self.starts[i]), bool(self.newline[i])
+    
+    @classmethod
+    def from_tokens(cls, tokens: List[Tuple[str, float, bool]]) -> 'TimingTrack':
+        """Pack (text, start, is_newline) tokens into a track"""
+        texts = ['' if is_newline else text for text, _, is_newline in tokens]
+        offsets = np.zeros(len(tokens) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in texts], out=offsets[1:])
+        return cls(
+            np.array([start for _, start, _ in tokens], dtype=np.float64),
+            offsets,
+            np.array([is_newline for _, _, is_newline in tokens], dtype=bool),
+            ''.join(texts)
+        )
+
+
+def _break_lines(words: List[Dict[str, Any]], new_line_threshold: float,
+                 max_line_length: int) -> Tuple[List[str], List[float], List[float], List[bool]]:
+    """Single pass over the words: stripped texts, start/end times and break-before flags"""
+    texts, starts, ends, breaks = [], [], [], []
+    last_word_end = 0.0
+    current_line_length = 0
+    
+    for word_idx, word_info in enumerate(words):
+        word_start = word_info.get('start', 0)
+        word_end = word_info.get('end', word_start + 0.3)
+        word_text = word_info.get('word', '').strip()
+        
+        # Smart line break detection
+        gap = word_start - last_word_end if word_idx > 0 else 0
+        should_break = False
+        if word_idx > 0 and current_line_length > 0:
+            # Break on significant pauses
+            if gap > new_line_threshold:
+                should_break = True
+            # Break on shorter pauses if line is getting long
+            elif gap > 0.3 and current_line_length > max_line_length * 0.7:
+                should_break = True
+            # Force break if line would get too long
+            elif current_line_length + len(word_text) > max_line_length:
+                should_break = True
+        
+        if should_break:
+            current_line_length = 0
+        if word_text:
+            current_line_length += len(word_text) + 1
+        
+        texts.append(word_text)
+        starts.append(word_start)
+        ends.append(word_end)
+        breaks.append(should_break)
+        last_word_end = word_end
+    
+    return texts, starts, ends, breaks
+
+
+def _character_track(texts: List[str], starts: List[float], ends: List[float],
+                     breaks: List[bool]) -> TimingTrack:
+    """Expand words into per-character tokens with vectorized interpolation"""
+    n_words = len(texts)
+    if n_words == 0:
+        return TimingTrack.from_tokens([])
+    
+    n_chars = np.fromiter(map(len, texts), dtype=np.int64, count=n_words)
+    brk = np.array(breaks, dtype=np.int64)
+    # Space after every non-empty word except the last one
+    space = (n_chars > 0).astype(np.int64)
+    space[-1] = 0
+    counts = brk + n_chars + space
+    
+    word_idx = np.repeat(np.arange(n_words), counts)
+    first_token = np.cumsum(counts) - counts
+    pos = np.arange(len(word_idx)) - first_token[word_idx]
+    
+    is_newline = pos < brk[word_idx]
+    char_idx = pos - brk[word_idx]
+    is_char = ~is_newline & (char_idx < n_chars[word_idx])
+    
+    word_start = np.asarray(starts, dtype=np.float64)[word_idx]
+    word_end = np.asarray(ends, dtype=np.float64)[word_idx]
+    char_duration = (word_end - word_start) / np.maximum(n_chars[word_idx], 1)
+    token_starts = np.where(
+        is_newline, word_start - 0.05,
+        np.where(is_char, word_start + char_idx * char_duration, word_end)
+    )
+    
+    # Every non-newline token is exactly one character of the text buffer
+    offsets = np.zeros(len(token_starts) + 1, dtype=np.int64)
+    np.cumsum(~is_newline, out=offsets[1:])
+    text = ''.join(
+        t + ' ' if has_space else t for t, has_space in zip(texts, space.tolist())
+    )
+    return TimingTrack(token_starts, offsets, is_newline, text)
+
+
+def build_timing_track(words: List[Dict[str, Any]], mode: DisplayMode,
+                       new_line_threshold: float, max_line_length: int) -> TimingTrack:
+    """Compute line breaks once and emit the timing track for any display mode"""
+    texts, starts, ends, breaks = _break_lines(words, new_line_threshold, max_line_length)
+    
+    if mode == DisplayMode.CHARACTER:
+        return _character_track(texts, starts, ends, breaks)
+    
+    tokens: List[Tuple[str, float, bool]] = []
+    line_words: List[str] = []
+    line_start = 0.0
+    for word_text, word_start, should_break in zip(texts, starts, breaks):
+        if should_break:
+            if mode == DisplayMode.LINE:
+                tokens.append((' '.join(line_words), line_start, False))
+                line_words = []
+            tokens.append(('\n', word_start - 0.05, True))
+        if not word_text:
+            continue
+        if mode == DisplayMode.WORD:
+            tokens.append((word_text + ' ', word_start, False))
+        else:
+            if not line_words:
+                line_start = word_start
+            line_words.append(word_text)
+    
+    # Add final line
+    if line_words:
+        tokens.append((' '.join(line_words), line_start, False))
+    
+    return TimingTrack.from_tokens(tokens)
+
+
+# ============================================================================
+# PLAYBACK SCHEDULING
+# ============================================================================
+
+SCHEDULER_SPIN_SECONDS = 0.002  # Busy-wait the last stretch for sub-ms accuracy
+SCHEDULER_MAX_SLEEP = 0.25  # Longest nap before re-checking mixer/stream state
+MIXER_BUFFER = 512  # Frames per mixer buffer
+
+
+@contextmanager
+def mixer_session(buffer: int = MIXER_BUFFER):
+    """Initialize pygame and its mixer with the player's output settings"""
+    import pygame
+    pygame.init()
+    pygame.mixer.init(
+        frequency=PLAYBACK_SAMPLE_RATE, size=-16, channels=PLAYBACK_CHANNELS, buffer=buffer
+    )
+    try:
+        yield
+    finally:
+        pygame.mixer.quit()
+        pygame.quit()
+
+
+def audio_device_id(buffer: int = MIXER_BUFFER) -> str:
+    """Identify the output chain (host, SDL driver, device, mixer format) of an initialized mixer"""
+    import pygame
+    try:
+        from pygame._sdl2 import audio as sdl_audio
+        names = sdl_audio.get_audio_device_names(False)
+        device = names[0] if names else "default"
+    except (ImportError, pygame.error):
+        device = "default"
+    driver = os.environ.get('SDL_AUDIODRIVER', 'default')
+    frequency = (pygame.mixer.get_init() or (PLAYBACK_SAMPLE_RATE,))[0]
+    return f"{socket.gethostname()}|{driver}|{device}|{frequency}Hz/{buffer}"
+
+
+def sleep_until(deadline: float, spin: float = SCHEDULER_SPIN_SECONDS,
+                wake: Optional[threading.Event] = None):
+    """Sleep until a time.perf_counter() deadline, spinning briefly at the end.
+    
+    If a wake event is given, setting it cuts the sleep short.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > spin:
+        if wake is not None:
+            if wake.wait(remaining - spin):
+                return
+        else:
+            time.sleep(remaining - spin)
+    while time.perf_counter() < deadline:
+        if wake is not None and wake.is_set():
+            return
+
+
+class AudioClock:
+    """Lyric clock driven by the mixer's playback position, smoothed against perf_counter.
+    
+    The mixer position only advances in buffer-sized steps and starts late by
+    the device start-up latency, so it is blended into a correction term that
+    offsets the monotonic clock. The correction slews gradually, so lyrics never
+    jump, and every sample's drift is kept for the end-of-song report.
+    """
+    
+    SMOOTHING = 0.1  # Weight of each new mixer sample in the correction
+    MAX_SLEW = 0.005  # Largest correction change per sample (seconds)
+    
+    def __init__(self, audio_position: Callable[[], float]):
+        self._audio_position = audio_position  # Seconds since play(), negative when unknown
+        self._start = time.perf_counter()
+        self._base = 0.0  # Song position the mixer was last started from
+        self.correction = 0.0
+        self._drifts: List[float] = []
+    
+    def start(self):
+        """Start counting from now (call right after the mixer starts playing)"""
+        self._start = time.perf_counter()
+        self._base = 0.0
+        self.correction = 0.0
+        self._drifts = []
+    
+    def rebase(self, position: float):
+        """Restart from a song position after the mixer was re-started there (seek)"""
+        self._start = time.perf_counter() - position
+        self._base = position
+        self.correction = 0.0
+    
+    def shift(self, seconds: float):
+        """Move the clock origin forward, e.g. by time spent paused"""
+        self._start += seconds
+    
+    def sample(self, now: Optional[float] = None):
+        """Measure drift against the mixer position and nudge the correction toward it"""
+        audio = self._audio_position()
+        if audio < 0:
+            return
+        audio += self._base
+        now = time.perf_counter() if now is None else now
+        drift = audio - (now - self._start)
+        self._drifts.append(drift)
+        step = self.SMOOTHING * (drift - self.correction)
+        self.correction += max(-self.MAX_SLEW, min(self.MAX_SLEW, step))
+    
+    def position(self, now: Optional[float] = None) -> float:
+        """Current playback position in seconds"""
+        now = time.perf_counter() if now is None else now
+        return now - self._start + self.correction
+    
+    def to_monotonic(self, audio_time: float) -> float:
+        """perf_counter() time at which the given playback position is reached"""
+        return self._start + audio_time - self.correction
+    
+    def drift_report(self) -> Optional[Dict[str, float]]:
+        """Drift statistics in milliseconds, or None if no samples were taken"""
+        if not self._drifts:
+            return None
+        drifts = np.array(self._drifts) * 1000.0
+        return {
+            'samples': len(drifts),
+            'mean_ms': float(drifts.mean()),
+            'std_ms': float(drifts.std()),
+            'max_abs_ms': float(np.abs(drifts).max()),
+            'final_correction_ms': self.correction * 1000.0,
+        }
+
+
+# ============================================================================
+# TERMINAL RENDERING
+# ============================================================================
+
+class TerminalRenderer:
+    """Coalesces every token due in a tick into one pre-encoded write.
+    
+    The track text is encoded to UTF-8 once; a frame is a byte slice of that
+    buffer with line prefixes spliced in at newline tokens, written with a
+    single os.write. Color escapes are only emitted when the color changes.
+    """
+    
+    LINE_PREFIX = "🎵 "
+    
+    def __init__(self, stream=None):
+        self._stream = stream or sys.stdout
+        self._fd = self._stream.fileno()
+        self._color: Optional[str] = None
+        self._newline_bytes = f"\n{self.LINE_PREFIX}".encode('utf-8')
+        self._track: Optional[TimingTrack] = None
+        self._encoded = b''
+        self._byte_offsets = np.zeros(1, dtype=np.int64)
+        self._status_width = 0
+    
+    def set_track(self, track: TimingTrack):
+        """Pre-encode a track's text and map its token offsets to byte offsets"""
+        self._track = track
+        self._encoded = track.text.encode('utf-8')
+        if len(self._encoded) == len(track.text):
+            self._byte_offsets = track.offsets
+            return
+        # UTF-8 width of each code point, accumulated into byte positions
+        code_points = np.frombuffer(track.text.encode('utf-32-le'), dtype=np.uint32)
+        widths = 1 + (code_points >= 0x80) + (code_points >= 0x800) + (code_points >= 0x10000)
+        char_to_byte = np.zeros(len(code_points) + 1, dtype=np.int64)
+        np.cumsum(widths, out=char_to_byte[1:])
+        self._byte_offsets = char_to_byte[track.offsets]
+    
+    def _write(self, data: bytes):
+        """Write all bytes to the terminal in as few syscalls as possible"""
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+    
+    def _color_bytes(self, color: str) -> bytes:
+        """Escape sequence switching to color, or nothing if already active"""
+        if color == self._color:
+            return b''
+        self._color = color
+        return color.encode('ascii')
+    
+    def begin(self, color: str = UI.CYAN):
+        """Start the lyric area on a fresh line"""
+        self._stream.flush()
+        self._write(b'\n' + self._color_bytes(color) + self.LINE_PREFIX.encode('utf-8'))
+    
+    def render(self, start: int, end: int, color: str = UI.CYAN):
+        """Write tokens [start, end) of the current track as one frame"""
+        if end <= start or self._track is None:
+            return
+        offsets = self._byte_offsets
+        parts = [self._clear_status_bytes(), self._color_bytes(color)]
+        prev = int(offsets[start])
+        for idx in np.flatnonzero(self._track.newline[start:end]) + start:
+            cut = int(offsets[idx])
+            parts.append(self._encoded[prev:cut])
+            parts.append(self._newline_bytes)
+            prev = cut
+        parts.append(self._encoded[prev:int(offsets[end])])
+        self._write(b''.join(parts))
+    
+    def jump(self, label: str, color: str = UI.CYAN):
+        """Start a fresh lyric line after a seek, marked with a status label"""
+        self._write(
+            self._clear_status_bytes()
+            + b'\n' + self._color_bytes(UI.YELLOW) + label.encode('utf-8')
+            + self._color_bytes(color) + self._newline_bytes
+        )
+    
+    def write(self, text: str, color: Optional[str] = None):
+        """Write status text (e.g. a wait indicator) in the given color"""
+        color_bytes = self._color_bytes(color) if color else b''
+        self._write(color_bytes + text.encode('utf-8'))
+    
+    def status(self, text: str, color: str = UI.YELLOW):
+        """Show a transient ASCII note after the lyrics, replacing the previous one"""
+        self._write(self._clear_status_bytes() + self._color_bytes(color) + text.encode('ascii'))
+        self._status_width = len(text)
+    
+    def clear_status(self):
+        """Erase the current status note, if any"""
+        self._write(self._clear_status_bytes())
+    
+    def _clear_status_bytes(self) -> bytes:
+        width, self._status_width = self._status_width, 0
+        return b'\b' * width + b' ' * width + b'\b' * width
+    
+    def reset(self):
+        """Restore default terminal colors"""
+        if self._color is not None:
+            self._write(UI.RESET.encode('ascii'))
+            self._color = None
+
+
+# ============================================================================
+# KEYBOARD CONTROLS
+# ============================================================================
+
+SEEK_STEP_SECONDS = 10.0
+INTRO_LEAD_SECONDS = 2.0  # Land this long before the first lyric when skipping the intro
+OFFSET_NUDGE_SECONDS = 0.05
+
+
+class KeyReader:
+    """Non-blocking keypress reader turning keys into playback commands.
+    
+    On POSIX the terminal is switched to cbreak mode (no echo, no line
+    buffering, Ctrl+C still works) and read from a background thread; on
+    Windows msvcrt is polled. Without a TTY it stays idle.
+    """
+    
+    KEYMAP = {
+        '\x1b[C': 'forward', 'l': 'forward',   # → arrow
+        '\x1b[D': 'back', 'h': 'back',         # ← arrow
+        'r': 'restart_line',
+        's': 'skip_intro',
+        '0': 'restart',
+        ' ': 'pause', 'p': 'pause',
+        '+': 'nudge_earlier', '=': 'nudge_earlier',
+        '-': 'nudge_later', '_': 'nudge_later',
+        'q': 'quit',
+    }
+    WINDOWS_ARROWS = {'M': '\x1b[C', 'K': '\x1b[D'}
+    HELP = ("Controls: space pause · ←/→ skip 10s · r restart line · s skip intro · "
+            "0 restart song · +/- lyrics 50 ms earlier/later · q quit")
+    
+    def __init__(self, keymap: Optional[Dict[str, str]] = None):
+        self.keymap = self.KEYMAP if keymap is None else keymap
+        self.commands: "queue.Queue[str]" = queue.Queue()
+        self.wake = threading.Event()  # Set on every command to cut scheduler sleeps short
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._saved_termios = None
+    
+    def __enter__(self) -> 'KeyReader':
+        if not sys.stdin.isatty():
+            return self
+        if os.name != 'nt':
+            import termios
+            import tty
+            fd = sys.stdin.fileno()
+            self._saved_termios = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        self._thread = threading.Thread(target=self._run, name="key-reader", daemon=True)
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=0.5)
+        if self._saved_termios is not None:
+            import termios
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_termios)
+            self._saved_termios = None
+    
+    def _read_keys(self) -> List[str]:
+        """Wait briefly for input and split it into key sequences"""
+        if os.name == 'nt':
+            import msvcrt
+            if not msvcrt.kbhit():
+                time.sleep(0.05)
+                return []
+            ch = msvcrt.getwch()
+            if ch in ('\x00', '\xe0'):
+                return [self.WINDOWS_ARROWS.get(msvcrt.getwch(), '')]
+            return [ch]
+        
+        fd = sys.stdin.fileno()
+        ready, _, _ = select.select([fd], [], [], 0.1)
+        if not ready:
+            return []
+        data = os.read(fd, 32).decode('utf-8', errors='ignore')
+        keys, i = [], 0
+        while i < len(data):
+            if data.startswith('\x1b[', i) and i + 2 < len(data):
+                keys.append(data[i:i + 3])
+                i += 3
+            else:
+                keys.append(data[i])
+                i += 1
+        return keys
+    
+    def _run(self):
+        while not self._stop.is_set():
+            for key in self._read_keys():
+                command = self.keymap.get(key) or self.keymap.get(key.lower())
+                if command:
+                    self.commands.put(command)
+                    self.wake.set()
+    
+    def poll(self) -> List[str]:
+        """Return all pending commands without blocking"""
+        self.wake.clear()
+        commands = []
+        while True:
+            try:
+                commands.append(self.commands.get_nowait())
+            except queue.Empty:
+                return commands
+
+
+# ============================================================================
+# LATENCY CALIBRATION
+# ============================================================================
+
+CLICK_COUNT = 12
+CLICK_INTERVAL = 0.6  # Seconds between clicks; taps are matched within half of this
+CLICK_LEAD_IN = 1.5
+CALIBRATION_MIN_SAMPLES = 4
+
+
+def write_playback_wav(path: Path, signal: np.ndarray):
+    """Write a mono float signal as a WAV in the mixer's playback format"""
+    pcm = (np.repeat(signal[:, None], PLAYBACK_CHANNELS, axis=1) * 32767).astype('<i2')
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(PLAYBACK_CHANNELS)
+        wav.setsampwidth(2)
+        wav.setframerate(PLAYBACK_SAMPLE_RATE)
+        wav.writeframes(pcm.tobytes())
+
+
+def make_click_train(path: Path, count: int = CLICK_COUNT, interval: float = CLICK_INTERVAL,
+                     lead_in: float = CLICK_LEAD_IN) -> np.ndarray:
+    """Write a stereo WAV of short 1 kHz clicks; returns the click times in seconds"""
+    rate = PLAYBACK_SAMPLE_RATE
+    clicks = lead_in + interval * np.arange(count)
+    signal = np.zeros(int((clicks[-1] + 1.0) * rate), dtype=np.float32)
+    t = np.arange(int(0.03 * rate)) / rate
+    click = 0.8 * np.sin(2 * np.pi * 1000 * t) * np.exp(-t / 0.005)
+    for start in (clicks * rate).astype(np.int64):
+        signal[start:start + len(click)] = click
+    write_playback_wav(path, signal)
+    return clicks
+
+
+def detect_onsets(path: Path, min_gap: float = CLICK_INTERVAL / 2) -> List[float]:
+    """Click onset times in a captured WAV (first sample above half the peak level)"""
+    with wave.open(str(path), 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError("loopback capture must be 16-bit PCM")
+        rate, channels = wav.getframerate(), wav.getnchannels()
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+    level = np.abs(samples.reshape(-1, channels).astype(np.float32)).max(axis=1)
+    if not len(level) or level.max() == 0:
+        return []
+    
+    onsets: List[float] = []
+    for idx in np.flatnonzero(level >= 0.5 * level.max()):
+        t = idx / rate
+        if not onsets or t - onsets[-1] >= min_gap:
+            onsets.append(float(t))
+    return onsets
+
+
+def match_latencies(events: Iterable[float], clicks: np.ndarray,
+                    window: float = CLICK_INTERVAL / 2) -> List[float]:
+    """Pair each event with its nearest click and return the delays within the window"""
+    delays = []
+    for event in events:
+        idx = int(np.clip(np.searchsorted(clicks, event), 1, len(clicks) - 1))
+        nearest = clicks[idx] if abs(clicks[idx] - event) < abs(clicks[idx - 1] - event) else clicks[idx - 1]
+        if abs(event - nearest) <= window:
+            delays.append(float(event - nearest))
+    return delays
+
+
+class ProfileStore:
+    """Small JSON file of measured settings keyed by host or device"""
+
+    FILE_NAME = "profiles.json"
+
+    def __init__(self, root: Path):
+        self.path = Path(root) / self.FILE_NAME
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored profile for a key, if measured"""
+        return self._load().get(key)
+
+    def put(self, key: str, profile: Dict[str, Any]):
+        """Atomically store a profile"""
+        profiles = self._load()
+        profiles[key] = profile
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(profiles, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+class LatencyProfiles(ProfileStore):
+    """Per-device output latency measurements, applied on top of timing_offset"""
+
+    FILE_NAME = "latency_profiles.json"
+
+    def offset(self, device: str) -> float:
+        """Timing offset correction for a device (0.0 if never calibrated)"""
+        profile = self.get(device)
+        return float(profile.get('offset', 0.0)) if profile else 0.0
+
+
+class LatencyCalibrator:
+    """Measures output latency by playing a click train through the player's mixer.
+    
+    Latency comes from one of three sources: keypresses tapped along with the
+    clicks, a scripted tap file (one time in seconds per line) for headless
+    runs, or a loopback WAV captured from the output starting with playback.
+    The result is stored per device so later runs apply it automatically.
+    """
+    
+    def __init__(self, config: Config, tap_file: Optional[str] = None,
+                 loopback_wav: Optional[str] = None):
+        self.config = config
+        self.tap_file = tap_file
+        self.loopback_wav = loopback_wav
+        self.profiles = LatencyProfiles(Path(config.cache_dir))
+    
+    def _read_tap_file(self) -> List[float]:
+        with open(self.tap_file, 'r', encoding='utf-8') as f:
+            return [float(line) for line in f if line.strip() and not line.lstrip().startswith('#')]
+    
+    def _play(self, path: Path, duration: float, record_taps: bool) -> List[float]:
+        """Play the click train; returns tap positions on the mixer-driven clock"""
+        import pygame
+        taps: List[float] = []
+        with KeyReader(keymap={' ': 'tap', '\n': 'tap', '\r': 'tap'} if record_taps else {}) as keys:
+            pygame.mixer.music.load(str(path))
+            pygame.mixer.music.play()
+            clock = AudioClock(lambda: pygame.mixer.music.get_pos() / 1000.0)
+            clock.start()
+            end = time.perf_counter() + duration + 0.5
+            while pygame.mixer.music.get_busy() and time.perf_counter() < end:
+                sleep_until(time.perf_counter() + SCHEDULER_MAX_SLEEP, wake=keys.wake)
+                now = time.perf_counter()
+                clock.sample(now)
+                taps.extend(clock.position(now) for _ in keys.poll())
+            pygame.mixer.music.stop()
+        return taps
+    
+    def run(self) -> Optional[float]:
+        """Run the calibration and store the profile; returns the latency in seconds"""
+        UI.print_section("🎚️  OUTPUT LATENCY CALIBRATION")
+        click_path = Path(self.config.cache_dir) / "calibration_clicks.wav"
+        click_path.parent.mkdir(parents=True, exist_ok=True)
+        clicks = make_click_train(click_path)
+        
+        if self.tap_file:
+            method = "tap-file"
+        elif self.loopback_wav:
+            method = "loopback"
+        else:
+            method = "tap"
+            UI.print_info("Press Space or Enter on every click you hear")
+        
+        buffer = resolve_mixer_buffer(self.config)
+        with mixer_session(buffer):
+            device = audio_device_id(buffer)
+            UI.print_info(f"Device: {device}")
+            taps = self._play(click_path, float(clicks[-1]) + 1.0, record_taps=method == "tap")
+        
+        if method == "tap-file":
+            events = self._read_tap_file()
+        elif method == "loopback":
+            events = detect_onsets(Path(self.loopback_wav))
+        else:
+            events = taps
+        
+        delays = match_latencies(events, clicks)
+        if len(delays) < CALIBRATION_MIN_SAMPLES:
+            UI.print_error(
+                f"Only {len(delays)} usable measurements (need {CALIBRATION_MIN_SAMPLES}); "
+                f"profile not changed"
+            )
+            return None
+        
+        latency = statistics.median(delays)
+        spread = statistics.pstdev(delays)
+        self.profiles.put(device, {
+            'latency_ms': round(latency * 1000, 1),
+            'spread_ms': round(spread * 1000, 1),
+            'offset': round(-latency, 4),
+            'samples': len(delays),
+            'method': method,
+            'created': time.time(),
+        })
+        UI.print_success(
+            f"Output latency {latency * 1000:.0f} ms (±{spread * 1000:.0f} ms over {len(delays)} clicks); "
+            f"saved to {self.profiles.path}"
+        )
+        return latency
+
+
+# ============================================================================
+# MIXER BUFFER TUNING
+# ============================================================================
+
+MIXER_BUFFER_CANDIDATES = (256, 512, 1024, 2048, 4096)
+MIXER_PROBE_SECONDS = 1.5  # Playback measured per candidate buffer size
+MIXER_MAX_RATE_ERROR = 0.1  # Gross check of mixer progress against wall time
+
+
+def mixer_host_id() -> str:
+    """Key for per-host mixer settings"""
+    return f"{socket.gethostname()}|{os.environ.get('SDL_AUDIODRIVER', 'default')}"
+
+
+class MixerProfiles(ProfileStore):
+    """Per-host mixer buffer size picked by the startup probe"""
+
+    FILE_NAME = "mixer_profiles.json"
+
+
+def _burn_cpu(stop: Any):
+    """Busy loop standing in for a transcription worker during the mixer probe"""
+    while not stop.is_set():
+        sum(range(10000))
+
+
+def measure_mixer_buffer(buffer: int, probe_path: Path,
+                         seconds: float = MIXER_PROBE_SECONDS) -> Dict[str, Any]:
+    """Play silence with one buffer size and check that the mixer position advances smoothly.
+    
+    pygame interpolates get_pos between mixer callbacks, so an underrun shows
+    up either as the position standing still or as a backward jump when a late
+    callback resets it; both count as glitches.
+    """
+    import pygame
+    stall_limit = max(3 * buffer / PLAYBACK_SAMPLE_RATE, 0.05)
+    with mixer_session(buffer):
+        pygame.mixer.music.load(str(probe_path))
+        pygame.mixer.music.play()
+        start = time.perf_counter()
+        first: Optional[Tuple[float, float]] = None  # (wall, position) of the first advance
+        last_pos, last_change = 0.0, start
+        glitches, longest_gap = 0, 0.0
+        
+        while time.perf_counter() - start < seconds:
+            time.sleep(0.002)
+            now = time.perf_counter()
+            pos = pygame.mixer.music.get_pos() / 1000.0
+            if pos == last_pos:
+                continue
+            if first is None:
+                first = (now, pos)  # The start-up delay is latency, not a glitch
+            else:
+                gap = now - last_change
+                longest_gap = max(longest_gap, gap)
+                glitches += gap > stall_limit or pos < last_pos
+            last_pos, last_change = pos, now
+        pygame.mixer.music.stop()
+    
+    rate = 0.0
+    if first is not None and last_change > first[0]:
+        rate = (last_pos - first[1]) / (last_change - first[0])
+    return {
+        'buffer': buffer,
+        'glitches': int(glitches),
+        'longest_gap_ms': round(longest_gap * 1000, 1),
+        'rate': round(rate, 4),
+        'stable': first is not None and glitches == 0 and abs(rate - 1.0) <= MIXER_MAX_RATE_ERROR,
+    }
+
+
+def probe_mixer_buffer(cache_dir: Path, candidates: Iterable[int] = MIXER_BUFFER_CANDIDATES,
+                       load_workers: Optional[int] = None) -> Tuple[int, List[Dict[str, Any]]]:
+    """Try buffer sizes from small to large under CPU load and return the smallest stable one.
+    
+    Busy worker processes (one per core by default) simulate transcription
+    running alongside playback; if no size is stable the largest is used.
+    """
+    candidates = sorted(candidates)
+    probe_path = Path(cache_dir) / "mixer_probe.wav"
+    probe_path.parent.mkdir(parents=True, exist_ok=True)
+    write_playback_wav(probe_path, np.zeros(int((MIXER_PROBE_SECONDS + 1.0) * PLAYBACK_SAMPLE_RATE), dtype=np.float32))
+    
+    if load_workers is None:
+        load_workers = os.cpu_count() or 1
+    ctx = multiprocessing.get_context('spawn')
+    stop = ctx.Event()
+    burners = [ctx.Process(target=_burn_cpu, args=(stop,), daemon=True) for _ in range(load_workers)]
+    for proc in burners:
+        proc.start()
+    
+    results: List[Dict[str, Any]] = []
+    try:
+        for buffer in candidates:
+            results.append(measure_mixer_buffer(buffer, probe_path))
+            if results[-1]['stable']:
+                return buffer, results
+        return candidates[-1], results
+    finally:
+        stop.set()
+        for proc in burners:
+            proc.join(timeout=2)
+        probe_path.unlink(missing_ok=True)
+
+
+def resolve_mixer_buffer(config: Config, reprobe: bool = False) -> int:
+    """Mixer buffer size for this host: configured, cached from a probe, or probed now"""
+    if config.mixer_buffer > 0:
+        return config.mixer_buffer
+    profiles = MixerProfiles(Path(config.cache_dir))
+    host = mixer_host_id()
+    profile = profiles.get(host)
+    if profile and not reprobe:
+        return int(profile['buffer'])
+    
+    UI.print_info("Probing mixer buffer sizes for this host...")
+    buffer, results = probe_mixer_buffer(Path(config.cache_dir))
+    for result in results:
+        UI.print_info(
+            f"  {result['buffer']:>4} frames: {'stable' if result['stable'] else 'unstable'} "
+            f"({result['glitches']} glitches, longest gap {result['longest_gap_ms']:.0f} ms, "
+            f"rate {result['rate']:.3f})"
+        )
+    profiles.put(host, {'buffer': buffer, 'results': results, 'created': time.time()})
+    UI.print_success(f"Mixer buffer: {buffer} frames ({buffer / PLAYBACK_SAMPLE_RATE * 1000:.1f} ms)")
+    return buffer
+
+
+# ============================================================================
+# AUDIO CACHE
+# ============================================================================
+
+class AudioCache:
+    """Persistent audio store keyed by resolved video ID with LRU eviction.
+
+    Several player processes may share one cache directory, so every mutation
+    re-reads the index under an exclusive lock on ``index.lock``.
+    """
+
+    INDEX_NAME = "index.json"
+    LOCK_NAME = "index.lock"
+    PARTIAL_SUFFIX = ".partial"
+    STALE_PARTIAL_SECONDS = 3600
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.root / self.INDEX_NAME
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = {}
+        with self._locked():
+            self._reload()
+            self._evict(keep=None)
+            self._save_index()
+
+    @contextmanager
+    def _locked(self):
+        """Hold the thread lock and an exclusive cross-process lock on the index"""
+        with self._lock, open(self.root / self.LOCK_NAME, 'a+b') as handle:
+            try:
+                import fcntl
+            except ImportError:  # Windows
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index, dropping entries whose files have disappeared"""
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {
+            key: entry for key, entry in index.items()
+            if (self.root / entry.get('file', '')).is_file()
+        }
+
+    def _reload(self):
+        """Re-read the index and adopt audio files it does not know about.
+
+        Orphans come from processes that wrote a file but lost their index
+        update; adopting them keeps them counted against the budget. Partial
+        copies abandoned by a crashed process are deleted.
+        """
+        self._index = self._load_index()
+        known = {entry['file'] for entry in self._index.values()}
+        reserved = {self.INDEX_NAME, self.LOCK_NAME}
+        for path in self.root.iterdir():
+            if path.name in reserved or path.name in known or not path.is_file():
+                continue
+            try:
+                stat = path.stat()
+                if path.suffix in (self.PARTIAL_SUFFIX, '.tmp'):
+                    if time.time() - stat.st_mtime > self.STALE_PARTIAL_SECONDS:
+                        path.unlink()
+                    continue
+            except OSError as e:
+                logger.debug(f"Could not inspect {path.name}: {e}")
+                continue
+            self._index[path.stem] = {
+                'file': path.name,
+                'size': stat.st_size,
+                'last_used': stat.st_mtime,
+                'title': None,
+                'duration': None,
+            }
+
+    def _save_index(self):
+        """Atomically write the index to disk"""
+        tmp_path = self._index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, indent=1)
+        os.replace(tmp_path, self._index_path)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all cached files"""
+        return sum(entry.get('size', 0) for entry in self._index.values())
+
+    def get(self, video_id: str) -> Optional[Path]:
+        """Return the cached file for a video ID and mark it as recently used"""
+        with self._locked():
+            self._reload()
+            entry = self._index.get(video_id)
+            if entry is None:
+                return None
+            entry['last_used'] = time.time()
+            self._save_index()
+            return self.root / entry['file']
+
+    def put(self, video_id: str, source: Path, info: Optional[Dict[str, Any]] = None) -> Path:
+        """Move a downloaded file into the cache and evict old entries if over budget"""
+        target = self.root / f"{video_id}{source.suffix}"
+        # Copy under a unique partial name first so other processes never adopt
+        # a half-written file and concurrent puts of one video never collide
+        fd, partial = tempfile.mkstemp(dir=self.root, prefix=f".{video_id}-", suffix=self.PARTIAL_SUFFIX)
+        os.close(fd)
+        try:
+            shutil.move(str(source), partial)
+        except BaseException:
+            os.unlink(partial)
+            raise
+        with self._locked():
+            self._reload()
+            if target.is_file():
+                os.unlink(partial)  # Another process cached this video first
+            else:
+                os.replace(partial, target)
+            self._index[video_id] = {
+                'file': target.name,
+                'size': target.stat().st_size,
+                'last_used': time.time(),
+                'title': (info or {}).get('title'),
+                'duration': (info or {}).get('duration'),
+            }
+            self._evict(keep=video_id)
+            self._save_index()
+            return target
+
+    def _evict(self, keep: Optional[str]):
+        """Remove least recently used entries until the cache fits its budget"""
+        while self.total_bytes > self.max_bytes:
+            candidates = [k for k in self._index if k != keep]
+            if not candidates:
+                break
+            oldest = min(candidates, key=lambda k: self._index[k].get('last_used', 0))
+            entry = self._index.pop(oldest)
+            try:
+                (self.root / entry['file']).unlink()
+            except OSError as e:
+                logger.debug(f"Could not evict {entry['file']}: {e}")
+
+
+# ============================================================================
+# TRANSCRIPTION HELPERS
+# ============================================================================
+
+WORD_FIELDS = ('start', 'end', 'word', 'probability')
+
+
+def normalize_words(words: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reduce Whisper word dicts to JSON-safe start/end/word/probability records"""
+    return [
+        {field: word[field] if field == 'word' else float(word[field])
+         for field in WORD_FIELDS if field in word}
+        for word in words
+    ]
+
+
+WHISPER_SAMPLE_RATE = 16000
+PLAYBACK_SAMPLE_RATE = 44100  # Must match the pygame mixer settings
+PLAYBACK_CHANNELS = 2
+
+
+def decode_audio(source: Path, playback_path: Optional[Path] = None) -> np.ndarray:
+    """Decode a source file once with a single ffmpeg process.
+    
+    Returns the 16 kHz mono float32 samples Whisper expects and, when
+    playback_path is given, writes a 44.1 kHz stereo PCM WAV for the mixer
+    from the same decode (no lossy re-encode).
+    """
+    cmd = [
+        'ffmpeg', '-nostdin', '-y', '-loglevel', 'error', '-threads', '0',
+        '-i', str(source),
+        '-map', '0:a:0', '-ac', '1', '-ar', str(WHISPER_SAMPLE_RATE),
+        '-f', 'f32le', 'pipe:1',
+    ]
+    if playback_path is not None:
+        cmd += [
+            '-map', '0:a:0', '-ac', str(PLAYBACK_CHANNELS), '-ar', str(PLAYBACK_SAMPLE_RATE),
+            '-c:a', 'pcm_s16le', str(playback_path),
+        ]
+    proc = subprocess.run(cmd, capture_output=True)
+    if proc.returncode != 0:
+        message = proc.stderr.decode('utf-8', errors='replace').strip()
+        raise RuntimeError(f"ffmpeg decode failed: {message[-500:]}")
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+# ============================================================================
+# TRANSCRIPTION BACKENDS
+# ============================================================================
+
+class TranscriptionBackend:
+    """A loaded speech model that turns audio into Whisper-style word dicts"""
+    
+    name = "base"
+    
+    def __init__(self, model_name: str, threads: int = 0):
+        self.model_name = model_name
+        self.threads = threads  # CPU threads for inference (0 = library default)
+        self.model = None
+    
+    @property
+    def label(self) -> str:
+        """Human-readable engine description for reports"""
+        return self.name
+    
+    def load(self) -> 'TranscriptionBackend':
+        """Load the model weights; returns self"""
+        raise NotImplementedError
+    
+    def transcribe(self, audio: Any, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Transcribe a file path or 16 kHz sample array into a flat word list"""
+        raise NotImplementedError
+    
+    def align(self, audio: np.ndarray, text: str, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Force-align known text to 16 kHz samples, returning the same word dicts"""
+        raise NotImplementedError(f"{self.label} cannot force-align lyrics")
+
+
+class WhisperBackend(TranscriptionBackend):
+    """Reference openai-whisper implementation (PyTorch)"""
+    
+    name = "whisper"
+    
+    def __init__(self, model_name: str, threads: int = 0, quantize: bool = False,
+                 cache_dir: Optional[Path] = None):
+        super().__init__(model_name, threads)
+        self.quantize = quantize  # Dynamic int8 Linear layers, CPU only
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.quantization_stats: Optional[Dict[str, Any]] = None
+    
+    @property
+    def label(self) -> str:
+        return "openai-whisper (dynamic int8)" if self.quantize else "openai-whisper"
+    
+    def load(self) -> 'WhisperBackend':
+        import whisper  # Deferred: pulls in torch, only needed when transcribing
+        if self.threads > 0:
+            import torch
+            torch.set_num_threads(self.threads)
+        if self.quantize:
+            self.model, self.quantization_stats = load_quantized_whisper(
+                self.model_name, self.cache_dir / 'models'
+            )
+        else:
+            self.model = whisper.load_model(self.model_name)
+        return self
+    
+    def transcribe(self, audio: Any, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if self.quantize:
+            options = dict(options, fp16=False)  # Quantized kernels take fp32 activations
+        result = self.model.transcribe(audio, verbose=False, **options)
+        words = []
+        for segment in result.get('segments', []):
+            words.extend(segment.get('words', []))
+        return words
+    
+    def align(self, audio: np.ndarray, text: str, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return align_lyrics_whisper(self.model, audio, text, options.get('language') or 'en')
+
+
+class FasterWhisperBackend(TranscriptionBackend):
+    """CTranslate2 engine from faster-whisper with quantized (int8 by default) CPU inference"""
+    
+    name = "faster-whisper"
+    
+    def __init__(self, model_name: str, threads: int = 0, compute_type: str = "int8",
+                 device: str = "auto"):
+        super().__init__(model_name, threads)
+        self.compute_type = compute_type
+        self.device = device
+    
+    @property
+    def label(self) -> str:
+        return f"{self.name} ({self.compute_type})"
+    
+    def load(self) -> 'FasterWhisperBackend':
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            raise RuntimeError("faster-whisper is not installed (pip install faster-whisper)") from e
+        self.model = WhisperModel(
+            self.model_name, device=self.device,
+            compute_type=self.compute_type, cpu_threads=self.threads
+        )
+        return self
+    
+    def transcribe(self, audio: Any, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        segments, _ = self.model.transcribe(
+            audio,
+            language=options.get('language'),
+            word_timestamps=options.get('word_timestamps', True),
+            initial_prompt=options.get('initial_prompt'),
+        )
+        return [
+            {'word': w.word, 'start': w.start, 'end': w.end, 'probability': w.probability}
+            for segment in segments for w in (segment.words or [])
+        ]
+
+
+def create_backend(backend: str, model_name: str, threads: int = 0, compute_type: str = "int8",
+                   quantize: bool = False, cache_dir: Optional[Path] = None) -> TranscriptionBackend:
+    """Instantiate (without loading) the named transcription backend"""
+    if backend == 'faster-whisper':
+        return FasterWhisperBackend(model_name, threads, compute_type)
+    if backend == 'whisper':
+        return WhisperBackend(model_name, threads, quantize, cache_dir)
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+# ============================================================================
+# MODEL QUANTIZATION
+# ============================================================================
+
+def _plain_linear_layers(model):
+    """Retype whisper's Linear subclass as nn.Linear so dynamic quantization picks it up"""
+    import torch.nn as nn
+    for module in model.modules():
+        if isinstance(module, nn.Linear) and type(module) is not nn.Linear:
+            module.__class__ = nn.Linear
+
+
+@contextmanager
+def _meta_parameters():
+    """Create module parameters on the meta device (no allocation or init); buffers stay real"""
+    import torch.nn as nn
+    register_parameter = nn.Module.register_parameter
+    
+    def _register_meta(module, name, param):
+        register_parameter(module, name, param)
+        if param is not None:
+            module._parameters[name] = nn.Parameter(param.to('meta'), param.requires_grad)
+    
+    nn.Module.register_parameter = _register_meta
+    try:
+        yield
+    finally:
+        nn.Module.register_parameter = register_parameter
+
+
+def _quantized_linear_skeleton(model):
+    """Replace every nn.Linear with an empty dynamic-int8 Linear of the same shape"""
+    import torch
+    import torch.nn as nn
+    from torch.ao.nn.quantized import dynamic as nnqd
+    for parent in list(model.modules()):
+        for name, child in list(parent.named_children()):
+            if isinstance(child, nn.Linear):
+                setattr(parent, name, nnqd.Linear(
+                    child.in_features, child.out_features,
+                    bias_=child.bias is not None, dtype=torch.qint8
+                ))
+
+
+def _time_forward(model, n_mels: int) -> float:
+    """Seconds for one encoder pass plus a short decoder pass on a silent 30 s window"""
+    import torch
+    mel = torch.zeros(1, n_mels, 3000)
+    tokens = torch.zeros(1, 8, dtype=torch.long)
+    with torch.inference_mode():
+        started = time.perf_counter()
+        model.logits(tokens, model.embed_audio(mel))
+        return time.perf_counter() - started
+
+
+def _tensor_bytes(state: Dict[str, Any]) -> int:
+    """Bytes held by the (possibly packed) tensors of a state dict"""
+    import torch
+    total = 0
+    for value in state.values():
+        for tensor in (value if isinstance(value, tuple) else (value,)):
+            if isinstance(tensor, torch.Tensor):
+                total += tensor.numel() * tensor.element_size()
+    return total
+
+
+def quantize_whisper(model_name: str, cache_path: Path):
+    """Quantize an fp32 Whisper model's Linear layers to int8, cache it and report the gain"""
+    import torch
+    import whisper
+    from dataclasses import asdict
+    
+    model = whisper.load_model(model_name, device='cpu').eval()
+    fp32_bytes = _tensor_bytes(model.state_dict())
+    fp32_seconds = _time_forward(model, model.dims.n_mels)
+    
+    _plain_linear_layers(model)
+    model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    int8_seconds = _time_forward(model, model.dims.n_mels)
+    state = model.state_dict()
+    stats = {
+        'fp32_mb': fp32_bytes / 1e6,
+        'int8_mb': _tensor_bytes(state) / 1e6,
+        'fp32_seconds': fp32_seconds,
+        'int8_seconds': int8_seconds,
+    }
+    
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp file: concurrent processes may quantize the same model
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            torch.save({
+                'dims': asdict(model.dims),
+                'state_dict': state,
+                # Non-persistent buffers (causal mask, alignment heads) are not in state_dict
+                'buffers': {name: buf for name, buf in model.named_buffers() if name not in state},
+                'stats': stats,
+            }, f)
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return model, stats
+
+
+def quantized_model_path(model_name: str, cache_root: Path) -> Path:
+    return Path(cache_root) / f"{model_name}.int8-dynamic.pt"
+
+
+def ensure_quantized_whisper(model_name: str, cache_root: Path):
+    """Quantize and cache a model unless already cached, so worker processes only load it"""
+    cache_path = quantized_model_path(model_name, cache_root)
+    if not cache_path.is_file():
+        quantize_whisper(model_name, cache_path)
+
+
+def load_quantized_whisper(model_name: str, cache_root: Path) -> Tuple[Any, Dict[str, Any]]:
+    """Load a dynamic-int8 Whisper model, quantizing and caching it on first use.
+    
+    Cached loads build the architecture with meta-device parameters, swap in
+    empty quantized Linear modules and assign the stored weights, so neither
+    the fp32 checkpoint nor the conversion is paid again.
+    """
+    import torch
+    from whisper.model import ModelDimensions, Whisper
+    
+    cache_path = quantized_model_path(model_name, cache_root)
+    started = time.perf_counter()
+    cached = cache_path.is_file()
+    if not cached:
+        model, stats = quantize_whisper(model_name, cache_path)
+    else:
+        # Quantized tensors and packed params need the full unpickler; the file is our own cache
+        checkpoint = torch.load(cache_path, map_location='cpu', weights_only=False)
+        with _meta_parameters():
+            model = Whisper(ModelDimensions(**checkpoint['dims']))
+        _quantized_linear_skeleton(model)
+        model.load_state_dict(checkpoint['state_dict'], assign=True)
+        for name, buf in checkpoint['buffers'].items():
+            owner, _, leaf = name.rpartition('.')
+            model.get_submodule(owner)._buffers[leaf] = buf
+        model.eval()
+        stats = checkpoint['stats']
+    return model, dict(stats, cached=cached, load_seconds=time.perf_counter() - started)
+
+
+def describe_quantization(stats: Dict[str, Any]) -> str:
+    """One-line summary of the measured int8 vs fp32 memory and speed"""
+    source = "cached int8 model" if stats['cached'] else "quantized to int8 (cached for next time)"
+    return (
+        f"{source} in {stats['load_seconds']:.1f}s; weights {stats['fp32_mb']:.0f} MB → "
+        f"{stats['int8_mb']:.0f} MB ({stats['int8_mb'] / stats['fp32_mb'] - 1:+.0%}), "
+        f"forward pass {stats['fp32_seconds']:.2f}s → {stats['int8_seconds']:.2f}s "
+        f"({stats['fp32_seconds'] / max(stats['int8_seconds'], 1e-9):.1f}× speed)"
+    )
+
+
+# ============================================================================
+# MODEL PRELOAD
+# ============================================================================
+
+def backend_spec(config: Config) -> Tuple[str, str, str, bool]:
+    """Everything that decides which local model a config loads"""
+    return (config.backend, config.whisper_model, config.compute_type, config.quantize)
+
+
+class ModelPreload:
+    """Loads the transcription backend on a background thread.
+    
+    Model loading is independent of user input and the download, so it
+    starts as soon as the model is known; wait() blocks only on what is left.
+    """
+    
+    def __init__(self, config: Config):
+        self.spec = backend_spec(config)
+        self.backend = create_backend(
+            config.backend, config.whisper_model,
+            compute_type=config.compute_type,
+            quantize=config.quantize, cache_dir=Path(config.cache_dir)
+        )
+        self.load_seconds: Optional[float] = None
+        self.waited_seconds: Optional[float] = None
+        self._error: Optional[BaseException] = None
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._load, name="model-preload", daemon=True)
+        self._thread.start()
+    
+    def _load(self):
+        try:
+            self.backend.load()
+        except BaseException as e:  # Re-raised in the thread that waits
+            self._error = e
+        finally:
+            self.load_seconds = time.perf_counter() - self._started
+    
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+    
+    @property
+    def saved_seconds(self) -> float:
+        """Load time that overlapped other work instead of being waited for"""
+        if self.load_seconds is None or self.waited_seconds is None:
+            return 0.0
+        return max(self.load_seconds - self.waited_seconds, 0.0)
+    
+    def matches(self, config: Config) -> bool:
+        return self.spec == backend_spec(config)
+    
+    def wait(self) -> TranscriptionBackend:
+        """Block until the model is loaded and return it"""
+        started = time.perf_counter()
+        self._thread.join()
+        self.waited_seconds = time.perf_counter() - started
+        if self._error is not None:
+            raise self._error
+        return self.backend
+
+
+def preload_model(config: Config) -> Optional[ModelPreload]:
+    """Start loading the local model if this config will transcribe or align locally"""
+    if not config.align_lyrics and (config.daemon_url or config.chunk_workers > 1):
+        return None  # The daemon or the chunk workers load their own models
+    return ModelPreload(config)
+
+
+# ============================================================================
+# LYRICS ALIGNMENT
+# ============================================================================
+
+ALIGN_MARGIN_SECONDS = 1.0  # Words ending this close to a window's end are retried in the next
+ALIGN_MAX_TOKENS = 200  # Lyric tokens offered per 30 s window (decoder context is 448)
+GENIUS_API_URL = "https://api.genius.com"
+
+
+def clean_lyrics(text: str) -> str:
+    """Drop section headers like [Chorus] and blank lines from lyric text"""
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(
+        line for line in lines
+        if line and not (line.startswith('[') and line.endswith(']'))
+    )
+
+
+class LyricsProvider:
+    """Source of known lyric text for a song query"""
+    
+    name = "base"
+    
+    def fetch(self, query: str) -> Optional[str]:
+        """Return the lyrics for a query, or None if unavailable"""
+        raise NotImplementedError
+
+
+class StaticLyricsProvider(LyricsProvider):
+    """Fixed lyric text, for tests and scripted runs"""
+    
+    name = "static"
+    
+    def __init__(self, text: str):
+        self.text = text
+    
+    def fetch(self, query: str) -> Optional[str]:
+        return clean_lyrics(self.text) or None
+
+
+class FileLyricsProvider(LyricsProvider):
+    """Lyrics read from a local text file"""
+    
+    name = "file"
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+    
+    def fetch(self, query: str) -> Optional[str]:
+        try:
+            return clean_lyrics(self.path.read_text(encoding='utf-8')) or None
+        except OSError as e:
+            UI.print_warning(f"Could not read lyrics file: {e}")
+            return None
+
+
+class _GeniusLyricsParser(HTMLParser):
+    """Collects the text of a Genius song page's lyrics containers (<br> = newline)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.parts: List[str] = []
+        self._depth = 0  # Nesting inside a lyrics container
+        self._skip_depth = 0  # Nesting inside a non-lyric block within it
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if not self._depth:
+            if tag == 'div' and attrs.get('data-lyrics-container') == 'true':
+                self._depth = 1
+            return
+        if tag == 'br':
+            self.parts.append('\n')
+        elif tag == 'div':
+            self._depth += 1
+            if self._skip_depth or attrs.get('data-exclude-from-selection') == 'true':
+                self._skip_depth += 1
+    
+    def handle_endtag(self, tag):
+        if self._depth and tag == 'div':
+            self._depth -= 1
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            if not self._depth:
+                self.parts.append('\n')
+    
+    def handle_data(self, data):
+        if self._depth and not self._skip_depth:
+            self.parts.append(data)
+
+
+class GeniusLyricsProvider(LyricsProvider):
+    """Lyrics from Genius: API search for the song, then the song page's lyric text"""
+    
+    name = "genius"
+    
+    def __init__(self, token: str, timeout: float = 10.0):
+        self.token = token
+        self.timeout = timeout
+    
+    def _get(self, url: str, headers: Dict[str, str]) -> bytes:
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.read()
+    
+    def fetch(self, query: str) -> Optional[str]:
+        try:
+            search = json.loads(self._get(
+                f"{GENIUS_API_URL}/search?{urllib.parse.urlencode({'q': query})}",
+                {'Authorization': f"Bearer {self.token}"}
+            ))
+            hit = search['response']['hits'][0]['result']
+            page = self._get(hit['url'], {'User-Agent': 'Mozilla/5.0'}).decode('utf-8', errors='replace')
+        except (OSError, http.client.HTTPException, ValueError, KeyError, IndexError) as e:
+            # OSError covers URLError, timeouts and connection resets
+            UI.print_warning(f"Genius lookup failed: {e!r}")
+            return None
+        parser = _GeniusLyricsParser()
+        parser.feed(page)
+        lyrics = clean_lyrics(''.join(parser.parts))
+        if lyrics:
+            UI.print_info(f"Lyrics: {hit.get('full_title', hit['url'])} (Genius)")
+        return lyrics or None
+
+
+def align_lyrics_whisper(model, samples: np.ndarray, text: str, language: str) -> List[Dict[str, Any]]:
+    """Force-align known lyric text with Whisper's cross-attention DTW, window by window.
+    
+    Each 30 s window runs the encoder and one teacher-forced decoder pass over
+    the next lyric words (no search). DTW crams surplus text into the window's
+    end, so words ending in its last ALIGN_MARGIN_SECONDS are retried in the
+    next window, which starts where the last kept word ended.
+    """
+    from whisper.audio import HOP_LENGTH, N_FRAMES, N_SAMPLES, SAMPLE_RATE, log_mel_spectrogram, pad_or_trim
+    from whisper.timing import find_alignment
+    from whisper.tokenizer import get_tokenizer
+    
+    tokenizer = get_tokenizer(
+        model.is_multilingual, num_languages=model.num_languages,
+        language=language, task='transcribe'
+    )
+    lyric_words = text.split()
+    word_tokens = [tokenizer.encode(' ' + word) for word in lyric_words]
+    mel = log_mel_spectrogram(samples, model.dims.n_mels, padding=N_SAMPLES)
+    total_frames = mel.shape[-1] - N_FRAMES
+    frames_per_second = SAMPLE_RATE / HOP_LENGTH
+    
+    aligned: List[Dict[str, Any]] = []
+    idx, seek = 0, 0
+    while idx < len(lyric_words) and seek < total_frames:
+        segment_frames = min(N_FRAMES, total_frames - seek)
+        last_window = seek + segment_frames >= total_frames
+        offset = seek / frames_per_second
+        window_end = offset + segment_frames / frames_per_second
+        
+        # Offer whole words up to the token budget
+        end, budget = idx, 0
+        while end < len(lyric_words) and (end == idx or budget + len(word_tokens[end]) <= ALIGN_MAX_TOKENS):
+            budget += len(word_tokens[end])
+            end += 1
+        tokens = [token for word in word_tokens[idx:end] for token in word]
+        mel_segment = pad_or_trim(mel[:, seek:seek + segment_frames], N_FRAMES).to(model.device)
+        timings = find_alignment(model, tokenizer, tokens, mel_segment, segment_frames)
+        
+        # Alignment units follow token boundaries; fold them back into lyric words
+        unit_starts = np.cumsum([0] + [len(t.tokens) for t in timings[:-1]])
+        word_starts = np.cumsum([0] + [len(t) for t in word_tokens[idx:end]])
+        kept = []
+        for k in range(end - idx):
+            units = [t for t, pos in zip(timings, unit_starts) if word_starts[k] <= pos < word_starts[k + 1]]
+            if not units:
+                break
+            word = {
+                'word': ' ' + lyric_words[idx + k],
+                'start': float(units[0].start) + offset,
+                'end': float(units[-1].end) + offset,
+                'probability': float(np.mean([t.probability for t in units])),
+            }
+            if not last_window and word['end'] > window_end - ALIGN_MARGIN_SECONDS:
+                break
+            kept.append(word)
+        
+        if not kept:
+            seek += N_FRAMES // 2  # Lyrics start later than this window
+            continue
+        aligned.extend(kept)
+        idx += len(kept)
+        seek = max(int(kept[-1]['end'] * frames_per_second), seek + 1)
+    return aligned
+
+
+# ============================================================================
+# VOICE ACTIVITY DETECTION
+# ============================================================================
+
+class SegmentMap:
+    """Maps times in a compacted (voiced-only) buffer back to the original timeline"""
+
+    def __init__(self, segments: List[Tuple[float, float, float]]):
+        # (compact start, original start, length) in seconds, sorted by compact start
+        self.segments = segments
+        self._compact_starts = [seg[0] for seg in segments]
+
+    def to_original(self, t: float) -> float:
+        """Convert a compacted-buffer time to the original audio time"""
+        if not self.segments:
+            return t
+        i = max(bisect.bisect_right(self._compact_starts, t) - 1, 0)
+        compact_start, original_start, length = self.segments[i]
+        return original_start + min(max(t - compact_start, 0.0), length)
+
+    def remap_words(self, words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return words with start/end moved back to the original timeline"""
+        remapped = []
+        for word in words:
+            start = self.to_original(word['start'])
+            end = max(self.to_original(word['end']), start)
+            remapped.append(dict(word, start=start, end=end))
+        return remapped
+
+
+class VoiceActivityDetector:
+    """Fast energy + spectral-flux detector selecting regions worth sending to Whisper"""
+
+    FRAME_SECONDS = 0.03
+    VOICE_BAND = (300.0, 3400.0)  # Hz
+
+    def __init__(self, padding: float = 0.5, threshold_db: float = 12.0,
+                 min_gap: float = 1.0, min_region: float = 0.3):
+        self.padding = padding
+        self.threshold_db = threshold_db
+        self.min_gap = min_gap
+        self.min_region = min_region
+
+    @property
+    def settings(self) -> Dict[str, float]:
+        """Parameters that affect the output (part of the transcript cache key)"""
+        return {
+            'padding': self.padding,
+            'threshold_db': self.threshold_db,
+            'min_gap': self.min_gap,
+            'min_region': self.min_region,
+        }
+
+    def _active_frames(self, samples: np.ndarray) -> np.ndarray:
+        """Flag frames whose voice-band energy or spectral flux stands out from the floor"""
+        frame_len = int(self.FRAME_SECONDS * WHISPER_SAMPLE_RATE)
+        n_frames = len(samples) // frame_len
+        if n_frames == 0:
+            return np.zeros(0, dtype=bool)
+        
+        frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+        spectrum = np.abs(np.fft.rfft(frames * np.hanning(frame_len), axis=1))
+        freqs = np.fft.rfftfreq(frame_len, 1.0 / WHISPER_SAMPLE_RATE)
+        band = (freqs >= self.VOICE_BAND[0]) & (freqs <= self.VOICE_BAND[1])
+        
+        band_db = 10.0 * np.log10(np.sum(spectrum[:, band] ** 2, axis=1) + 1e-10)
+        floor_db = np.percentile(band_db, 10)
+        
+        # Positive spectral flux catches soft vocal onsets the energy gate misses
+        norm = spectrum[:, band] / (np.linalg.norm(spectrum[:, band], axis=1, keepdims=True) + 1e-10)
+        flux = np.concatenate(([0.0], np.sum(np.maximum(np.diff(norm, axis=0), 0.0), axis=1)))
+        flux_gate = np.percentile(flux, 75)
+        
+        loud = band_db > floor_db + self.threshold_db
+        onset = (flux > flux_gate) & (band_db > floor_db + self.threshold_db / 2)
+        return loud | onset
+
+    def detect(self, samples: np.ndarray) -> List[Tuple[int, int]]:
+        """Return padded, merged (start, end) sample ranges containing likely voice"""
+        active = self._active_frames(samples)
+        frame_len = int(self.FRAME_SECONDS * WHISPER_SAMPLE_RATE)
+        
+        # Rising/falling edges of the activity mask
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], active.astype(np.int8), [0]))))
+        raw = [(int(edges[i]) * frame_len, int(edges[i + 1]) * frame_len)
+               for i in range(0, len(edges), 2)]
+        
+        regions: List[Tuple[int, int]] = []
+        min_gap = int(self.min_gap * WHISPER_SAMPLE_RATE)
+        for start, end in raw:
+            if regions and start - regions[-1][1] < min_gap:
+                regions[-1] = (regions[-1][0], end)
+            else:
+                regions.append((start, end))
+        
+        pad = int(self.padding * WHISPER_SAMPLE_RATE)
+        min_len = int(self.min_region * WHISPER_SAMPLE_RATE)
+        padded: List[Tuple[int, int]] = []
+        for start, end in regions:
+            if end - start < min_len:
+                continue
+            start, end = max(start - pad, 0), min(end + pad, len(samples))
+            if padded and start <= padded[-1][1]:
+                padded[-1] = (padded[-1][0], end)
+            else:
+                padded.append((start, end))
+        return padded
+
+    def compact(self, samples: np.ndarray) -> Tuple[np.ndarray, SegmentMap]:
+        """Concatenate the voiced regions and return them with their time map"""
+        regions = self.detect(samples)
+        segments = []
+        offset = 0
+        for start, end in regions:
+            segments.append((
+                offset / WHISPER_SAMPLE_RATE,
+                start / WHISPER_SAMPLE_RATE,
+                (end - start) / WHISPER_SAMPLE_RATE,
+            ))
+            offset += end - start
+        if not regions:
+            return samples[:0], SegmentMap(segments)
+        voiced = np.concatenate([samples[start:end] for start, end in regions])
+        return voiced, SegmentMap(segments)
+
+
+def transcribe_voiced(backend: TranscriptionBackend, samples: np.ndarray, options: Dict[str, Any],
+                      vad: Optional[VoiceActivityDetector] = None) -> List[Dict[str, Any]]:
+    """Transcribe only voiced regions and map word timestamps back to the original timeline"""
+    if vad is None:
+        return backend.transcribe(samples, options)
+    voiced, segment_map = vad.compact(samples)
+    if len(voiced) == 0:
+        return []
+    return segment_map.remap_words(backend.transcribe(voiced, options))
+
+
+# ============================================================================
+# STREAMING TRANSCRIPTION
+# ============================================================================
+
+STREAM_MIN_WINDOW_SECONDS = 2.0  # Smallest stream_window honoured
+
+
+class WordStream:
+    """Thread-safe word list filled incrementally by a background transcriber"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._words: List[Dict[str, Any]] = []
+        self.transcribed_until = 0.0  # Audio time covered so far (seconds)
+        self.duration: Optional[float] = None
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.version = 0
+
+    @classmethod
+    def completed(cls, words: List[Dict[str, Any]]) -> 'WordStream':
+        """Wrap an already complete word list"""
+        stream = cls()
+        stream.extend(words, float('inf'))
+        stream.finish()
+        return stream
+
+    def extend(self, words: List[Dict[str, Any]], transcribed_until: float):
+        """Append newly transcribed words covering audio up to transcribed_until"""
+        with self._cond:
+            self._words.extend(words)
+            self.transcribed_until = transcribed_until
+            self.version += 1
+            self._cond.notify_all()
+
+    def finish(self, error: Optional[BaseException] = None):
+        """Mark the stream complete (optionally with the error that ended it)"""
+        with self._cond:
+            self.done = True
+            self.error = error
+            self.transcribed_until = float('inf')
+            self.version += 1
+            self._cond.notify_all()
+
+    def snapshot(self) -> Tuple[List[Dict[str, Any]], int]:
+        """Return a copy of the current words and the stream version"""
+        with self._cond:
+            return list(self._words), self.version
+
+    def wait_until(self, seconds: float, timeout: Optional[float] = None) -> bool:
+        """Block until audio up to `seconds` is transcribed or the stream ends"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self.done or self.transcribed_until >= seconds, timeout
+            )
+
+
+class StreamingTranscriber(threading.Thread):
+    """Background thread transcribing audio window by window into a WordStream.
+    
+    Windows of window/2..window seconds end at the quietest point, overlap
+    around each cut, and keep each word from the side its midpoint falls on,
+    like the chunked path; text is final up to each cut.
+    """
+
+    def __init__(self, model, audio, options: Dict[str, Any], window: float,
+                 stream: WordStream, on_complete=None,
+                 vad: Optional[VoiceActivityDetector] = None):
+        super().__init__(name="streaming-transcriber", daemon=True)
+        self.model = model
+        self.audio = audio
+        self.options = options
+        self.window = window
+        self.vad = vad
+        self.stream = stream
+        self.on_complete = on_complete
+
+    def run(self):
+        try:
+            self.stream.duration = len(self.audio) / WHISPER_SAMPLE_RATE
+            window = max(self.window, STREAM_MIN_WINDOW_SECONDS)
+            chunks = split_at_silences(self.audio, window / 2, window)
+            all_words: List[Dict[str, Any]] = []
+            
+            previous_cut = 0.0
+            for i, (start, end, cut) in enumerate(chunks):
+                options = dict(self.options)
+                if all_words:
+                    # Carry context across windows for consistent spelling/casing
+                    options['initial_prompt'] = ''.join(w['word'] for w in all_words[-30:])
+                
+                last = i == len(chunks) - 1
+                cut_seconds = cut / WHISPER_SAMPLE_RATE
+                words = words_between_cuts(
+                    start, transcribe_voiced(self.model, self.audio[start:end], options, self.vad),
+                    previous_cut, float('inf') if last else cut_seconds
+                )
+                all_words.extend(words)
+                self.stream.extend(words, cut_seconds)
+                previous_cut = cut_seconds
+            
+            self.stream.finish()
+            if self.on_complete is not None and all_words:
+                self.on_complete(all_words)
+        except Exception as e:
+            self.stream.finish(e)
+
+
+# ============================================================================
+# TRANSCRIPTION POOL
+# ============================================================================
+
+# Per-process state of a pool worker
+_worker_model = None
+_worker_load_seconds = 0.0
+
+
+def _pool_worker_init(backend: str, model_name: str, threads: int, compute_type: str,
+                      quantize: bool, cache_dir: Path):
+    """Load the model once per worker process with a bounded inference thread count"""
+    global _worker_model, _worker_load_seconds
+    started = time.time()
+    _worker_model = create_backend(
+        backend, model_name, threads, compute_type, quantize, cache_dir
+    ).load()
+    _worker_load_seconds = time.time() - started
+
+
+def _pool_transcribe(samples: np.ndarray, options: Dict[str, Any],
+                     vad: Optional[VoiceActivityDetector] = None) -> Tuple[int, List[Dict[str, Any]], float, float]:
+    """Transcribe in a worker; returns (pid, words, busy seconds, model load seconds)"""
+    started = time.time()
+    words = normalize_words(transcribe_voiced(_worker_model, samples, options, vad))
+    return os.getpid(), words, time.time() - started, _worker_load_seconds
+
+
+class TranscriptionPool:
+    """Worker processes with a resident model each, for transcribing queued songs in parallel"""
+
+    def __init__(self, model_name: str, workers: int, torch_threads: int = 0,
+                 backend: str = DEFAULT_BACKEND, compute_type: str = "int8",
+                 quantize: bool = False, cache_dir: Optional[Path] = None):
+        self.model_name = model_name
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.torch_threads = torch_threads or max(1, (os.cpu_count() or 1) // self.workers)
+        if backend == 'whisper' and quantize:
+            # Quantize once here; workers converting in parallel would each pay for it
+            ensure_quantized_whisper(model_name, Path(cache_dir or DEFAULT_CACHE_DIR) / 'models')
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_pool_worker_init,
+            initargs=(backend, model_name, self.torch_threads, compute_type, quantize, cache_dir),
+        )
+        self._started = time.time()
+        self._lock = threading.Lock()
+        self._stats: Dict[int, Dict[str, float]] = {}
+
+    def submit(self, samples: np.ndarray, options: Dict[str, Any],
+               vad: Optional[VoiceActivityDetector] = None, timed: bool = False) -> Future:
+        """Queue one job; the future resolves to its word list (or (words, busy seconds) if timed)"""
+        result: Future = Future()
+
+        def _collect(job: Future):
+            try:
+                pid, words, busy, load = job.result()
+            except BaseException as e:
+                result.set_exception(e)
+                return
+            with self._lock:
+                stats = self._stats.setdefault(pid, {'jobs': 0, 'busy': 0.0, 'load': load})
+                stats['jobs'] += 1
+                stats['busy'] += busy
+            result.set_result((words, busy) if timed else words)
+
+        self._executor.submit(_pool_transcribe, samples, options, vad).add_done_callback(_collect)
+        return result
+
+    def utilization(self) -> Dict[int, Dict[str, float]]:
+        """Per-worker jobs, busy seconds, model load seconds and busy share of wall time"""
+        wall = max(time.time() - self._started, 1e-9)
+        with self._lock:
+            return {
+                pid: dict(stats, utilization=stats['busy'] / wall)
+                for pid, stats in self._stats.items()
+            }
+
+    def print_report(self):
+        """Print per-worker utilization to help size the pool"""
+        UI.print_info(
+            f"Transcription pool ({self.backend}): "
+            f"{self.workers} workers × {self.torch_threads} threads"
+        )
+        report = self.utilization()
+        for pid, stats in sorted(report.items()):
+            print(f"  worker {pid}: {int(stats['jobs'])} jobs, "
+                  f"busy {stats['busy']:.1f}s, load {stats['load']:.1f}s, "
+                  f"{stats['utilization']:.0%} utilized")
+        idle = self.workers - len(report)
+        if idle > 0:
+            print(f"  {idle} worker(s) never received a job")
+
+    def shutdown(self, wait: bool = False):
+        """Stop the worker processes (wait=True also reaps them)"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# ============================================================================
+# CHUNKED TRANSCRIPTION
+# ============================================================================
+
+CHUNK_FRAME_SECONDS = 0.05  # Energy resolution when searching for cut points
+CHUNK_QUIET_SECONDS = 0.5  # Cuts go in the quietest stretch of this length
+CHUNK_OVERLAP_SECONDS = 1.0  # Audio shared by neighbouring chunks around each cut
+
+
+def split_at_silences(samples: np.ndarray, min_seconds: float = 30.0, max_seconds: float = 60.0,
+                      overlap: float = CHUNK_OVERLAP_SECONDS) -> List[Tuple[int, int, int]]:
+    """Cut audio into min..max second chunks at its quietest points.
+    
+    Returns (start, end, cut) sample indices per chunk; neighbours overlap by
+    `overlap` seconds centered on the shared cut.
+    """
+    rate = WHISPER_SAMPLE_RATE
+    if not 0 < min_seconds < max_seconds:
+        raise ValueError(f"chunk bounds must satisfy 0 < min < max, got {min_seconds}/{max_seconds}")
+    if len(samples) <= max_seconds * rate:
+        return [(0, len(samples), len(samples))]
+    frame = int(CHUNK_FRAME_SECONDS * rate)
+    n_frames = len(samples) // frame
+    energy = np.square(samples[:n_frames * frame].reshape(n_frames, frame)).mean(axis=1)
+    window = max(1, int(CHUNK_QUIET_SECONDS / CHUNK_FRAME_SECONDS))
+    quiet = np.convolve(energy, np.ones(window) / window, mode='same')
+    
+    half = int(overlap * rate / 2)
+    chunks: List[Tuple[int, int, int]] = []
+    start = 0
+    while len(samples) - start > max_seconds * rate:
+        lo = (start + int(min_seconds * rate)) // frame
+        hi = (start + int(max_seconds * rate)) // frame
+        cut = (lo + int(np.argmin(quiet[lo:hi]))) * frame + frame // 2
+        chunks.append((max(start - half, 0), min(cut + half, len(samples)), cut))
+        start = cut
+    chunks.append((max(start - half, 0), len(samples), len(samples)))
+    return chunks
+
+
+def words_between_cuts(start: int, words: List[Dict[str, Any]], lo: float, hi: float) -> List[Dict[str, Any]]:
+    """Shift words of a chunk starting at sample `start` onto the song timeline,
+    keeping those whose midpoint lies in [lo, hi) seconds"""
+    offset = start / WHISPER_SAMPLE_RATE
+    kept = []
+    for word in words:
+        shifted = dict(word, start=word['start'] + offset, end=word['end'] + offset)
+        if lo <= (shifted['start'] + shifted['end']) / 2 < hi:
+            kept.append(shifted)
+    return kept
+
+
+def stitch_chunk_words(chunks: List[Tuple[int, int, int]],
+                       chunk_words: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Shift chunk-relative timestamps onto the song timeline and drop overlap duplicates.
+    
+    Around each cut both chunks hear the same audio; a word is kept from the
+    chunk on whose side of the cut its midpoint falls.
+    """
+    bounds = [0.0] + [cut / WHISPER_SAMPLE_RATE for _, _, cut in chunks[:-1]] + [float('inf')]
+    stitched: List[Dict[str, Any]] = []
+    for i, ((start, _, _), words) in enumerate(zip(chunks, chunk_words)):
+        stitched.extend(words_between_cuts(start, words, bounds[i], bounds[i + 1]))
+    return stitched
+
+
+def transcribe_chunked(pool: TranscriptionPool, samples: np.ndarray, options: Dict[str, Any],
+                       vad: Optional[VoiceActivityDetector] = None, min_seconds: float = 30.0,
+                       max_seconds: float = 60.0) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Transcribe silence-split chunks of one song in parallel; returns (words, report)"""
+    chunks = split_at_silences(samples, min_seconds, max_seconds)
+    started = time.perf_counter()
+    futures = [pool.submit(samples[start:end], options, vad, timed=True) for start, end, _ in chunks]
+    results = [future.result() for future in futures]
+    wall = time.perf_counter() - started
+    
+    # Workers load their models concurrently on first use; that time is not transcription
+    busy = sum(seconds for _, seconds in results)
+    load = max((stats['load'] for stats in pool.utilization().values()), default=0.0)
+    workers = min(pool.workers, len(chunks))
+    transcribe_wall = max(wall - load, 1e-9)
+    report = {
+        'chunks': len(chunks),
+        'workers': workers,
+        'wall_seconds': wall,
+        'load_seconds': load,
+        'busy_seconds': busy,
+        'speedup': busy / transcribe_wall,
+        'efficiency': min(busy / (transcribe_wall * workers), 1.0),
+    }
+    return stitch_chunk_words(chunks, [words for words, _ in results]), report
+
+
+# ============================================================================
+# MODEL BENCHMARK
+# ============================================================================
+
+BENCHMARK_CLIP_SECONDS = 30.0
+BENCHMARK_POLL_SECONDS = 1.0  # How often to check that a benchmark worker is still alive
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def synthetic_reference_clip(seconds: float = BENCHMARK_CLIP_SECONDS) -> np.ndarray:
+    """Deterministic speech-like signal: gliding harmonic voice, syllable envelope, pauses"""
+    rate = WHISPER_SAMPLE_RATE
+    t = np.arange(int(seconds * rate)) / rate
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.3 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / rate
+    voice = sum(np.sin(k * phase) / k for k in range(1, 11))
+    syllables = np.sin(2 * np.pi * 4 * t) ** 2
+    phrases = (t % 3.0) < 2.4  # Short breath every 3 seconds
+    noise = np.random.default_rng(0).normal(0, 0.01, len(t))
+    return (0.3 * voice * syllables * phrases + noise).astype(np.float32)
+
+
+def model_profile_key(backend: str, compute_type: str) -> str:
+    """Key for per-host benchmark results of one engine"""
+    engine = backend if backend == 'whisper' else f"{backend}/{compute_type}"
+    return f"{socket.gethostname()}|{engine}"
+
+
+class ModelProfiles(ProfileStore):
+    """Per-host model benchmark results used for budget-based model selection"""
+
+    FILE_NAME = "model_profiles.json"
+
+
+def _benchmark_worker(backend: str, model_name: str, compute_type: str,
+                      clip: np.ndarray, results: Any):
+    """Load and run one model in a fresh process so its peak memory is measured in isolation"""
+    try:
+        baseline = peak_rss_mb()
+        started = time.perf_counter()
+        engine = create_backend(backend, model_name, compute_type=compute_type).load()
+        load_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        engine.transcribe(clip, {'language': 'en', 'word_timestamps': True})
+        results.put({
+            'load_seconds': round(load_seconds, 2),
+            'transcribe_seconds': round(time.perf_counter() - started, 2),
+            'baseline_rss_mb': baseline,
+            'peak_rss_mb': peak_rss_mb(),
+        })
+    except Exception as e:
+        results.put({'error': str(e)})
+
+
+def benchmark_models(config: Config, models: Optional[List[str]] = None,
+                     clip_path: Optional[str] = None) -> Dict[str, Any]:
+    """Measure real-time factor and peak memory of each model and save the host profile"""
+    UI.print_section("📊 MODEL BENCHMARK")
+    if clip_path:
+        clip = decode_audio(Path(clip_path))[:int(60 * WHISPER_SAMPLE_RATE)]
+        UI.print_info(f"Reference clip: {clip_path}")
+    else:
+        # Whisper's speed on a tone says little about sung vocals, so this only checks the setup
+        clip = synthetic_reference_clip()
+        UI.print_warning(
+            "Reference clip: built-in synthetic signal (smoke test only, not saved; "
+            "pass --benchmark-clip with a real vocal recording to build the host profile)"
+        )
+    clip_seconds = len(clip) / WHISPER_SAMPLE_RATE
+    models = models or [m for m in WHISPER_MODELS if m not in MODEL_ALIASES]
+    UI.print_info(f"Engine: {config.backend}, {clip_seconds:.0f}s clip, {os.cpu_count()} CPUs")
+    
+    ctx = multiprocessing.get_context('spawn')
+    results: Dict[str, Dict[str, Any]] = {}
+    print(f"\n  {'model':<16}{'load':>8}{'RTF':>8}{'s/min':>8}{'peak MB':>10}")
+    for model_name in models:
+        queue_ = ctx.Queue()
+        proc = ctx.Process(
+            target=_benchmark_worker,
+            args=(config.backend, model_name, config.compute_type, clip, queue_)
+        )
+        proc.start()
+        result = None
+        try:
+            while result is None:
+                try:
+                    result = queue_.get(timeout=BENCHMARK_POLL_SECONDS)
+                except queue.Empty:
+                    if proc.exitcode is None:
+                        continue
+                    # Died without reporting, e.g. OOM-killed while loading; drain a late result
+                    try:
+                        result = queue_.get(timeout=BENCHMARK_POLL_SECONDS)
+                    except queue.Empty:
+                        result = {'error': f"worker exited with code {proc.exitcode}"}
+        finally:
+            proc.join()
+        if 'error' in result:
+            results[model_name] = {'error': result['error']}
+            print(f"  {model_name:<16}{UI.RED}failed: {result['error']}{UI.RESET}")
+            continue
+        rtf = result['transcribe_seconds'] / clip_seconds
+        result.update(rtf=round(rtf, 4), seconds_per_minute=round(rtf * 60, 2))
+        results[model_name] = result
+        peak = f"{result['peak_rss_mb']:.0f}" if result['peak_rss_mb'] is not None else "n/a"
+        print(f"  {model_name:<16}{result['load_seconds']:>7.1f}s{rtf:>8.2f}"
+              f"{result['seconds_per_minute']:>7.1f}s{peak:>10}")
+    
+    profile = {
+        'backend': config.backend,
+        'compute_type': config.compute_type,
+        'cpu_count': os.cpu_count(),
+        'clip': Path(clip_path).name if clip_path else None,
+        'clip_seconds': clip_seconds,
+        'results': results,
+        'created': time.time(),
+    }
+    if not clip_path:
+        print()
+        return profile
+    profiles = ModelProfiles(Path(config.cache_dir))
+    profiles.put(model_profile_key(config.backend, config.compute_type), profile)
+    print()
+    UI.print_success(f"Host profile saved to {profiles.path}")
+    return profile
+
+
+def pick_model(results: Dict[str, Dict[str, Any]], budget: float, language: str) -> Optional[str]:
+    """Largest benchmarked model within budget (s per audio minute); the fastest if none fits"""
+    usable = {
+        name: r for name, r in results.items()
+        if 'seconds_per_minute' in r and (language == 'en' or not name.endswith('.en'))
+    }
+    if not usable:
+        return None
+    fitting = [name for name, r in usable.items() if r['seconds_per_minute'] <= budget]
+    if not fitting:
+        return min(usable, key=lambda name: usable[name]['seconds_per_minute'])
+    return max(fitting, key=lambda name: (
+        MODEL_SIZE_RANK.get(name, -1),
+        name.endswith('.en') == (language == 'en'),
+        -usable[name]['seconds_per_minute'],
+    ))
+
+
+def select_model_for_budget(config: Config) -> Optional[str]:
+    """Pick a model from this host's benchmark profile for config.model_budget"""
+    profile = ModelProfiles(Path(config.cache_dir)).get(
+        model_profile_key(config.backend, config.compute_type)
+    )
+    if not profile or not profile.get('clip'):  # Older profiles measured the synthetic tone
+        logger.warning(
+            f"⚠️  No model benchmark on a real clip for this host; run "
+            f"--benchmark-models --benchmark-clip SONG. Using {config.whisper_model}"
+        )
+        return None
+    model = pick_model(profile.get('results', {}), config.model_budget, config.language)
+    if model is not None:
+        speed = profile['results'][model]['seconds_per_minute']
+        if speed > config.model_budget:
+            logger.warning(
+                f"⚠️  No model meets {config.model_budget:g}s per minute; "
+                f"using the fastest, {model} ({speed:.1f}s)"
+            )
+        else:
+            logger.info(f"Model budget {config.model_budget:g}s/min → {model} ({speed:.1f}s/min)")
+    return model
+
+
+# ============================================================================
+# STARTUP BENCHMARK
+# ============================================================================
+
+HEAVY_MODULES = ('torch', 'whisper', 'faster_whisper', 'ctranslate2', 'pygame', 'yt_dlp')
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parse `python -X importtime` output into (module, depth, self µs, cumulative µs)"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def import_time_report(runs: int = 5, top: int = 8) -> Dict[str, Any]:
+    """Import the player module in fresh interpreters under -X importtime.
+    
+    Also times `--help` end to end, the shortest real startup path. Heavy
+    modules that appear at import time are listed; there should be none.
+    """
+    module = Path(__file__).stem
+    script_dir = str(Path(__file__).resolve().parent)
+    import_ms, help_ms = [], []
+    entries: List[Tuple[str, int, int, int]] = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+            cwd=script_dir, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"import failed: {proc.stderr.strip().splitlines()[-1:]}")
+        entries = parse_importtime(proc.stderr)
+        import_ms.append(next(cum for name, _, _, cum in entries if name == module) / 1000)
+        
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--help'],
+            cwd=script_dir, capture_output=True
+        )
+        help_ms.append((time.perf_counter() - started) * 1000)
+    
+    # Direct children of the player module, i.e. what its own import statements cost
+    children = [(name, cum / 1000) for name, depth, _, cum in entries if depth == 1]
+    return {
+        'python': sys.version.split()[0],
+        'runs': runs,
+        'import_ms': statistics.median(import_ms),
+        'help_ms': statistics.median(help_ms),
+        'top': sorted(children, key=lambda item: -item[1])[:top],
+        'heavy': sorted({name.split('.')[0] for name, *_ in entries} & set(HEAVY_MODULES)),
+    }
+
+
+def run_import_benchmark(runs: int, budget_ms: float) -> bool:
+    """Print the startup report; False if a heavy module loads eagerly or the budget is exceeded"""
+    UI.print_section("⏱️  STARTUP BENCHMARK")
+    report = import_time_report(runs)
+    UI.print_info(f"Python {report['python']}, median of {report['runs']} fresh interpreters")
+    print(f"\n  {'module import':<24}{report['import_ms']:>8.0f} ms")
+    print(f"  {'--help end to end':<24}{report['help_ms']:>8.0f} ms")
+    print("\n  slowest imports")
+    for name, ms in report['top']:
+        print(f"  {name:<24}{ms:>8.1f} ms")
+    print()
+    
+    ok = True
+    if report['heavy']:
+        UI.print_error(f"Imported at startup: {', '.join(report['heavy'])} (should load lazily)")
+        ok = False
+    if budget_ms and report['import_ms'] > budget_ms:
+        UI.print_error(f"Module import {report['import_ms']:.0f} ms exceeds the {budget_ms:.0f} ms budget")
+        ok = False
+    if ok:
+        UI.print_success("No heavy modules imported at startup")
+    return ok
+
+
+# ============================================================================
+# RUN INSTRUMENTATION
+# ============================================================================
+
+RUN_REPORT_VERSION = 1
+
+
+def children_usage() -> Tuple[float, Optional[float]]:
+    """CPU seconds and peak RSS in MB of finished child processes (ffmpeg, workers)"""
+    try:
+        import resource
+    except ImportError:
+        return 0.0, None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    peak = usage.ru_maxrss / (1024 * 1024) if sys.platform == 'darwin' else usage.ru_maxrss / 1024
+    return usage.ru_utime + usage.ru_stime, peak
+
+
+def reset_rss_high_water() -> bool:
+    """Reset this process's RSS high-water mark to its current RSS (Linux only).
+    
+    Also resets ru_maxrss, so callers must keep their own lifetime maximum.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _max_mb(*values: Optional[float]) -> Optional[float]:
+    """Largest of several optional RSS readings"""
+    present = [v for v in values if v is not None]
+    return max(present) if present else None
+
+
+class RunProfiler:
+    """Wall time, CPU time and peak RSS per pipeline stage of one player run.
+    
+    Stages may nest (model load inside transcription); each stage is charged
+    only for time outside its sub-stages, so the stages add up to the run.
+    CPU time is process-wide and includes background threads such as the
+    model preload; child CPU counts ffmpeg and worker processes once reaped.
+    Repeated stages (timing regeneration while streaming) accumulate.
+    
+    On Linux the RSS high-water mark is reset at each stage entry, so
+    peak_rss_mb is the peak reached during the stage (sub-stages included);
+    elsewhere it is None. rss_high_water_mb is the process-lifetime peak
+    when the stage ended. Profilers of songs prepared concurrently (queue
+    mode) pass stage_peaks=False: the reset is process-wide, so one song's
+    stages would clear another's marks.
+    """
+    
+    def __init__(self, stage_peaks: bool = True):
+        self.stage_peaks = stage_peaks
+        self.started = time.time()
+        self._origin = (time.perf_counter(), time.process_time())
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.notes: Dict[str, Any] = {}  # Run facts such as cache hits
+        self._nested: List[List[float]] = []  # Wall/CPU/child CPU spent in open sub-stages
+        self._stage_peaks: List[Optional[float]] = []  # RSS peaks seen so far in open stages
+        self._lifetime_peak = peak_rss_mb()
+    
+    @contextmanager
+    def stage(self, name: str):
+        record = self.stages.setdefault(name, {
+            'stage': name, 'calls': 0,
+            'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'child_cpu_seconds': 0.0,
+        })
+        self._fold_rss_peak()
+        resettable = self.stage_peaks and reset_rss_high_water()
+        self._stage_peaks.append(None)
+        start = (time.perf_counter(), time.process_time(), children_usage()[0])
+        self._nested.append([0.0, 0.0, 0.0])
+        try:
+            yield
+        finally:
+            end = (time.perf_counter(), time.process_time(), children_usage()[0])
+            spent = [b - a for a, b in zip(start, end)]
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] = [a + b for a, b in zip(self._nested[-1], spent)]
+            record['calls'] += 1
+            record['wall_seconds'] += spent[0] - nested[0]
+            record['cpu_seconds'] += spent[1] - nested[1]
+            record['child_cpu_seconds'] += spent[2] - nested[2]
+            self._fold_rss_peak()
+            stage_peak = self._stage_peaks.pop()
+            if self._stage_peaks:
+                self._stage_peaks[-1] = _max_mb(self._stage_peaks[-1], stage_peak)
+            record['peak_rss_mb'] = _max_mb(record.get('peak_rss_mb'), stage_peak) if resettable else None
+            record['rss_high_water_mb'] = self._lifetime_peak
+    
+    def merge(self, other: 'RunProfiler'):
+        """Add another profiler's stages and notes, e.g. from work done before this run started"""
+        for name, theirs in other.stages.items():
+            record = self.stages.setdefault(name, dict(theirs, calls=0, wall_seconds=0.0,
+                                                       cpu_seconds=0.0, child_cpu_seconds=0.0))
+            for key in ('calls', 'wall_seconds', 'cpu_seconds', 'child_cpu_seconds'):
+                record[key] += theirs[key]
+            for key in ('peak_rss_mb', 'rss_high_water_mb'):
+                record[key] = _max_mb(record.get(key), theirs.get(key))
+        self.stages = {**{name: self.stages[name] for name in other.stages}, **self.stages}  # Earlier work first
+        self.notes = {**other.notes, **self.notes}
+        self._lifetime_peak = _max_mb(self._lifetime_peak, other._lifetime_peak)
+    
+    def _fold_rss_peak(self):
+        """Charge the high-water mark since the last reset to the innermost open stage"""
+        mark = peak_rss_mb()
+        self._lifetime_peak = _max_mb(self._lifetime_peak, mark)
+        if self._stage_peaks:
+            self._stage_peaks[-1] = _max_mb(self._stage_peaks[-1], mark)
+    
+    def report(self, **context) -> Dict[str, Any]:
+        """Structured run report; context adds run facts like the song and model"""
+        stages = [
+            {key: round(value, 3) if isinstance(value, float) else value for key, value in record.items()}
+            for record in self.stages.values()
+        ]
+        peak = _max_mb(self._lifetime_peak, peak_rss_mb())
+        child_peak = children_usage()[1]
+        return {
+            'version': RUN_REPORT_VERSION,
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(self.started)),
+            'host': socket.gethostname(),
+            'cpu_count': os.cpu_count(),
+            **context,
+            **self.notes,
+            'wall_seconds': round(time.perf_counter() - self._origin[0], 3),
+            'cpu_seconds': round(time.process_time() - self._origin[1], 3),
+            'peak_rss_mb': round(peak, 3) if peak is not None else None,
+            'child_peak_rss_mb': round(child_peak, 3) if child_peak is not None else None,
+            'stages': stages,
+        }
+
+
+def print_run_report(report: Dict[str, Any]):
+    """Print the per-stage table of a run report"""
+    print(f"\n  {'stage':<16}{'wall':>9}{'cpu':>9}{'child cpu':>11}{'peak MB':>10}")
+    for stage in report['stages']:
+        peak = f"{stage['peak_rss_mb']:.0f}" if stage.get('peak_rss_mb') is not None else "-"
+        print(f"  {stage['stage']:<16}{stage['wall_seconds']:>8.2f}s{stage['cpu_seconds']:>8.2f}s"
+              f"{stage['child_cpu_seconds']:>10.2f}s{peak:>10}")
+    print(f"  {'total':<16}{report['wall_seconds']:>8.2f}s{report['cpu_seconds']:>8.2f}s\n")
+
+
+def write_run_report(report: Dict[str, Any], path: Optional[str] = None, log_path: Optional[str] = None):
+    """Write the report as JSON and/or append it as one line to a JSONL log"""
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if log_path:
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report) + '\n')
+
+
+def save_run_report(report: Dict[str, Any], path: Optional[str] = None, log_path: Optional[str] = None):
+    """write_run_report with user-facing success and failure messages"""
+    try:
+        write_run_report(report, path, log_path)
+    except OSError as e:
+        UI.print_warning(f"Could not write run report: {e}")
+        return
+    for target in (path, log_path):
+        if target:
+            UI.print_success(f"Run report written to {target}")
+
+
+# ============================================================================
+# TRANSCRIPT CACHE
+# ============================================================================
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """Persistent word-timestamp store keyed by audio content, model and decoding options"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(audio_hash: str, model: str, options: Dict[str, Any]) -> str:
+        """Build a cache key from the audio hash, model name and decoding options"""
+        payload = json.dumps(
+            {'audio': audio_hash, 'model': model, 'options': options},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached word list for a key, or None on a miss"""
+        try:
+            with open(self.root / f"{key}.json", 'r', encoding='utf-8') as f:
+                return json.load(f)['words']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def link(self, alias: str, key: str):
+        """Make another key (e.g. one built from the video ID) refer to a stored transcript"""
+        path = self.root / f"{alias}.link"
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(key, encoding='utf-8')
+        os.replace(tmp_path, path)
+
+    def has(self, key: str) -> bool:
+        """Check for a transcript under a key or a link, without loading it"""
+        try:
+            key = (self.root / f"{key}.link").read_text(encoding='utf-8').strip()
+        except OSError:
+            pass
+        return (self.root / f"{key}.json").is_file()
+
+    def put(self, key: str, words: List[Dict[str, Any]], meta: Optional[Dict[str, Any]] = None):
+        """Store a word list, keeping only the fields the timing generators use"""
+        record = dict(meta or {})
+        record['created'] = time.time()
+        record['words'] = normalize_words(words)
+        path = self.root / f"{key}.json"
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+
+
+# ============================================================================
+# TRANSCRIPTION DAEMON
+# ============================================================================
+
+class TranscriptionDaemon:
+    """Local HTTP server that keeps Whisper models resident across jobs"""
+
+    def __init__(self, host: str = DEFAULT_DAEMON_HOST, port: int = DEFAULT_DAEMON_PORT,
+                 cache_dir: Optional[Path] = None):
+        self.host = host
+        self.port = port
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)  # Holds quantized model files
+        self._models: Dict[str, Any] = {}
+        self._model_locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        self.jobs_served = 0
+
+    @staticmethod
+    def _model_key(model_name: str, backend: str, compute_type: str, quantize: bool = False) -> str:
+        if backend == 'whisper':
+            return f"{model_name}:int8-dynamic" if quantize else model_name
+        return f"{backend}/{compute_type}:{model_name}"
+
+    def _model_lock(self, key: str) -> threading.Lock:
+        """Return the lock serializing access to one model"""
+        with self._registry_lock:
+            return self._model_locks.setdefault(key, threading.Lock())
+
+    def get_model(self, model_name: str, backend: str = DEFAULT_BACKEND,
+                  compute_type: str = "int8", quantize: bool = False) -> TranscriptionBackend:
+        """Return a resident model, loading it on first request (caller holds its lock)"""
+        key = self._model_key(model_name, backend, compute_type, quantize)
+        if key not in self._models:
+            if model_name not in WHISPER_MODELS:
+                raise ValueError(f"Unknown model: {model_name}")
+            logger.info(f"Loading model '{key}'...")
+            started = time.time()
+            self._models[key] = create_backend(
+                backend, model_name, compute_type=compute_type,
+                quantize=quantize, cache_dir=self.cache_dir
+            ).load()
+            logger.info(f"Model '{key}' loaded in {time.time() - started:.1f}s")
+        return self._models[key]
+
+    def preload(self, model_names: Iterable[str], backend: str = DEFAULT_BACKEND,
+                compute_type: str = "int8", quantize: bool = False):
+        """Load models ahead of the first job"""
+        for name in model_names:
+            with self._model_lock(self._model_key(name, backend, compute_type, quantize)):
+                self.get_model(name, backend, compute_type, quantize)
+
+    def transcribe(self, audio_path: str, model_name: str, options: Dict[str, Any],
+                   vad: Optional[Dict[str, float]] = None, backend: str = DEFAULT_BACKEND,
+                   compute_type: str = "int8", quantize: bool = False) -> List[Dict[str, Any]]:
+        """Transcribe one file with a resident model (vad: VoiceActivityDetector settings)"""
+        if not Path(audio_path).is_file():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        with self._model_lock(self._model_key(model_name, backend, compute_type, quantize)):
+            model = self.get_model(model_name, backend, compute_type, quantize)
+            detector = VoiceActivityDetector(**vad) if vad else None
+            words = transcribe_voiced(model, decode_audio(Path(audio_path)), options, detector)
+        self.jobs_served += 1
+        return normalize_words(words)
+
+    def health(self) -> Dict[str, Any]:
+        """Report loaded models and served job count"""
+        return {'status': 'ok', 'models': sorted(self._models), 'jobs_served': self.jobs_served}
+
+    def serve_forever(self):
+        """Run the HTTP server until interrupted"""
+        server = ThreadingHTTPServer((self.host, self.port), _DaemonRequestHandler)
+        server.daemon = self
+        logger.info(f"🎧 Transcription daemon listening on http://{self.host}:{self.port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Daemon stopped")
+        finally:
+            server.server_close()
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """JSON request handler for TranscriptionDaemon"""
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, self.server.daemon.health())
+        else:
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/transcribe':
+            self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            job = json.loads(self.rfile.read(length) or b'{}')
+            words = self.server.daemon.transcribe(
+                job['audio_path'], job['model'], job.get('options', {}), job.get('vad'),
+                job.get('backend', DEFAULT_BACKEND), job.get('compute_type', 'int8'),
+                bool(job.get('quantize', False))
+            )
+        except (KeyError, ValueError, FileNotFoundError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': f"Transcription failed: {e}"})
+            return
+        self._send_json(200, {'words': words})
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class DaemonClient:
+    """Thin client submitting transcription jobs to a TranscriptionDaemon"""
+
+    def __init__(self, url: str, timeout: float = 3600.0):
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+
+    def transcribe(self, audio_path: Path, model_name: str, options: Dict[str, Any],
+                   vad: Optional[Dict[str, float]] = None, backend: str = DEFAULT_BACKEND,
+                   compute_type: str = "int8", quantize: bool = False) -> List[Dict[str, Any]]:
+        """Submit a job and return the word list"""
+        payload = json.dumps({
+            'audio_path': str(Path(audio_path).resolve()),
+            'model': model_name,
+            'options': options,
+            'vad': vad,
+            'backend': backend,
+            'compute_type': compute_type,
+            'quantize': quantize,
+        }).encode('utf-8')
+        request = urllib.request.Request(
+            f"{self.url}/transcribe",
+            data=payload,
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())['words']
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get('error', str(e))
+            except ValueError:
+                message = str(e)
+            raise RuntimeError(f"Daemon error: {message}") from e
 
 
 # ============================================================================
 # KARAOKE PLAYER
 # ============================================================================
 
+# Extensions yt-dlp and the transcoder leave next to audio_file_base, including partials
+DOWNLOAD_EXTENSIONS = frozenset({
+    'm4a', 'webm', 'mp3', 'mp4', 'opus', 'ogg', 'oga', 'aac', 'flac', 'mka', 'wav',
+    'part', 'ytdl', 'temp', 'tmp',
+})
+
+
 class KaraokePlayer:
     """Main karaoke player with AI transcription"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, model=None, lyrics_provider: Optional[LyricsProvider] = None,
+                 preload: Optional[ModelPreload] = None, video_info: Optional[Dict[str, Any]] = None):
         self.config = config
-        self.audio_path = Path(config.audio_filename)
-        self._model = None
+        self.audio_path = Path(config.audio_file_base)  # Set to the real file by download_audio
+        self.playback_path = Path(f"{config.audio_file_base}.wav")
+        self._samples: Optional[np.ndarray] = None  # 16 kHz mono for Whisper
+        self._model = model  # May be shared between players (queue mode)
+        self._audio_cache: Optional[AudioCache] = None
+        if config.use_audio_cache:
+            self._audio_cache = AudioCache(
+                Path(config.cache_dir) / 'audio',
+                config.audio_cache_max_mb * 1024 * 1024
+            )
+        self._transcript_cache: Optional[TranscriptCache] = None
+        self._transcript_key: Optional[str] = None
+        self._audio_hash: Optional[str] = None
+        if config.use_transcript_cache:
+            self._transcript_cache = TranscriptCache(Path(config.cache_dir) / 'transcripts')
+        self._device_offset = 0.0  # Output latency correction from the calibration profile
+        self._mixer_buffer: Optional[int] = None
+        self._lyrics_provider = lyrics_provider
+        self._lyrics: Optional[str] = None
+        self._lyrics_fetched = False
+        self._preload = preload if preload is not None and preload.matches(config) else None
+        self._preload_on_resolve = False  # Set by run(); queue mode shares one model instead
+        self.video_info = video_info  # Resolved search result, if already known
+        self.profile = RunProfiler()
+    
+    @property
+    def _offset(self) -> float:
+        """Lyric lead in seconds: configured offset plus the device latency correction"""
+        return self.config.timing_offset + self._device_offset
+    
+    def _latency_profiles(self) -> 'LatencyProfiles':
+        return LatencyProfiles(Path(self.config.cache_dir))
     
     # ------------------------------------------------------------------------
     # Context Managers
@@ -187,62 +3010,133 @@ class KaraokePlayer:
     @contextmanager
     def _pygame_context(self):
         """Context manager for pygame initialization/cleanup"""
-        pygame.init()
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-        try:
+        if self._mixer_buffer is None:
+            self._mixer_buffer = resolve_mixer_buffer(self.config)
+        with mixer_session(self._mixer_buffer):
+            if self.config.use_latency_profile:
+                self._device_offset = self._latency_profiles().offset(audio_device_id(self._mixer_buffer))
             yield
-        finally:
-            pygame.mixer.quit()
-            pygame.quit()
     
     # ------------------------------------------------------------------------
     # Audio Management
     # ------------------------------------------------------------------------
     
     def cleanup_audio_file(self):
-        """Remove temporary audio file"""
-        if self.config.cleanup_on_exit and self.audio_path.exists():
+        """Remove temporary audio files (cached audio is kept)"""
+        if not self.config.cleanup_on_exit:
+            return
+        for path in (self.audio_path, self.playback_path):
+            if not path.is_file() or self._is_cached(path):
+                continue
             try:
-                self.audio_path.unlink()
-                UI.print_info(f"Cleaned up {self.audio_path}")
+                path.unlink()
+                UI.print_info(f"Cleaned up {path}")
             except Exception as e:
                 UI.print_warning(f"Could not delete audio file: {e}")
     
-    def download_audio(self) -> bool:
-        """Download audio from YouTube"""
-        UI.print_section("📥 STEP 1: DOWNLOADING AUDIO")
-        UI.print_info(f"Searching for: '{self.config.song_query}'")
-        
-        # Clean up existing file
-        if self.audio_path.exists():
-            self.audio_path.unlink()
-        
-        ydl_opts = {
+    def _remove_stale_downloads(self):
+        """Delete leftovers from earlier runs so yt-dlp never reuses another song's file"""
+        base = Path(self.config.audio_file_base)
+        for path in base.parent.glob(f"{base.name}.*"):
+            # Only touch download artifacts: lyrics or reports may share the base name
+            parts = path.name[len(base.name) + 1:].lower().split('.')
+            if not all(part in DOWNLOAD_EXTENSIONS for part in parts):
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                UI.print_warning(f"Could not delete {path}: {e}")
+    
+    def _is_cached(self, path: Path) -> bool:
+        """Check whether a path lives inside the audio cache"""
+        if self._audio_cache is None:
+            return False
+        return path.resolve().parent == self._audio_cache.root.resolve()
+    
+    @staticmethod
+    def _print_video_info(info: Dict[str, Any]):
+        """Print title and duration of a resolved video"""
+        title = info.get('title', 'Unknown')
+        duration = int(info.get('duration') or 0)
+        UI.print_success(f"Found: {title}")
+        UI.print_info(f"Duration: {duration//60}:{duration%60:02d}")
+    
+    def _ydl_options(self) -> Dict[str, Any]:
+        # Keep the source stream as-is; decode_audio handles conversion in one pass
+        return {
             'format': 'bestaudio[ext=m4a]/bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': self.config.audio_quality,
-            }],
-            'outtmpl': self.config.audio_file_base,
+            'outtmpl': f"{self.config.audio_file_base}.%(ext)s",
             'default_search': 'ytsearch1',
             'quiet': True,
             'noprogress': True,
             'no_warnings': True,
         }
+    
+    def resolve_video(self) -> Optional[Dict[str, Any]]:
+        """Resolve the query to a single video's metadata without downloading (once per player)"""
+        if self.video_info is not None:
+            return self.video_info
+        from yt_dlp import YoutubeDL
+        try:
+            with self.profile.stage('resolve'), YoutubeDL(self._ydl_options()) as ydl:
+                info = ydl.extract_info(self.config.song_query, download=False)
+            if info and info.get('entries') is not None:
+                entries = [e for e in info['entries'] if e]
+                info = entries[0] if entries else None
+            if not info:
+                raise RuntimeError("No matching video found")
+        except Exception as e:
+            UI.print_error(f"Search failed: {e}")
+            return None
+        self.video_info = info
+        return info
+    
+    def prepare_model(self):
+        """Resolve the song, then start loading the model unless its transcript is cached"""
+        info = self.resolve_video()
+        video_id = info.get('id') if info else None
+        if self._model is None and self._preload is None and not self._transcript_cached(video_id):
+            self._preload = preload_model(self.config)
+    
+    def download_audio(self) -> bool:
+        """Download audio from YouTube, reusing the audio cache when possible"""
+        from yt_dlp import YoutubeDL
+        UI.print_section("📥 STEP 1: DOWNLOADING AUDIO")
+        UI.print_info(f"Searching for: '{self.config.song_query}'")
+        
+        # Clean up existing files
+        self._remove_stale_downloads()
+        
+        info = self.resolve_video()
+        if info is None:
+            return False
+        video_id = info.get('id')
+        self._print_video_info(info)
+        if self._preload_on_resolve:
+            self.prepare_model()  # Overlaps the model load with the download
         
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.config.song_query, download=True)
-                if info:
-                    title = info.get('title', 'Unknown')
-                    duration = info.get('duration', 0)
-                    UI.print_success(f"Found: {title}")
-                    UI.print_info(f"Duration: {duration//60}:{duration%60:02d}")
+            with YoutubeDL(self._ydl_options()) as ydl:
+                if self._audio_cache is not None and video_id:
+                    cached = self._audio_cache.get(video_id)
+                    if cached is not None:
+                        self.audio_path = cached
+                        self.profile.notes['audio_cache_hit'] = True
+                        UI.print_success(f"Cache hit: reusing audio for {video_id}")
+                        return True
+                
+                self.profile.notes['audio_cache_hit'] = False
+                with self.profile.stage('download'):
+                    info = ydl.process_ie_result(info, download=True)
+                downloads = info.get('requested_downloads') or [{}]
+                self.audio_path = Path(downloads[0].get('filepath') or '')
             
-            if not self.audio_path.exists():
+            if not self.audio_path.is_file():
                 raise RuntimeError("Audio file was not created")
             
+            if self._audio_cache is not None and video_id:
+                self.audio_path = self._audio_cache.put(video_id, self.audio_path, info)
+            
             UI.print_success("Download complete!")
             return True
             
@@ -250,44 +3144,266 @@ class KaraokePlayer:
             UI.print_error(f"Download failed: {e}")
             return False
     
+    def decode_audio(self) -> bool:
+        """Decode the source once into Whisper samples and a playback WAV"""
+        UI.print_info("Decoding audio (single pass for transcription and playback)...")
+        try:
+            with self.profile.stage('transcode'):
+                self._samples = decode_audio(self.audio_path, self.playback_path)
+        except FileNotFoundError:
+            UI.print_error("FATAL: ffmpeg not found. Install it and add to PATH.")
+            return False
+        except RuntimeError as e:
+            UI.print_error(str(e))
+            return False
+        
+        self.profile.notes['audio_seconds'] = round(len(self._samples) / WHISPER_SAMPLE_RATE, 2)
+        UI.print_success(f"Decoded {len(self._samples) / WHISPER_SAMPLE_RATE:.1f}s of audio")
+        return True
+    
+    def _whisper_audio(self) -> np.ndarray:
+        """Return 16 kHz samples, decoding on demand if decode_audio was skipped"""
+        if self._samples is None:
+            self._samples = decode_audio(self.audio_path)
+        return self._samples
+    
     # ------------------------------------------------------------------------
     # Transcription
     # ------------------------------------------------------------------------
     
+    def _transcribe_options(self) -> Dict[str, Any]:
+        """Decoding options passed to Whisper (also part of the transcript cache key)"""
+        return {
+            'language': self.config.language,
+            'word_timestamps': True,
+        }
+    
+    def _vad(self) -> Optional[VoiceActivityDetector]:
+        """Voice activity detector for the configured settings, or None if disabled"""
+        if not self.config.vad:
+            return None
+        return VoiceActivityDetector(
+            padding=self.config.vad_padding,
+            threshold_db=self.config.vad_threshold_db
+        )
+    
+    def _backend_label(self) -> str:
+        """Engine description for reports, available before the model is loaded"""
+        if self._model is not None:
+            return self._model.label
+        return self._create_backend().label
+    
+    def _create_backend(self) -> TranscriptionBackend:
+        """Unloaded backend for the configured engine and model"""
+        return create_backend(
+            self.config.backend, self.config.whisper_model,
+            compute_type=self.config.compute_type,
+            quantize=self.config.quantize, cache_dir=Path(self.config.cache_dir)
+        )
+    
+    def _model_key(self) -> str:
+        """Model identity for the transcript cache (plain name for the reference backend)"""
+        if self.config.backend == 'whisper':
+            if self.config.quantize:
+                return f"{self.config.whisper_model}:int8-dynamic"
+            return self.config.whisper_model
+        return f"{self.config.backend}/{self.config.compute_type}:{self.config.whisper_model}"
+    
+    def _load_model(self) -> TranscriptionBackend:
+        """Load the transcription backend on first use"""
+        if self._model is None and self._preload is not None:
+            if not self._preload.done:
+                UI.print_info("Waiting for the background model load...")
+            with self.profile.stage('model_load'):
+                self._model = self._preload.wait()
+            self.profile.notes['model_preload_seconds'] = round(self._preload.load_seconds, 3)
+            UI.print_success(
+                f"Model loaded in {self._preload.load_seconds:.1f}s in the background "
+                f"(waited {self._preload.waited_seconds:.1f}s)"
+            )
+        elif self._model is None:
+            UI.print_info("Loading AI model (first run may take a moment)...")
+            with self.profile.stage('model_load'):
+                self._model = self._create_backend().load()
+            UI.print_success("Model loaded successfully")
+        else:
+            return self._model
+        stats = getattr(self._model, 'quantization_stats', None)
+        if stats:
+            UI.print_info(f"Model {describe_quantization(stats)}")
+        return self._model
+    
+    def _known_lyrics(self) -> Optional[str]:
+        """Lyrics to force-align against, fetched once; None when alignment is off or unavailable"""
+        if not self.config.align_lyrics:
+            return None
+        if not self._lyrics_fetched:
+            self._lyrics_fetched = True
+            provider = self._lyrics_provider
+            token = self.config.genius_token or os.environ.get('GENIUS_TOKEN')
+            if provider is None and self.config.lyrics_file:
+                provider = FileLyricsProvider(self.config.lyrics_file)
+            elif provider is None and token:
+                provider = GeniusLyricsProvider(token)
+            if provider is None:
+                UI.print_warning("No lyrics source (--lyrics-file or GENIUS_TOKEN), transcribing instead")
+                return None
+            try:
+                self._lyrics = provider.fetch(self.config.song_query)
+            except Exception as e:
+                UI.print_warning(f"Lyrics lookup failed: {e!r}")
+            if self._lyrics is None:
+                UI.print_warning("Lyrics not found, transcribing instead")
+        return self._lyrics
+    
+    def _align_lyrics(self, lyrics: str, options: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Force-align known lyrics with the local model; None if the backend cannot align"""
+        model = self._load_model()
+        samples = self._whisper_audio()
+        voiced, segment_map = samples, None
+        vad = self._vad()
+        if vad is not None:
+            # Windows full of singing keep lyrics from being stretched over instrumentals
+            voiced, segment_map = vad.compact(samples)
+        lyric_count = len(lyrics.split())
+        UI.print_info(f"Aligning {lyric_count} known lyric words to the audio...")
+        started = time.perf_counter()
+        try:
+            words = model.align(voiced, lyrics, options) if len(voiced) else []
+        except NotImplementedError as e:
+            UI.print_warning(f"{e}, transcribing instead")
+            return None
+        if segment_map is not None:
+            words = segment_map.remap_words(words)
+        elapsed = time.perf_counter() - started
+        UI.print_info(
+            f"Alignment stage: {len(words)} of {lyric_count} lyric words in {elapsed:.1f}s "
+            f"with {model.label} ({elapsed / max(len(samples) / WHISPER_SAMPLE_RATE, 1e-9):.2f}× real time)"
+        )
+        return words or None
+    
+    def _transcribe_via_daemon(self, options: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Send the job to the transcription daemon; None means fall back to a local model"""
+        UI.print_info(f"Sending job to transcription daemon at {self.config.daemon_url}...")
+        try:
+            vad = self._vad()
+            return DaemonClient(self.config.daemon_url).transcribe(
+                self.audio_path, self.config.whisper_model, options,
+                vad.settings if vad else None,
+                self.config.backend, self.config.compute_type, self.config.quantize
+            )
+        except (urllib.error.URLError, ConnectionError) as e:
+            UI.print_warning(f"Daemon unavailable ({e}), transcribing locally")
+            return None
+    
+    def _transcript_cache_key(self, audio_hash: str, options: Dict[str, Any]) -> str:
+        vad = self._vad()
+        return TranscriptCache.make_key(
+            audio_hash, self._model_key(),
+            dict(options, vad=vad.settings if vad else None)
+        )
+    
+    def _video_transcript_key(self, video_id: str, options: Dict[str, Any]) -> str:
+        """Transcript key by video ID, usable before the audio is downloaded and hashed"""
+        return self._transcript_cache_key(f"video:{video_id}", options)
+    
+    def _transcript_cached(self, video_id: Optional[str]) -> bool:
+        """Whether this video was transcribed before with the current model and options"""
+        if not video_id or self._transcript_cache is None:
+            return False
+        if self.config.align_lyrics:
+            return False  # The key also depends on lyrics that are only looked up later
+        return self._transcript_cache.has(self._video_transcript_key(video_id, self._transcribe_options()))
+    
+    def _lookup_transcript(self, options: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Return cached words for the current audio, remembering the cache key"""
+        self._transcript_key = None
+        if self._transcript_cache is None:
+            return None
+        self._audio_hash = file_sha256(self.audio_path)
+        self._transcript_key = self._transcript_cache_key(self._audio_hash, options)
+        words = self._transcript_cache.get(self._transcript_key)
+        self.profile.notes['transcript_cache_hit'] = bool(words)
+        if words:
+            UI.print_success(f"Transcript cache hit: {len(words)} words")
+        return words
+    
+    def _store_transcript(self, options: Dict[str, Any], words: List[Dict[str, Any]]):
+        """Save a finished transcript under the key from _lookup_transcript"""
+        if self._transcript_key is None:
+            return
+        try:
+            self._transcript_cache.put(self._transcript_key, words, {
+                'model': self.config.whisper_model,
+                'backend': self.config.backend,
+                'options': options,
+                'audio_sha256': self._audio_hash,
+            })
+            video_id = (self.video_info or {}).get('id')
+            if video_id:
+                self._transcript_cache.link(self._video_transcript_key(video_id, options), self._transcript_key)
+        except OSError as e:
+            UI.print_warning(f"Could not cache transcript: {e}")
+    
     def transcribe_audio(self) -> Optional[List[Dict[str, Any]]]:
-        """Transcribe audio using Whisper AI"""
+        """Transcribe audio using Whisper AI, reusing cached transcripts when possible"""
         UI.print_section("🤖 STEP 2: AI TRANSCRIPTION")
-        UI.print_info(f"Model: Whisper '{self.config.whisper_model}'")
+        UI.print_info(f"Model: Whisper '{self.config.whisper_model}' via {self._backend_label()}")
         
         if not self.audio_path.exists():
             UI.print_error(f"Audio file not found: {self.audio_path}")
             return None
         
+        options = self._transcribe_options()
         try:
-            # Load model
-            if self._model is None:
-                UI.print_info("Loading AI model (first run may take a moment)...")
-                self._model = whisper.load_model(self.config.whisper_model)
-                UI.print_success("Model loaded successfully")
+            lyrics = self._known_lyrics()
+            cache_options = options
+            if lyrics:
+                # Aligned transcripts depend on the lyric text, not just the decoding options
+                cache_options = dict(options, lyrics=hashlib.sha256(lyrics.encode('utf-8')).hexdigest())
+            words = self._lookup_transcript(cache_options)
+            if words:
+                return words
             
-            # Transcribe
-            UI.print_info("Transcribing audio with word-level timestamps...")
-            result = self._model.transcribe(
-                str(self.audio_path),
-                verbose=False,
-                word_timestamps=True,
-                language="en"
-            )
+            words = None
+            if lyrics:
+                words = self._align_lyrics(lyrics, options)
             
-            # Extract words
-            words = []
-            for segment in result.get('segments', []):
-                words.extend(segment.get('words', []))
+            if words is None and self.config.daemon_url:
+                words = self._transcribe_via_daemon(options)
+            
+            if words is None and self.config.chunk_workers > 1:
+                words = self._transcribe_chunked(options)
+            elif words is None:
+                model = self._load_model()
+                samples = self._whisper_audio()
+                vad = self._vad()
+                segment_map = None
+                if vad is not None:
+                    total = len(samples) / WHISPER_SAMPLE_RATE
+                    samples, segment_map = vad.compact(samples)
+                    voiced = len(samples) / WHISPER_SAMPLE_RATE
+                    UI.print_info(
+                        f"Voice activity: sending {voiced:.0f}s of {total:.0f}s "
+                        f"({1 - voiced / max(total, 1e-9):.0%} skipped)"
+                    )
+                UI.print_info("Transcribing audio with word-level timestamps...")
+                started = time.perf_counter()
+                words = model.transcribe(samples, options) if len(samples) else []
+                if segment_map is not None:
+                    words = segment_map.remap_words(words)
+                elapsed = time.perf_counter() - started
+                audio_seconds = len(self._whisper_audio()) / WHISPER_SAMPLE_RATE
+                UI.print_info(
+                    f"Transcription stage: {elapsed:.1f}s with {model.label} "
+                    f"({elapsed / max(audio_seconds, 1e-9):.2f}× real time)"
+                )
             
             if not words:
                 UI.print_error("No words found in transcription")
                 return None
             
+            self._store_transcript(cache_options, words)
             UI.print_success(f"Transcription complete: {len(words)} words detected")
             return words
             
@@ -301,211 +3417,340 @@ class KaraokePlayer:
             UI.print_error(f"Transcription error: {e}")
             return None
     
-    # ------------------------------------------------------------------------
-    # Timing Generation
-    # ------------------------------------------------------------------------
+    def _transcribe_chunked(self, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Transcribe silence-split chunks of this song on a temporary worker pool"""
+        samples = self._whisper_audio()
+        pool = TranscriptionPool(
+            self.config.whisper_model, self.config.chunk_workers, self.config.torch_threads,
+            self.config.backend, self.config.compute_type, self.config.quantize,
+            Path(self.config.cache_dir)
+        )
+        UI.print_info(
+            f"Transcribing in parallel chunks on {pool.workers} workers "
+            f"× {pool.torch_threads} threads..."
+        )
+        try:
+            words, report = transcribe_chunked(
+                pool, samples, options, self._vad(),
+                self.config.chunk_min_seconds, self.config.chunk_max_seconds
+            )
+        finally:
+            pool.shutdown(wait=True)  # Reaped workers count towards the stage's child CPU
+        UI.print_info(
+            f"Transcription stage: {report['chunks']} chunks in {report['wall_seconds']:.1f}s "
+            f"(worker model load {report['load_seconds']:.1f}s), {report['speedup']:.1f}× speedup, "
+            f"{report['efficiency']:.0%} parallel efficiency on {report['workers']} workers"
+        )
+        return words
     
-    def _generate_character_timings(self, words: List[Dict[str, Any]]) -> List[Tuple[str, float, bool]]:
-        """Generate character-level timings from word timestamps with smart line breaks"""
-        char_timings = []
-        last_word_end = 0.0
-        current_line_length = 0
+    def submit_transcription(self, pool: TranscriptionPool) -> Future:
+        """Queue transcription on a worker pool; the future resolves to the word list"""
+        options = self._transcribe_options()
+        words = self._lookup_transcript(options)
+        if words:
+            cached: Future = Future()
+            cached.set_result(words)
+            return cached
         
-        for word_idx, word_info in enumerate(words):
-            word_start = word_info.get('start', 0)
-            word_end = word_info.get('end', word_start + 0.3)
-            word_text = word_info.get('word', '').strip()
-            
-            # Calculate gap from last word
-            gap = word_start - last_word_end if word_idx > 0 else 0
-            
-            # Smart line break detection
-            should_break = False
-            if word_idx > 0:
-                # Break on significant pauses
-                if gap > self.config.new_line_threshold:
-                    should_break = True
-                # Break on shorter pauses if line is getting long
-                elif gap > 0.3 and current_line_length > self.config.max_line_length * 0.7:
-                    should_break = True
-                # Force break if line is too long
-                elif current_line_length > self.config.max_line_length:
-                    should_break = True
-            
-            if should_break:
-                char_timings.append(('\n', word_start - 0.05, True))
-                current_line_length = 0
-            
-            # Calculate character timing
-            if len(word_text) > 0:
-                word_duration = word_end - word_start
-                char_duration = word_duration / len(word_text)
-                
-                for char_idx, char in enumerate(word_text):
-                    char_time = word_start + (char_idx * char_duration)
-                    char_timings.append((char, char_time, False))
-                    current_line_length += 1
-                
-                # Add space after word
-                if word_idx < len(words) - 1:
-                    char_timings.append((' ', word_end, False))
-                    current_line_length += 1
-            
-            last_word_end = word_end
+        def _store(job: Future):
+            if job.exception() is None and job.result():
+                self._store_transcript(options, job.result())
         
-        return char_timings
+        future = pool.submit(self._whisper_audio(), options, self._vad())
+        future.add_done_callback(_store)
+        return future
     
-    def _generate_word_timings(self, words: List[Dict[str, Any]]) -> List[Tuple[str, float, bool]]:
-        """Generate word-level timings with smart line breaks"""
-        word_timings = []
-        last_word_end = 0.0
-        current_line_length = 0
+    def transcribe_audio_streaming(self) -> Optional[WordStream]:
+        """Start window-by-window transcription and return the stream being filled"""
+        if self.config.daemon_url or self._known_lyrics():
+            # The daemon and the aligner return whole transcripts only
+            words = self.transcribe_audio()
+            return WordStream.completed(words) if words else None
         
-        for word_idx, word_info in enumerate(words):
-            word_start = word_info.get('start', 0)
-            word_end = word_info.get('end', word_start + 0.3)
-            word_text = word_info.get('word', '').strip()
-            
-            # Calculate gap from last word
-            gap = word_start - last_word_end if word_idx > 0 else 0
-            
-            # Smart line break detection
-            should_break = False
-            if word_idx > 0:
-                # Break on significant pauses
-                if gap > self.config.new_line_threshold:
-                    should_break = True
-                # Break on shorter pauses if line is getting long
-                elif gap > 0.3 and current_line_length > self.config.max_line_length * 0.7:
-                    should_break = True
-                # Force break if line is too long
-                elif current_line_length + len(word_text) > self.config.max_line_length:
-                    should_break = True
-            
-            if should_break:
-                word_timings.append(('\n', word_start - 0.05, True))
-                current_line_length = 0
-            
-            if word_text:
-                word_timings.append((word_text + ' ', word_start, False))
-                current_line_length += len(word_text) + 1
-            
-            last_word_end = word_end
-        
-        return word_timings
-    
-    def _generate_line_timings(self, words: List[Dict[str, Any]]) -> List[Tuple[str, float, bool]]:
-        """Generate line-level timings with smart line breaks"""
-        line_timings = []
-        current_line = []
-        line_start = 0.0
-        last_word_end = 0.0
-        current_line_length = 0
-        
-        for word_idx, word_info in enumerate(words):
-            word_start = word_info.get('start', 0)
-            word_end = word_info.get('end', word_start + 0.3)
-            word_text = word_info.get('word', '').strip()
-            
-            # Calculate gap from last word
-            gap = word_start - last_word_end if word_idx > 0 else 0
-            
-            # Smart line break detection
-            should_break = False
-            if word_idx > 0:
-                # Break on significant pauses
-                if gap > self.config.new_line_threshold:
-                    should_break = True
-                # Break on shorter pauses if line is getting long
-                elif gap > 0.3 and current_line_length > self.config.max_line_length * 0.7:
-                    should_break = True
-                # Force break if line is too long
-                elif current_line_length + len(word_text) > self.config.max_line_length:
-                    should_break = True
-            
-            if should_break and current_line:
-                line_text = ' '.join(current_line)
-                line_timings.append((line_text, line_start, False))
-                line_timings.append(('\n', word_start - 0.05, True))
-                current_line = []
-                current_line_length = 0
-            
-            if not current_line:
-                line_start = word_start
-            
-            if word_text:
-                current_line.append(word_text)
-                current_line_length += len(word_text) + 1
-            
-            last_word_end = word_end
+        UI.print_section("🤖 STEP 2: AI TRANSCRIPTION (STREAMING)")
+        UI.print_info(f"Model: Whisper '{self.config.whisper_model}' via {self._backend_label()}")
+        
+        if not self.audio_path.exists():
+            UI.print_error(f"Audio file not found: {self.audio_path}")
+            return None
+        
+        options = self._transcribe_options()
+        words = self._lookup_transcript(options)
+        if words:
+            return WordStream.completed(words)
         
-        # Add final line
-        if current_line:
-            line_text = ' '.join(current_line)
-            line_timings.append((line_text, line_start, False))
+        try:
+            model = self._load_model()
+            audio = self._whisper_audio()
+        except FileNotFoundError as e:
+            UI.print_error(f"File error: {e}")
+            return None
+        except Exception as e:
+            UI.print_error(f"Transcription error: {e}")
+            return None
         
-        return line_timings
+        stream = WordStream()
+        StreamingTranscriber(
+            model, audio, options, self.config.stream_window, stream,
+            on_complete=lambda all_words: self._store_transcript(options, all_words),
+            vad=self._vad()
+        ).start()
+        UI.print_info(f"Transcribing in {self.config.stream_window:.0f}s windows...")
+        return stream
     
     # ------------------------------------------------------------------------
     # Playback
     # ------------------------------------------------------------------------
     
-    def play_karaoke(self, words: List[Dict[str, Any]]):
-        """Play audio with synchronized lyrics"""
+    def _generate_timings(self, words: List[Dict[str, Any]]) -> TimingTrack:
+        """Generate the timing track for the configured display mode"""
+        with self.profile.stage('timing'):
+            return build_timing_track(
+                words,
+                self.config.display_mode,
+                self.config.new_line_threshold,
+                self.config.max_line_length
+            )
+    
+    def _wait_for_lead(self, stream: WordStream):
+        """Block until the configured lead of lyrics is transcribed"""
+        while not stream.wait_until(self.config.stream_lead, timeout=0.5):
+            lead = self.config.stream_lead
+            if stream.duration is not None:
+                lead = min(lead, stream.duration)
+            ready = min(stream.transcribed_until, lead)
+            print(f"\r{UI.YELLOW}⏳ Transcribing... {ready:.0f}s / {lead:.0f}s ready{UI.RESET}",
+                  end='', flush=True)
+        print()
+    
+    def _wait_for_transcription(self, stream: WordStream, position: float,
+                                renderer: TerminalRenderer) -> float:
+        """Pause playback until transcription is ahead of the playhead; return seconds paused"""
+        import pygame
+        indicator = " [transcribing...]"
+        paused_at = time.perf_counter()
+        pygame.mixer.music.pause()
+        renderer.write(indicator, UI.YELLOW)
+        
+        resume_at = position + min(self.config.stream_lead, self.config.stream_window)
+        stream.wait_until(resume_at)
+        
+        backspaces = '\b' * len(indicator)
+        renderer.write(f"{backspaces}{' ' * len(indicator)}{backspaces}")
+        pygame.mixer.music.unpause()
+        return time.perf_counter() - paused_at
+    
+    def _playback_duration(self) -> Optional[float]:
+        """Length of the playback WAV in seconds (None if unreadable)"""
+        try:
+            with wave.open(str(self.playback_path), 'rb') as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (OSError, wave.Error):
+            return None
+    
+    def _seek_target(self, command: str, position: float, timings: TimingTrack,
+                     current_idx: int) -> Optional[float]:
+        """Song position a control command should jump to (None = ignore)"""
+        offset = self._offset
+        if command == 'forward':
+            return position + SEEK_STEP_SECONDS
+        if command == 'back':
+            return position - SEEK_STEP_SECONDS
+        if command == 'restart':
+            return 0.0
+        if len(timings) == 0:
+            return None
+        if command == 'restart_line':
+            line_start = timings.line_start(max(current_idx - 1, 0))
+            if line_start >= len(timings):
+                return None
+            return timings.starts[line_start] - offset - 0.5
+        if command == 'skip_intro':
+            target = timings.starts[0] - offset - INTRO_LEAD_SECONDS
+            return target if target > position else None
+        return None
+    
+    def _seek(self, target: float, position: float, clock: AudioClock, timings: TimingTrack,
+              available: int, renderer: TerminalRenderer) -> Optional[int]:
+        """Restart the mixer at target and resync the track; returns the new token index"""
+        import pygame
+        try:
+            pygame.mixer.music.play(start=target)
+        except pygame.error as e:
+            renderer.write(f" [seek failed: {e}]", UI.YELLOW)
+            return None
+        clock.rebase(target)
+        
+        # Binary search over the sorted deadlines, then redraw the current line
+        current_idx = max(0, min(timings.due_count(target + self._offset), available))
+        arrow = "⏩" if target >= position else "⏪"
+        renderer.jump(f"{arrow} {int(target // 60)}:{target % 60:04.1f}")
+        renderer.render(timings.line_start(current_idx), current_idx)
+        return current_idx
+    
+    def play_karaoke(self, words):
+        """Play audio with synchronized lyrics (accepts a word list or a WordStream)"""
+        import pygame
         UI.print_section("🎤 STEP 3: KARAOKE MODE")
         
+        stream = words if isinstance(words, WordStream) else WordStream.completed(words)
+        if not stream.done:
+            UI.print_info(f"Waiting for {self.config.stream_lead:.0f}s of lyrics...")
+            self._wait_for_lead(stream)
+        
         # Generate timings based on mode
+        words, seen_version = stream.snapshot()
+        timings = self._generate_timings(words)
         if self.config.display_mode == DisplayMode.CHARACTER:
-            timings = self._generate_character_timings(words)
             UI.print_info(f"Mode: Character-by-character ({len(timings)} characters)")
         elif self.config.display_mode == DisplayMode.WORD:
-            timings = self._generate_word_timings(words)
             UI.print_info(f"Mode: Word-by-word ({len(timings)} words)")
         else:
-            timings = self._generate_line_timings(words)
             UI.print_info(f"Mode: Line-by-line ({len(timings)} lines)")
+        if not stream.done:
+            UI.print_info("Streaming: remaining lyrics are transcribed during playback")
         
-        UI.print_info("Starting playback in 2 seconds...")
-        time.sleep(2)
+        if self._mixer_buffer is None:
+            self._mixer_buffer = resolve_mixer_buffer(self.config)
+        UI.print_info(KeyReader.HELP)
+        if self.config.start_delay > 0:
+            UI.print_info(f"Starting playback in {self.config.start_delay:g} seconds...")
+            time.sleep(self.config.start_delay)
         UI.clear()
         
-        with self._pygame_context():
+        duration = self._playback_duration()
+        with self._pygame_context(), KeyReader() as keys:
             try:
-                pygame.mixer.music.load(str(self.audio_path))
+                pygame.mixer.music.load(str(self.playback_path))
                 pygame.mixer.music.play()
             except pygame.error as e:
                 UI.print_error(f"Error loading audio: {e}")
                 return
             
-            start_time = time.time()
+            # Mixer-driven clock, corrected continuously against perf_counter
+            clock = AudioClock(lambda: pygame.mixer.music.get_pos() / 1000.0)
+            clock.start()
             current_idx = 0
+            paused_at: Optional[float] = None
+            stopped = False
+            initial_offset = self.config.timing_offset
             
-            print(f"\n{UI.CYAN}🎵 ", end='', flush=True)
+            renderer = TerminalRenderer()
+            renderer.set_track(timings)
+            renderer.begin()
             
             try:
-                while pygame.mixer.music.get_busy() and current_idx < len(timings):
-                    elapsed = time.time() - start_time + self.config.timing_offset
+                while True:
+                    if stream.version != seen_version:
+                        words, seen_version = stream.snapshot()
+                        timings = self._generate_timings(words)
+                        renderer.set_track(timings)
                     
-                    text, timing, is_newline = timings[current_idx]
+                    # The last token of an unfinished stream may still grow (e.g. a line)
+                    done = stream.done
+                    available = len(timings) if done else max(len(timings) - 1, 0)
                     
-                    if elapsed >= timing:
-                        if is_newline:
-                            print(f"{UI.RESET}\n{UI.CYAN}🎵 ", end='', flush=True)
-                        else:
-                            print(f"{UI.CYAN}{text}{UI.RESET}", end='', flush=True)
-                        current_idx += 1
+                    # While paused the clock stands still at the pause point
+                    now = time.perf_counter()
+                    if paused_at is None:
+                        clock.sample(now)
+                    position = clock.position(now if paused_at is None else paused_at)
                     
-                    time.sleep(0.005)
-                
-                # Wait for song to finish
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
+                    for command in keys.poll():
+                        if command == 'quit':
+                            stopped = True
+                            break
+                        if command == 'pause':
+                            if paused_at is None:
+                                pygame.mixer.music.pause()
+                                paused_at = now
+                                renderer.status(" [paused]")
+                            else:
+                                pygame.mixer.music.unpause()
+                                clock.shift(now - paused_at)
+                                paused_at = None
+                                renderer.clear_status()
+                            continue
+                        if command in ('nudge_earlier', 'nudge_later'):
+                            step = OFFSET_NUDGE_SECONDS if command == 'nudge_earlier' else -OFFSET_NUDGE_SECONDS
+                            self.config.timing_offset = round(self.config.timing_offset + step, 3)
+                            renderer.status(f" [offset {self.config.timing_offset:+.2f}s]")
+                            continue
+                        
+                        target = self._seek_target(command, position, timings, current_idx)
+                        if target is None:
+                            continue
+                        target = max(target, 0.0)
+                        if duration is not None:
+                            target = min(target, max(duration - 0.5, 0.0))
+                        new_idx = self._seek(target, position, clock, timings, available, renderer)
+                        if new_idx is not None:
+                            current_idx = new_idx
+                            position = target
+                            paused_at = None  # Restarting the mixer also resumes it
+                    
+                    if stopped:
+                        break
+                    if paused_at is not None:
+                        sleep_until(now + SCHEDULER_MAX_SLEEP, wake=keys.wake)
+                        continue
+                    
+                    if not done and position >= stream.transcribed_until:
+                        clock.shift(self._wait_for_transcription(stream, position, renderer))
+                        continue
+                    
+                    # Write every token due by now as a single frame
+                    due = min(timings.due_count(position + self._offset), available)
+                    if due > current_idx:
+                        renderer.render(current_idx, due)
+                        current_idx = due
+                    
+                    deadline = now + SCHEDULER_MAX_SLEEP
+                    if current_idx < available:
+                        deadline = min(deadline, clock.to_monotonic(
+                            timings.deadlines[current_idx] - self._offset
+                        ))
+                    if not done:
+                        deadline = min(deadline, clock.to_monotonic(stream.transcribed_until))
+                    
+                    # Only check the mixer when we actually wake up
+                    if not pygame.mixer.music.get_busy():
+                        break
+                    sleep_until(deadline, wake=keys.wake)
                 
             except KeyboardInterrupt:
+                stopped = True
+            
+            renderer.reset()
+            if stopped:
                 print(f"\n\n{UI.YELLOW}⏸️  Stopped by user{UI.RESET}")
                 pygame.mixer.music.stop()
+            if stream.error is not None:
+                UI.print_warning(f"Transcription stopped early: {stream.error}")
             
             print(f"\n\n{UI.GREEN}✨ {'─' * 20} Song Finished {'─' * 20} ✨{UI.RESET}\n")
+            
+            drift = clock.drift_report()
+            if drift is not None:
+                UI.print_info(
+                    f"Sync drift vs. mixer: mean {drift['mean_ms']:+.1f} ms, "
+                    f"σ {drift['std_ms']:.1f} ms, max {drift['max_abs_ms']:.1f} ms "
+                    f"over {drift['samples']} samples "
+                    f"(final correction {drift['final_correction_ms']:+.1f} ms)"
+                )
+            
+            if self._device_offset:
+                UI.print_info(f"Output latency correction for this device: {self._device_offset * 1000:+.0f} ms")
+            if self.config.timing_offset != initial_offset:
+                UI.print_info(
+                    f"Timing offset adjusted to {self.config.timing_offset:+.2f}s "
+                    f"(set timing_offset to keep it)"
+                )
+            if self._preload is not None and self._preload.waited_seconds is not None:
+                UI.print_info(
+                    f"Model preload: {self._preload.load_seconds:.1f}s load, "
+                    f"{self._preload.saved_seconds:.1f}s saved by overlapping setup and download"
+                )
     
     # ------------------------------------------------------------------------
     # Main Flow
@@ -513,27 +3758,238 @@ class KaraokePlayer:
     
     def run(self) -> bool:
         """Execute the complete karaoke flow"""
+        self._preload_on_resolve = True
+        success = False
         try:
             if not self.download_audio():
                 return False
             
-            words = self.transcribe_audio()
+            if not self.decode_audio():
+                return False
+            
+            with self.profile.stage('transcription'):
+                if self.config.streaming:
+                    words = self.transcribe_audio_streaming()
+                else:
+                    words = self.transcribe_audio()
             if not words:
                 return False
             
-            self.play_karaoke(words)
+            with self.profile.stage('playback'):
+                self.play_karaoke(words)
+            success = True
             return True
             
         finally:
             self.cleanup_audio_file()
+            self._write_report(success)
+    
+    def run_report(self, success: bool) -> Dict[str, Any]:
+        """Per-stage report of this player's run"""
+        return self.profile.report(
+            song_query=self.config.song_query,
+            model=self.config.whisper_model,
+            backend=self._backend_label(),
+            display_mode=self.config.display_mode.value,
+            streaming=self.config.streaming,
+            success=success,
+        )
+    
+    def _write_report(self, success: bool):
+        """Print and save the per-stage run report if one was requested"""
+        if not (self.config.report_file or self.config.report_log):
+            return
+        report = self.run_report(success)
+        UI.print_section("📈 RUN REPORT")
+        print_run_report(report)
+        save_run_report(report, self.config.report_file, self.config.report_log)
+
+
+# ============================================================================
+# QUEUE MODE
+# ============================================================================
+
+@dataclass
+class QueueItem:
+    """One song moving through the queue pipeline"""
+    index: int
+    query: str
+    player: Optional[KaraokePlayer] = None
+    words: Optional[List[Dict[str, Any]]] = None
+    future: Optional[Future] = None  # Pending pool transcription
+    errors: List[str] = field(default_factory=list)
+
+
+def expand_playlist(url: str) -> List[str]:
+    """Return the video URLs of a playlist without downloading anything"""
+    from yt_dlp import YoutubeDL
+    ydl_opts = {
+        'extract_flat': 'in_playlist',
+        'quiet': True,
+        'no_warnings': True,
+    }
+    with YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+    entries = info.get('entries') or [info]
+    return [e.get('url') or e.get('webpage_url') or e['id'] for e in entries if e]
+
+
+class KaraokeQueue:
+    """Pipelined song queue: download → transcribe → play, one worker per stage.
+    
+    While song N plays on the main thread, song N+1 is transcribed and
+    song N+2 downloaded in the background, so a slow Whisper pass never
+    stalls a song that is already prepared.
+    """
+    
+    _DONE = None  # Sentinel closing a stage queue
+    
+    def __init__(self, queries: List[str], config: Config, prefetch: int = 1):
+        self.queries = queries
+        self.config = config
+        self._pool: Optional[TranscriptionPool] = None
+        if config.transcribe_workers > 1 and not config.daemon_url:
+            # Keep every worker busy: allow one in-flight song per worker
+            prefetch = max(prefetch, config.transcribe_workers)
+            self._pool = TranscriptionPool(
+                config.whisper_model, config.transcribe_workers, config.torch_threads,
+                config.backend, config.compute_type, config.quantize, Path(config.cache_dir)
+            )
+        self._to_transcribe: "queue.Queue[Optional[QueueItem]]" = queue.Queue(maxsize=prefetch)
+        self._to_play: "queue.Queue[Optional[QueueItem]]" = queue.Queue(maxsize=prefetch)
+        self._model = None
+    
+    def _song_config(self, index: int, query: str) -> Config:
+        """Per-song config with its own temp files so stages never collide"""
+        return replace(
+            self.config,
+            song_query=query,
+            audio_file_base=f"{self.config.audio_file_base}_{index}",
+            streaming=False,
+        )
+    
+    def _download_worker(self):
+        """Stage 1: download and decode each song"""
+        UI.set_quiet(True)
+        try:
+            for index, query in enumerate(self.queries):
+                item = QueueItem(index, query)
+                try:
+                    item.player = KaraokePlayer(self._song_config(index, query))
+                    item.player.profile = RunProfiler(stage_peaks=False)  # Songs overlap in time
+                    if not (item.player.download_audio() and item.player.decode_audio()):
+                        item.errors = UI.drain_errors() or ["Download failed"]
+                except Exception as e:
+                    item.errors = [f"Download failed: {e}"]
+                self._to_transcribe.put(item)
+        finally:
+            self._to_transcribe.put(self._DONE)  # run() waits for it even if this thread dies
+    
+    def _transcribe_worker(self):
+        """Stage 2: transcribe each downloaded song, reusing one loaded model"""
+        UI.set_quiet(True)
+        try:
+            while True:
+                item = self._to_transcribe.get()
+                if item is self._DONE:
+                    break
+                try:
+                    if not item.errors and self._pool is not None:
+                        item.future = item.player.submit_transcription(self._pool)
+                    elif not item.errors:
+                        item.player._model = self._model
+                        with item.player.profile.stage('transcription'):
+                            item.words = item.player.transcribe_audio()
+                        self._model = item.player._model
+                        if not item.words:
+                            item.errors = UI.drain_errors() or ["Transcription failed"]
+                except Exception as e:
+                    item.errors = [f"Transcription failed: {e}"]
+                if item.player is not None:
+                    item.player._samples = None  # The samples are not needed for playback
+                self._to_play.put(item)
+        finally:
+            self._to_play.put(self._DONE)
+    
+    def run(self) -> bool:
+        """Play every song in order while later songs are prepared; True if all played"""
+        UI.print_section(f"📜 QUEUE: {len(self.queries)} SONGS")
+        for i, query in enumerate(self.queries, 1):
+            print(f"  {i}. {query}")
+        
+        for worker in (self._download_worker, self._transcribe_worker):
+            threading.Thread(target=worker, name=worker.__name__, daemon=True).start()
+        
+        started = time.perf_counter()
+        played, failed = 0, []
+        reports: List[Dict[str, Any]] = []
+        while True:
+            item = self._to_play.get()
+            if item is self._DONE:
+                break
+            
+            UI.print_section(f"🎶 SONG {item.index + 1}/{len(self.queries)}: {item.query}")
+            success = False
+            try:
+                if item.future is not None:
+                    try:
+                        if not item.future.done():
+                            UI.print_info("Waiting for transcription...")
+                        with item.player.profile.stage('transcription'):
+                            item.words = item.future.result()
+                    except Exception as e:
+                        item.errors = [f"Transcription failed: {e}"]
+                    if not item.errors and not item.words:
+                        item.errors = ["No words found in transcription"]
+                if item.errors:
+                    for error in item.errors:
+                        UI.print_error(error)
+                    failed.append(item.query)
+                    continue
+                with item.player.profile.stage('playback'):
+                    item.player.play_karaoke(item.words)
+                played += 1
+                success = True
+            finally:
+                if item.player is not None:
+                    item.player.cleanup_audio_file()
+                    self._record_report(item, success, reports)
+        
+        UI.print_section("📊 QUEUE SUMMARY")
+        UI.print_success(f"Played {played}/{len(self.queries)} songs")
+        for query in failed:
+            UI.print_warning(f"Skipped: {query}")
+        if self.config.report_file:
+            save_run_report({
+                'version': RUN_REPORT_VERSION,
+                'queue': self.queries,
+                'played': played,
+                'wall_seconds': round(time.perf_counter() - started, 3),
+                'songs': reports,
+            }, self.config.report_file)
+        if self._pool is not None:
+            self._pool.print_report()
+            self._pool.shutdown()
+        return not failed
+    
+    def _record_report(self, item: QueueItem, success: bool, reports: List[Dict[str, Any]]):
+        """Collect a finished song's run report and append it to the report log"""
+        if not (self.config.report_file or self.config.report_log):
+            return
+        report = item.player.run_report(success)
+        report['queue_index'] = item.index
+        reports.append(report)
+        print_run_report(report)
+        if self.config.report_log:
+            save_run_report(report, log_path=self.config.report_log)
 
 
 # ============================================================================
 # INTERACTIVE SETUP
 # ============================================================================
 
-def interactive_setup() -> Config:
-    """Interactive configuration setup"""
+def interactive_setup(on_model: Optional[Callable[[Config], None]] = None) -> Config:
+    """Interactive configuration setup; on_model gets the song and model as soon as both are chosen"""
     UI.print_header()
     UI.print_section("⚙️  CONFIGURATION")
     
@@ -568,7 +4024,11 @@ def interactive_setup() -> Config:
         )
         if custom_model in WHISPER_MODELS:
             whisper_model = custom_model
-        
+    
+    if on_model is not None:
+        on_model(Config(song_query=song_query, whisper_model=whisper_model))
+    
+    if show_advanced:
         # Line break sensitivity
         print()
         UI.print_info("Line Break Settings:")
@@ -613,19 +4073,315 @@ def interactive_setup() -> Config:
 # MAIN ENTRY POINT
 # ============================================================================
 
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
+    parser = argparse.ArgumentParser(
+        description="AI-powered karaoke lyrics player. Without a QUERY the player asks interactively."
+    )
+    # Options named after Config fields default to None and only override when given
+    parser.add_argument(
+        'song_query', nargs='?', metavar='QUERY',
+        help="Song to play (artist + title); runs without prompts or start delays"
+    )
+    
+    song = parser.add_argument_group("lyrics display")
+    song.add_argument(
+        '-m', '--model', dest='whisper_model', choices=WHISPER_MODELS, default=None, metavar='MODEL',
+        help=f"Whisper model: {', '.join(WHISPER_MODELS)} (default: {DEFAULT_MODEL})"
+    )
+    song.add_argument('--language', default=None, help="Spoken language code (default: en)")
+    song.add_argument(
+        '--mode', dest='display_mode', type=DisplayMode, choices=list(DisplayMode), default=None,
+        metavar='{' + ','.join(mode.value for mode in DisplayMode) + '}',
+        help="Reveal lyrics by character, word or line (default: character)"
+    )
+    song.add_argument(
+        '--line-threshold', dest='new_line_threshold', type=float, default=None, metavar='SECONDS',
+        help="Pause that starts a new line; lower = more line breaks (default: 0.5)"
+    )
+    song.add_argument(
+        '--max-line-length', type=int, default=None, metavar='CHARS',
+        help="Maximum characters per line (default: 50)"
+    )
+    song.add_argument(
+        '--offset', dest='timing_offset', type=float, default=None, metavar='SECONDS',
+        help="Show lyrics this much earlier (negative = later)"
+    )
+    song.add_argument(
+        '--start-delay', type=float, default=None, metavar='SECONDS',
+        help="Countdown before playback (default: 2 interactive, 0 with QUERY)"
+    )
+    song.add_argument(
+        '--streaming', action='store_true', default=None,
+        help="Start playing while the rest of the song is still being transcribed"
+    )
+    song.add_argument('--stream-window', type=float, default=None, metavar='SECONDS',
+                      help="Longest audio per streaming transcription window, cut at a pause (default: 30)")
+    song.add_argument('--stream-lead', type=float, default=None, metavar='SECONDS',
+                      help="Lyrics ready before streaming playback starts (default: 30)")
+    song.add_argument(
+        '--vad', action='store_true', default=None,
+        help="Skip instrumental and silent regions before transcription"
+    )
+    song.add_argument('--vad-padding', type=float, default=None, metavar='SECONDS',
+                      help="Audio kept around each voiced region (default: 0.5)")
+    song.add_argument('--vad-threshold-db', type=float, default=None, metavar='DB',
+                      help="Voice-band energy above the noise floor (default: 12)")
+    
+    output = parser.add_argument_group("output and caching")
+    output.add_argument(
+        '--output', dest='audio_file_base', default=None, metavar='BASE',
+        help="Path of the downloaded and decoded audio, without extension (default: temp_audio)"
+    )
+    output.add_argument(
+        '--keep-audio', dest='cleanup_on_exit', action='store_false', default=None,
+        help="Keep the decoded audio files after playback"
+    )
+    output.add_argument(
+        '--report', dest='report_file', default=None, metavar='PATH',
+        help="Write per-stage wall time, CPU time and peak memory of the run as JSON"
+    )
+    output.add_argument(
+        '--report-log', dest='report_log', default=None, metavar='PATH',
+        help="Append the run report as one line to a JSONL log"
+    )
+    output.add_argument('--cache-dir', default=None, help=f"Cache root (default: {DEFAULT_CACHE_DIR})")
+    output.add_argument('--audio-cache-mb', dest='audio_cache_max_mb', type=int, default=None,
+                        metavar='MB', help="Audio cache size limit (default: 2048)")
+    output.add_argument('--no-audio-cache', dest='use_audio_cache', action='store_false', default=None,
+                        help="Always download, never reuse cached audio")
+    output.add_argument('--no-transcript-cache', dest='use_transcript_cache', action='store_false',
+                        default=None, help="Always transcribe, never reuse cached transcripts")
+    
+    engine = parser.add_argument_group("transcription engine")
+    engine.add_argument(
+        '--backend', choices=BACKENDS, default=None,
+        help="openai-whisper (PyTorch) or faster-whisper (CTranslate2, int8 on CPU) (default: whisper)"
+    )
+    engine.add_argument(
+        '--compute-type', default=None,
+        help="faster-whisper quantization: int8, int8_float16, float16 or float32 (default: int8)"
+    )
+    engine.add_argument(
+        '--quantize', action='store_true', default=None,
+        help="Dynamic int8 quantization of Whisper's Linear layers on CPU (cached after first use)"
+    )
+    engine.add_argument(
+        '--chunk-workers', type=int, default=None, metavar='N',
+        help="Split each song at silences into 30-60 s chunks transcribed by N worker processes"
+    )
+    engine.add_argument('--chunk-min-seconds', type=float, default=None, metavar='SECONDS',
+                        help="Shortest chunk for --chunk-workers (default: 30)")
+    engine.add_argument('--chunk-max-seconds', type=float, default=None, metavar='SECONDS',
+                        help="Longest chunk for --chunk-workers (default: 60)")
+    engine.add_argument(
+        '--benchmark-models', nargs='*', metavar='MODEL',
+        help="Benchmark models (default: all) and save this host's profile"
+    )
+    engine.add_argument(
+        '--benchmark-clip', metavar='PATH',
+        help="Audio file for --benchmark-models (default: built-in synthetic clip)"
+    )
+    engine.add_argument(
+        '--model-budget', type=float, default=None, metavar='SECONDS',
+        help="Use the largest benchmarked model transcribing a minute of audio within SECONDS"
+    )
+    
+    engine.add_argument(
+        '--import-times', nargs='?', type=int, const=5, metavar='RUNS',
+        help="Benchmark startup imports (python -X importtime) over RUNS fresh interpreters"
+    )
+    engine.add_argument(
+        '--import-budget', type=float, default=0.0, metavar='MS',
+        help="With --import-times, fail if importing the player takes longer than MS"
+    )
+    
+    alignment = parser.add_argument_group("lyrics alignment")
+    alignment.add_argument(
+        '--align-lyrics', action='store_true', default=None,
+        help="Align known lyrics to the audio instead of transcribing (falls back to transcription)"
+    )
+    alignment.add_argument(
+        '--lyrics-file', metavar='PATH',
+        help="Lyrics text to align (default: look the song up on Genius)"
+    )
+    alignment.add_argument(
+        '--genius-token', default=None,
+        help="Genius API token for lyrics lookup (default: $GENIUS_TOKEN)"
+    )
+    
+    daemon = parser.add_argument_group("transcription daemon")
+    daemon.add_argument(
+        '--daemon', action='store_true',
+        help="Run a transcription daemon that keeps Whisper models loaded"
+    )
+    daemon.add_argument('--daemon-host', default=DEFAULT_DAEMON_HOST, help="Daemon bind address")
+    daemon.add_argument('--daemon-port', type=int, default=DEFAULT_DAEMON_PORT, help="Daemon port")
+    daemon.add_argument(
+        '--preload', nargs='*', default=[], metavar='MODEL',
+        help="Models the daemon loads at startup"
+    )
+    daemon.add_argument(
+        '--daemon-url', default=None,
+        help="Send transcription jobs to a running daemon (e.g. http://127.0.0.1:8765)"
+    )
+    
+    batch = parser.add_argument_group("queue mode")
+    batch.add_argument(
+        '--queue', nargs='+', metavar='QUERY',
+        help="Play several songs back to back, preparing the next while one plays"
+    )
+    batch.add_argument('--queue-file', help="Text file with one song query per line")
+    batch.add_argument('--playlist', metavar='URL', help="Queue every video of a playlist")
+    batch.add_argument(
+        '--workers', dest='transcribe_workers', type=int, default=None,
+        help="Transcription worker processes, each with its own model (default: 1)"
+    )
+    batch.add_argument(
+        '--torch-threads', type=int, default=None,
+        help="Torch threads per worker (default: cores / workers)"
+    )
+    
+    calibration = parser.add_argument_group("latency calibration")
+    calibration.add_argument(
+        '--probe-mixer', action='store_true',
+        help="Re-run the mixer buffer probe for this host and cache the result"
+    )
+    calibration.add_argument(
+        '--mixer-buffer', type=int, default=None, metavar='FRAMES',
+        help="Fixed mixer buffer size instead of the probed one"
+    )
+    calibration.add_argument(
+        '--no-latency-profile', dest='use_latency_profile', action='store_false', default=None,
+        help="Ignore this device's calibrated output latency"
+    )
+    calibration.add_argument(
+        '--calibrate', action='store_true',
+        help="Measure this device's output latency and save it as its timing profile"
+    )
+    calibration.add_argument(
+        '--tap-file', metavar='PATH',
+        help="Scripted tap times (seconds from playback start, one per line) instead of live taps"
+    )
+    calibration.add_argument(
+        '--loopback-wav', metavar='PATH',
+        help="Loopback capture of the click train (starting with playback) to analyse instead of taps"
+    )
+    return parser
+
+
+def config_overrides(args: argparse.Namespace) -> Dict[str, Any]:
+    """Config fields given on the command line (options share their Config field names)"""
+    names = {f.name for f in fields(Config)} - {'song_query'}
+    overrides = {name: value for name, value in vars(args).items() if name in names and value is not None}
+    if args.lyrics_file:
+        overrides['align_lyrics'] = True
+    return overrides
+
+
+def load_queue(args: argparse.Namespace) -> List[str]:
+    """Collect queue entries from --queue, --queue-file and --playlist"""
+    queries = list(args.queue or [])
+    if args.queue_file:
+        with open(args.queue_file, 'r', encoding='utf-8') as f:
+            queries.extend(
+                line.strip() for line in f
+                if line.strip() and not line.lstrip().startswith('#')
+            )
+    if args.playlist:
+        queries.extend(expand_playlist(args.playlist))
+    return queries
+
+
+def run_daemon(args: argparse.Namespace, config: Config):
+    """Start the transcription daemon"""
+    daemon = TranscriptionDaemon(args.daemon_host, args.daemon_port, Path(config.cache_dir))
+    daemon.preload(args.preload, config.backend, config.compute_type, config.quantize)
+    daemon.serve_forever()
+
+
 def main():
     """Main entry point"""
+    args = build_arg_parser().parse_args()
+    overrides = config_overrides(args)
+    
+    if args.daemon:
+        run_daemon(args, Config(**overrides))
+        return
+    
+    if args.import_times is not None:
+        sys.exit(0 if run_import_benchmark(args.import_times, args.import_budget) else 1)
+    
+    if args.benchmark_models is not None:
+        benchmark_models(Config(**overrides), args.benchmark_models, args.benchmark_clip)
+        return
+    
+    if args.probe_mixer:
+        resolve_mixer_buffer(Config(**dict(overrides, mixer_buffer=0)), reprobe=True)
+        return
+    
+    if args.calibrate:
+        calibrator = LatencyCalibrator(
+            Config(**overrides), tap_file=args.tap_file, loopback_wav=args.loopback_wav
+        )
+        sys.exit(0 if calibrator.run() is not None else 1)
+    
+    if overrides.get('model_budget', 0) > 0:
+        selected = select_model_for_budget(Config(**overrides))
+        if selected is not None:
+            overrides['whisper_model'] = selected
+    
+    scripted = dict(overrides)
+    scripted.setdefault('start_delay', 0.0)  # No countdown when nobody is at the prompt
     try:
-        config = interactive_setup()
+        queries = load_queue(args)
+        if queries:
+            player_queue = KaraokeQueue(queries, Config(**scripted))
+            sys.exit(0 if player_queue.run() else 1)
+        
+        # Resolve the song and load the model while the remaining questions are answered
+        prepared: List[KaraokePlayer] = []
+        
+        def prepare(setup: Config):
+            UI.set_quiet(True)  # Errors resurface when the player resolves again
+            player = KaraokePlayer(replace(setup, **overrides))
+            player.prepare_model()
+            prepared.append(player)
+        
+        preparing: List[threading.Thread] = []
+        
+        def start_preload(setup: Config):
+            thread = threading.Thread(target=prepare, args=(setup,), name="prepare", daemon=True)
+            thread.start()
+            preparing.append(thread)
+        
+        interactive = args.song_query is None
+        if interactive and not sys.stdin.isatty():
+            UI.print_error("No song query given and no terminal to ask for one")
+            sys.exit(2)
+        if interactive:
+            config = replace(interactive_setup(on_model=start_preload), **overrides)
+        else:
+            config = Config(song_query=args.song_query, **scripted)
         
         UI.print_section("🚀 STARTING KARAOKE PLAYER")
         UI.print_info(f"Song: {config.song_query}")
-        UI.print_info(f"Model: {config.whisper_model}")
+        UI.print_info(f"Model: {config.whisper_model} ({config.backend})")
         UI.print_info(f"Mode: {config.display_mode.value}")
         
-        time.sleep(1)
+        if interactive:
+            time.sleep(1)
         
-        player = KaraokePlayer(config)
+        for thread in preparing:
+            thread.join()
+        early = prepared[0] if prepared else None
+        player = KaraokePlayer(
+            config,
+            preload=early._preload if early else None,
+            video_info=early.video_info if early else None
+        )
+        if early is not None:
+            player.profile.merge(early.profile)  # The search ran during setup
         success = player.run()
         
         sys.exit(0 if success else 1)
@@ -0,0 +1,66 @@
+"""Transcription backends: selection, word conversion and cache identity"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from karaoke_player import (
+    DEFAULT_BACKEND, Config, FasterWhisperBackend, KaraokePlayer, WhisperBackend, create_backend,
+)
+
+
+def test_create_backend_picks_the_engine(tmp_path):
+    whisper = create_backend('whisper', 'tiny', quantize=True, cache_dir=tmp_path)
+    assert isinstance(whisper, WhisperBackend)
+    assert whisper.label == "openai-whisper (dynamic int8)"
+    assert whisper.cache_dir == tmp_path
+    faster = create_backend('faster-whisper', 'tiny', threads=2, compute_type='int8_float16')
+    assert isinstance(faster, FasterWhisperBackend)
+    assert faster.label == "faster-whisper (int8_float16)"
+    assert faster.threads == 2
+    with pytest.raises(ValueError):
+        create_backend('nope', 'tiny')
+
+
+def test_unknown_backend_in_config_falls_back_to_default():
+    assert Config(backend='nope').backend == DEFAULT_BACKEND
+
+
+def test_faster_whisper_segments_become_word_dicts():
+    word = lambda text, start, end: SimpleNamespace(word=text, start=start, end=end, probability=0.9)
+    segments = [SimpleNamespace(words=[word(' one', 0.0, 0.4), word(' two', 0.5, 0.9)]),
+                SimpleNamespace(words=None)]
+    calls = []
+
+    def transcribe(audio, **kwargs):
+        calls.append(kwargs)
+        return iter(segments), None
+
+    backend = FasterWhisperBackend('tiny')
+    backend.model = SimpleNamespace(transcribe=transcribe)
+    words = backend.transcribe("song.wav", {'language': 'en', 'initial_prompt': 'la'})
+    assert [(w['word'], w['start'], w['end']) for w in words] == [(' one', 0.0, 0.4), (' two', 0.5, 0.9)]
+    assert calls == [{'language': 'en', 'word_timestamps': True, 'initial_prompt': 'la'}]
+
+
+def test_faster_whisper_reports_a_missing_package(monkeypatch):
+    import builtins
+    real_import = builtins.__import__
+
+    def no_faster_whisper(name, *args, **kwargs):
+        if name == 'faster_whisper':
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, '__import__', no_faster_whisper)
+    with pytest.raises(RuntimeError, match="pip install faster-whisper"):
+        FasterWhisperBackend('tiny').load()
+
+
+@pytest.mark.parametrize("options, key", [
+    ({}, "small"),
+    ({'backend': 'faster-whisper'}, "faster-whisper/int8:small"),
+])
+def test_transcripts_are_cached_per_engine(tmp_path, options, key):
+    config = Config(whisper_model='small', cache_dir=str(tmp_path), use_audio_cache=False, **options)
+    assert KaraokePlayer(config)._model_key() == key
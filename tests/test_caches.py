@@ -0,0 +1,159 @@
+"""Audio and transcript caches: LRU eviction, sharing between processes, cache keys"""
+
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pytest
+
+from karaoke_player import WHISPER_SAMPLE_RATE, AudioCache, Config, KaraokePlayer, TranscriptCache, TranscriptionBackend
+
+
+def put_bytes(cache, tmp_path, video_id, size=100, suffix=".m4a"):
+    source = tmp_path / f"download-{video_id}-{os.getpid()}-{time.perf_counter_ns()}{suffix}"
+    source.write_bytes(b"x" * size)
+    return cache.put(video_id, source, {'title': video_id})
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = AudioCache(tmp_path / "audio", 10_000)
+    path = put_bytes(cache, tmp_path, "abc")
+    assert path == tmp_path / "audio" / "abc.m4a"
+    assert cache.get("abc") == path
+    assert cache.get("missing") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = AudioCache(tmp_path / "audio", 250)
+    put_bytes(cache, tmp_path, "first")
+    put_bytes(cache, tmp_path, "second")
+    cache.get("first")  # Now more recent than "second"
+    put_bytes(cache, tmp_path, "third")
+    assert cache.get("second") is None
+    assert cache.get("first") is not None and cache.get("third") is not None
+    assert not (tmp_path / "audio" / "second.m4a").exists()
+    assert cache.total_bytes == 200
+
+
+def test_orphan_files_are_adopted_and_stale_partials_removed(tmp_path):
+    root = tmp_path / "audio"
+    root.mkdir()
+    (root / "orphan.webm").write_bytes(b"y" * 100)
+    stale = root / ".old-x.partial"
+    stale.write_bytes(b"z")
+    old = time.time() - 2 * AudioCache.STALE_PARTIAL_SECONDS
+    os.utime(stale, (old, old))
+    fresh = root / ".new-y.partial"
+    fresh.write_bytes(b"z")
+
+    cache = AudioCache(root, 10_000)
+    assert cache.get("orphan") == root / "orphan.webm"
+    assert cache.total_bytes == 100
+    assert not stale.exists()
+    assert fresh.exists()  # May still be copied by another process
+
+
+def test_other_processes_see_each_others_entries(tmp_path):
+    first = AudioCache(tmp_path / "audio", 10_000)
+    second = AudioCache(tmp_path / "audio", 10_000)
+    put_bytes(first, tmp_path, "one")
+    put_bytes(second, tmp_path, "two")
+    assert first.get("two") is not None
+    index = json.loads((tmp_path / "audio" / "index.json").read_text())
+    assert set(index) == {"one", "two"}
+
+
+def _put_many(root, tmp_path, video_ids):
+    cache = AudioCache(root, 10**9)
+    for video_id in video_ids:
+        put_bytes(cache, tmp_path, video_id)
+
+
+@pytest.mark.parametrize("same_video", [False, True])
+def test_concurrent_puts_from_several_processes(tmp_path, same_video):
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        pytest.skip("needs fork")
+    context = multiprocessing.get_context('fork')
+    root = tmp_path / "audio"
+    jobs = [
+        ["shared"] * 10 if same_video else [f"v{worker}-{i}" for i in range(10)]
+        for worker in range(4)
+    ]
+    processes = [context.Process(target=_put_many, args=(root, tmp_path, ids)) for ids in jobs]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+    assert [process.exitcode for process in processes] == [0] * 4
+
+    index = json.loads((root / "index.json").read_text())
+    expected = {video_id for ids in jobs for video_id in ids}
+    assert set(index) == expected
+    assert sorted(p.name for p in root.iterdir() if p.suffix == ".m4a") == sorted(f"{v}.m4a" for v in expected)
+    assert not list(root.glob("*.partial"))
+
+
+# ============================================================================
+# TRANSCRIPT CACHE
+# ============================================================================
+
+def test_transcript_keys_depend_on_audio_model_and_options():
+    key = TranscriptCache.make_key("abc", "small", {'language': 'en', 'vad': None})
+    assert key == TranscriptCache.make_key("abc", "small", {'vad': None, 'language': 'en'})
+    assert key != TranscriptCache.make_key("abd", "small", {'language': 'en', 'vad': None})
+    assert key != TranscriptCache.make_key("abc", "medium", {'language': 'en', 'vad': None})
+    assert key != TranscriptCache.make_key("abc", "small", {'language': 'de', 'vad': None})
+
+
+def test_transcripts_round_trip_with_only_timing_fields(tmp_path):
+    cache = TranscriptCache(tmp_path)
+    words = [{'word': ' hi', 'start': np.float32(0.5), 'end': 0.9, 'probability': 0.8, 'tokens': [1, 2]}]
+    cache.put("key", words, {'model': 'small'})
+    assert cache.get("key") == [{'start': 0.5, 'end': 0.9, 'word': ' hi', 'probability': pytest.approx(0.8)}]
+    assert cache.get("missing") is None
+
+
+def test_links_make_a_transcript_findable_by_another_key(tmp_path):
+    cache = TranscriptCache(tmp_path)
+    cache.put("content-key", [{'word': ' hi', 'start': 0.0, 'end': 0.5}])
+    assert not cache.has("video-key")
+    cache.link("video-key", "content-key")
+    assert cache.has("video-key") and cache.has("content-key")
+
+
+class CountingBackend(TranscriptionBackend):
+    name = "counting"
+
+    def __init__(self):
+        super().__init__("tiny")
+        self.calls = 0
+
+    def transcribe(self, audio, options):
+        self.calls += 1
+        return [{'word': ' la', 'start': 0.5, 'end': 0.9, 'probability': 0.9}]
+
+
+def transcribe_once(tmp_path, backend, **options):
+    audio = tmp_path / "song.m4a"
+    audio.write_bytes(b"same audio content")
+    config = Config(song_query="song", cache_dir=str(tmp_path / "cache"), use_audio_cache=False, **options)
+    player = KaraokePlayer(config, model=backend, video_info={'id': "vid123"})
+    player.audio_path = audio
+    player._samples = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+    return player, player.transcribe_audio()
+
+
+def test_repeat_plays_skip_transcription(tmp_path):
+    backend = CountingBackend()
+    first, words = transcribe_once(tmp_path, backend)
+    assert not first.profile.notes['transcript_cache_hit']
+    second, cached = transcribe_once(tmp_path, backend)
+    assert cached == words
+    assert backend.calls == 1
+    assert second.profile.notes['transcript_cache_hit']
+    assert second._transcript_cached("vid123")  # Known by video ID before any download
+
+    transcribe_once(tmp_path, backend, language="de")  # Other options: a new transcript
+    assert backend.calls == 2
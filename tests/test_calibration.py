@@ -0,0 +1,95 @@
+"""Output-latency calibration and mixer buffer tuning"""
+
+import json
+
+import numpy as np
+import pytest
+
+import karaoke_player
+from karaoke_player import (
+    CLICK_COUNT, Config, LatencyCalibrator, LatencyProfiles, MixerProfiles, make_click_train, match_latencies,
+    measure_mixer_buffer, mixer_host_id, probe_mixer_buffer, resolve_mixer_buffer, write_playback_wav,
+)
+
+
+def test_match_latencies_pairs_events_with_nearest_clicks():
+    clicks = np.array([1.0, 1.6, 2.2])
+    delays = match_latencies([1.08, 1.7, 2.19, 5.0], clicks, window=0.3)
+    assert delays == pytest.approx([0.08, 0.1, -0.01])
+
+
+def test_uncalibrated_device_has_no_offset(tmp_path):
+    profiles = LatencyProfiles(tmp_path)
+    assert profiles.offset("dummy") == 0.0
+    profiles.put("dummy", {'offset': -0.05})
+    assert profiles.offset("dummy") == -0.05
+
+
+def test_calibration_from_tap_file(tmp_path, monkeypatch):
+    pytest.importorskip('pygame')
+    monkeypatch.setenv('SDL_AUDIODRIVER', 'dummy')
+    clicks = make_click_train(tmp_path / "clicks.wav")
+    tap_file = tmp_path / "taps.txt"
+    tap_file.write_text("# heard 80 ms late\n" + "\n".join(f"{t + 0.08:.3f}" for t in clicks))
+
+    config = Config(cache_dir=str(tmp_path), mixer_buffer=512)
+    latency = LatencyCalibrator(config, tap_file=str(tap_file)).run()
+
+    assert latency == pytest.approx(0.08)
+    profiles = json.loads((tmp_path / "latency_profiles.json").read_text())
+    (profile,) = profiles.values()
+    assert profile['method'] == "tap-file"
+    assert profile['samples'] == CLICK_COUNT
+    assert profile['offset'] == pytest.approx(-0.08)
+
+
+# ============================================================================
+# MIXER BUFFER TUNING
+# ============================================================================
+
+@pytest.fixture
+def fake_measure(monkeypatch):
+    """Buffers of at least 1024 frames play without glitches"""
+    measured = []
+
+    def measure(buffer, probe_path, seconds=0.0):
+        measured.append(buffer)
+        assert probe_path.is_file()
+        return {'buffer': buffer, 'glitches': 0 if buffer >= 1024 else 3,
+                'longest_gap_ms': 10.0, 'rate': 1.0, 'stable': buffer >= 1024}
+
+    monkeypatch.setattr(karaoke_player, 'measure_mixer_buffer', measure)
+    return measured
+
+
+def test_probe_picks_the_smallest_stable_buffer(tmp_path, fake_measure):
+    buffer, results = probe_mixer_buffer(tmp_path, candidates=(4096, 256, 1024, 512), load_workers=0)
+    assert buffer == 1024
+    assert fake_measure == [256, 512, 1024]  # Stops at the first stable size
+    assert not (tmp_path / "mixer_probe.wav").exists()
+
+
+def test_probe_falls_back_to_the_largest_buffer(tmp_path, fake_measure):
+    buffer, results = probe_mixer_buffer(tmp_path, candidates=(256, 512), load_workers=0)
+    assert buffer == 512
+    assert not any(result['stable'] for result in results)
+
+
+def test_probed_buffer_is_cached_per_host(tmp_path, fake_measure):
+    config = Config(cache_dir=str(tmp_path))
+    assert resolve_mixer_buffer(config) == 1024
+    assert MixerProfiles(tmp_path).get(mixer_host_id())['buffer'] == 1024
+    fake_measure.clear()
+    assert resolve_mixer_buffer(config) == 1024
+    assert fake_measure == []  # Read from the profile
+    assert resolve_mixer_buffer(Config(cache_dir=str(tmp_path), mixer_buffer=2048)) == 2048
+
+
+def test_silence_plays_without_glitches_on_the_dummy_driver(tmp_path, monkeypatch):
+    pytest.importorskip('pygame')
+    monkeypatch.setenv('SDL_AUDIODRIVER', 'dummy')
+    probe = tmp_path / "probe.wav"
+    write_playback_wav(probe, np.zeros(44100, dtype=np.float32))
+    result = measure_mixer_buffer(2048, probe, seconds=0.5)
+    assert result['buffer'] == 2048
+    assert set(result) == {'buffer', 'glitches', 'longest_gap_ms', 'rate', 'stable'}
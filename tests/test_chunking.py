@@ -0,0 +1,41 @@
+"""Silence-split chunking and timestamp stitching"""
+
+import numpy as np
+import pytest
+
+from karaoke_player import WHISPER_SAMPLE_RATE, split_at_silences, stitch_chunk_words
+
+
+def test_split_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        split_at_silences(np.zeros(10), 60.0, 30.0)
+
+
+def test_split_keeps_short_audio_whole():
+    assert split_at_silences(np.zeros(0)) == [(0, 0, 0)]
+    samples = np.ones(50 * WHISPER_SAMPLE_RATE, dtype=np.float32)
+    assert split_at_silences(samples) == [(0, len(samples), len(samples))]
+
+
+def test_split_cuts_in_the_quietest_stretch():
+    rate = WHISPER_SAMPLE_RATE
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(-0.5, 0.5, 100 * rate).astype(np.float32)
+    samples[42 * rate:43 * rate] = 0.0
+    chunks = split_at_silences(samples, 30.0, 60.0, overlap=1.0)
+    assert len(chunks) == 2
+    (start0, end0, cut), (start1, end1, last) = chunks
+    assert 42 * rate <= cut <= 43 * rate
+    assert start0 == 0 and end0 == cut + rate // 2
+    assert start1 == cut - rate // 2 and end1 == last == len(samples)
+
+
+def test_stitch_keeps_overlap_words_once():
+    rate = WHISPER_SAMPLE_RATE
+    chunks = [(0, 41 * rate, 40 * rate), (39 * rate, 80 * rate, 80 * rate)]
+    chunk_words = [
+        [{'word': 'a', 'start': 10.0, 'end': 10.5}, {'word': 'b', 'start': 39.6, 'end': 40.2}],
+        [{'word': 'b', 'start': 0.6, 'end': 1.2}, {'word': 'c', 'start': 5.0, 'end': 5.5}],
+    ]
+    words = stitch_chunk_words(chunks, chunk_words)
+    assert [(w['word'], w['start']) for w in words] == [('a', 10.0), ('b', 39.6), ('c', 44.0)]
@@ -0,0 +1,20 @@
+"""Command-line parsing into Config overrides"""
+
+from karaoke_player import DisplayMode, build_arg_parser, config_overrides
+
+
+def test_config_overrides_only_contain_given_options():
+    args = build_arg_parser().parse_args(["some song", "--mode", "line", "--offset", "0.2"])
+    assert config_overrides(args) == {
+        'display_mode': DisplayMode.LINE,
+        'timing_offset': 0.2,
+    }
+
+
+def test_lyrics_file_enables_alignment():
+    args = build_arg_parser().parse_args(["--lyrics-file", "lyrics.txt", "--no-audio-cache"])
+    overrides = config_overrides(args)
+    assert overrides['lyrics_file'] == "lyrics.txt"
+    assert overrides['align_lyrics'] is True
+    assert overrides['use_audio_cache'] is False
+    assert 'song_query' not in overrides
@@ -0,0 +1,113 @@
+"""Transcription daemon: resident models and the HTTP job protocol"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+import karaoke_player
+from karaoke_player import (
+    Config, DaemonClient, KaraokePlayer, TranscriptionBackend, TranscriptionDaemon, _DaemonRequestHandler,
+)
+
+
+class FakeBackend(TranscriptionBackend):
+    """Remembers how it was created; transcribes to one word naming the model"""
+
+    name = "fake"
+
+    def __init__(self, model_name, quantize, cache_dir):
+        super().__init__(model_name)
+        self.quantize = quantize
+        self.cache_dir = cache_dir
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self
+
+    def transcribe(self, audio, options):
+        label = f"{self.model_name}{'-int8' if self.quantize else ''}"
+        return [{'word': f" {label}", 'start': 0.0, 'end': 0.5, 'probability': 1.0}]
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    def fake_create_backend(backend, model_name, threads=0, compute_type="int8",
+                            quantize=False, cache_dir=None):
+        return FakeBackend(model_name, quantize, cache_dir)
+
+    monkeypatch.setattr(karaoke_player, 'create_backend', fake_create_backend)
+    monkeypatch.setattr(karaoke_player, 'decode_audio', lambda path: np.zeros(16000, dtype=np.float32))
+    return TranscriptionDaemon(cache_dir=tmp_path)
+
+
+@pytest.fixture
+def daemon_url(daemon):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _DaemonRequestHandler)
+    server.daemon = daemon
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_quantized_and_fp32_models_are_kept_apart(daemon, tmp_path):
+    fp32 = daemon.get_model('tiny')
+    int8 = daemon.get_model('tiny', quantize=True)
+    assert fp32 is not int8
+    assert (fp32.quantize, int8.quantize) == (False, True)
+    assert int8.cache_dir == tmp_path
+    assert daemon.get_model('tiny', quantize=True) is int8
+    assert daemon.health()['models'] == ['tiny', 'tiny:int8-dynamic']
+
+
+def test_preload_honours_quantize(daemon):
+    daemon.preload(['tiny'], quantize=True)
+    assert daemon.health()['models'] == ['tiny:int8-dynamic']
+
+
+def test_client_requests_the_quantized_model(daemon_url, tmp_path):
+    audio = tmp_path / "song.m4a"
+    audio.write_bytes(b"decoded by the fake")
+    client = DaemonClient(daemon_url)
+    assert client.transcribe(audio, 'tiny', {})[0]['word'] == " tiny"
+    assert client.transcribe(audio, 'tiny', {}, quantize=True)[0]['word'] == " tiny-int8"
+
+
+def test_models_stay_resident_between_jobs(daemon_url, daemon, tmp_path):
+    audio = tmp_path / "song.m4a"
+    audio.write_bytes(b"decoded by the fake")
+    client = DaemonClient(daemon_url)
+    for _ in range(3):
+        client.transcribe(audio, 'tiny', {})
+    assert daemon.get_model('tiny').loads == 1
+    with urllib.request.urlopen(f"{daemon_url}/health") as response:
+        health = json.loads(response.read())
+    assert health == {'status': 'ok', 'models': ['tiny'], 'jobs_served': 3}
+
+
+def test_bad_jobs_are_rejected_with_the_reason(daemon_url, tmp_path):
+    client = DaemonClient(daemon_url)
+    with pytest.raises(RuntimeError, match="Audio file not found"):
+        client.transcribe(tmp_path / "missing.m4a", 'tiny', {})
+    audio = tmp_path / "song.m4a"
+    audio.write_bytes(b"decoded by the fake")
+    with pytest.raises(RuntimeError, match="Unknown model"):
+        client.transcribe(audio, 'huge', {})
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(f"{daemon_url}/nothing")
+    assert error.value.code == 404
+
+
+def test_player_falls_back_when_the_daemon_is_down(tmp_path):
+    config = Config(song_query="song", cache_dir=str(tmp_path), daemon_url="http://127.0.0.1:9",
+                    use_audio_cache=False, use_transcript_cache=False)
+    player = KaraokePlayer(config)
+    player.audio_path = tmp_path / "song.m4a"
+    assert player._transcribe_via_daemon({}) is None
@@ -0,0 +1,81 @@
+"""Run profiler: exclusive stage accounting, per-stage memory peaks and merging"""
+
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from karaoke_player import RunProfiler
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def stage(report, name):
+    return next(s for s in report['stages'] if s['stage'] == name)
+
+
+def test_nested_stages_are_charged_once():
+    profile = RunProfiler()
+    with profile.stage('transcription'):
+        busy(0.05)
+        with profile.stage('model_load'):
+            busy(0.1)
+    report = profile.report()
+    outer, inner = stage(report, 'transcription'), stage(report, 'model_load')
+    assert inner['wall_seconds'] == pytest.approx(0.1, abs=0.03)
+    assert outer['wall_seconds'] == pytest.approx(0.05, abs=0.03)
+    assert outer['wall_seconds'] + inner['wall_seconds'] <= report['wall_seconds']
+
+
+def test_repeated_stages_accumulate():
+    profile = RunProfiler()
+    for _ in range(3):
+        with profile.stage('timing'):
+            pass
+    assert stage(profile.report(), 'timing')['calls'] == 3
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="per-stage peaks need /proc/self/clear_refs")
+def test_stage_peaks_are_measured_per_stage():
+    profile = RunProfiler()
+    with profile.stage('big'):
+        block = np.ones(200 * 1024 * 1024 // 8)
+        block += 1
+        del block
+    with profile.stage('small'):
+        pass
+    report = profile.report()
+    big, small = stage(report, 'big'), stage(report, 'small')
+    if small['peak_rss_mb'] is None:
+        pytest.skip("clear_refs not writable here")
+    assert big['peak_rss_mb'] - small['peak_rss_mb'] > 150
+    assert small['rss_high_water_mb'] >= big['peak_rss_mb']  # Lifetime peak survives the reset
+    assert report['peak_rss_mb'] >= big['peak_rss_mb']
+
+
+def test_stage_peaks_can_be_disabled():
+    profile = RunProfiler(stage_peaks=False)
+    with profile.stage('download'):
+        pass
+    record = stage(profile.report(), 'download')
+    assert record['peak_rss_mb'] is None
+    assert 'rss_high_water_mb' in record
+
+
+def test_merge_carries_earlier_stages_and_notes():
+    early, final = RunProfiler(), RunProfiler()
+    with early.stage('resolve'):
+        busy(0.02)
+    early.notes['searched_during_setup'] = True
+    with final.stage('playback'):
+        pass
+    final.merge(early)
+    report = final.report()
+    assert stage(report, 'resolve')['wall_seconds'] == pytest.approx(0.02, abs=0.02)
+    assert [s['stage'] for s in report['stages']] == ['resolve', 'playback']
+    assert report['searched_during_setup'] is True
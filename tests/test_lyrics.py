@@ -0,0 +1,80 @@
+"""Lyric cleaning, providers and forced alignment with fallback to transcription"""
+
+import numpy as np
+
+from karaoke_player import (
+    WHISPER_SAMPLE_RATE, Config, KaraokePlayer, StaticLyricsProvider, TranscriptionBackend,
+    clean_lyrics,
+)
+
+
+def test_clean_lyrics_drops_headers_and_blank_lines():
+    text = "[Verse 1]\n  First line  \n\n[Chorus]\nSecond line\n"
+    assert clean_lyrics(text) == "First line\nSecond line"
+
+
+def test_static_provider_without_lyric_lines_returns_none():
+    assert StaticLyricsProvider("[Instrumental]\n\n").fetch("song") is None
+    assert StaticLyricsProvider("la la\n[Outro]").fetch("song") == "la la"
+
+
+class FakeBackend(TranscriptionBackend):
+    """Records calls; aligns by spreading the lyric words one second apart"""
+
+    name = "fake"
+
+    def __init__(self, can_align: bool = True):
+        super().__init__("tiny")
+        self.can_align = can_align
+        self.calls = []
+
+    def transcribe(self, audio, options):
+        self.calls.append('transcribe')
+        return [{'word': ' heard', 'start': 0.5, 'end': 0.9, 'probability': 0.9}]
+
+    def align(self, audio, text, options):
+        self.calls.append('align')
+        if not self.can_align:
+            return super().align(audio, text, options)
+        return [
+            {'word': f" {word}", 'start': float(i), 'end': i + 0.5, 'probability': 1.0}
+            for i, word in enumerate(text.split())
+        ]
+
+
+def make_player(tmp_path, backend, lyrics="[Chorus]\nknown words here", **options):
+    audio = tmp_path / "song.m4a"
+    audio.write_bytes(b"not decoded: samples are injected")
+    config = Config(
+        song_query="song", align_lyrics=True, cache_dir=str(tmp_path / "cache"),
+        use_audio_cache=False, **options
+    )
+    player = KaraokePlayer(config, model=backend, lyrics_provider=StaticLyricsProvider(lyrics))
+    player.audio_path = audio
+    player._samples = np.zeros(4 * WHISPER_SAMPLE_RATE, dtype=np.float32)
+    return player
+
+
+def test_known_lyrics_are_aligned_instead_of_transcribed(tmp_path):
+    backend = FakeBackend()
+    words = make_player(tmp_path, backend, use_transcript_cache=False).transcribe_audio()
+    assert backend.calls == ['align']
+    assert [w['word'].strip() for w in words] == ["known", "words", "here"]
+
+
+def test_alignment_falls_back_to_transcription(tmp_path):
+    backend = FakeBackend(can_align=False)
+    words = make_player(tmp_path, backend, use_transcript_cache=False).transcribe_audio()
+    assert backend.calls == ['align', 'transcribe']
+    assert [w['word'].strip() for w in words] == ["heard"]
+
+
+def test_aligned_transcripts_are_cached_per_lyric_text(tmp_path):
+    backend = FakeBackend()
+    assert make_player(tmp_path, backend).transcribe_audio()
+    assert make_player(tmp_path, backend).transcribe_audio()
+    assert backend.calls == ['align']  # Second run is a cache hit
+
+    words = make_player(tmp_path, backend, lyrics="other lyrics").transcribe_audio()
+    assert backend.calls == ['align', 'align']
+    assert [w['word'].strip() for w in words] == ["other", "lyrics"]
@@ -0,0 +1,37 @@
+"""Budget-based model selection from benchmark profiles"""
+
+from karaoke_player import Config, ModelProfiles, model_profile_key, pick_model, select_model_for_budget
+
+
+RESULTS = {
+    'tiny': {'seconds_per_minute': 2.0},
+    'base.en': {'seconds_per_minute': 3.0},
+    'small': {'seconds_per_minute': 8.0},
+    'medium': {'seconds_per_minute': 20.0},
+    'large-v3': {'error': "worker exited with code -9"},
+}
+
+
+def test_pick_model_takes_the_largest_within_budget():
+    assert pick_model(RESULTS, 10.0, 'es') == 'small'
+    assert pick_model(RESULTS, 100.0, 'es') == 'medium'  # Failed models are never picked
+
+
+def test_pick_model_falls_back_to_the_fastest():
+    assert pick_model(RESULTS, 1.0, 'es') == 'tiny'
+    assert pick_model({}, 1.0, 'es') is None
+
+
+def test_pick_model_uses_english_models_only_for_english():
+    assert pick_model(RESULTS, 4.0, 'es') == 'tiny'
+    assert pick_model(RESULTS, 4.0, 'en') == 'base.en'
+
+
+def test_budget_selection_needs_a_profile_measured_on_a_real_clip(tmp_path):
+    config = Config(cache_dir=str(tmp_path), model_budget=10.0, language='es')
+    profiles = ModelProfiles(tmp_path)
+    key = model_profile_key(config.backend, config.compute_type)
+    profiles.put(key, {'results': RESULTS})  # Synthetic smoke-test run
+    assert select_model_for_budget(config) is None
+    profiles.put(key, {'results': RESULTS, 'clip': "song.m4a"})
+    assert select_model_for_budget(config) == 'small'
@@ -0,0 +1,205 @@
+"""Playback: mixer-driven clock, terminal frames, controls and seeking"""
+
+import os
+import sys
+
+import pytest
+
+from karaoke_player import (
+    UI, AudioClock, Config, DisplayMode, KaraokePlayer, KeyReader, TerminalRenderer, TimingTrack,
+    build_timing_track,
+)
+
+
+WORDS = [
+    {'word': ' hello', 'start': 1.0, 'end': 1.5},
+    {'word': ' world', 'start': 1.6, 'end': 2.0},
+    {'word': ' again', 'start': 5.0, 'end': 5.5},
+]
+
+
+@pytest.fixture
+def player(tmp_path):
+    config = Config(cache_dir=str(tmp_path), use_audio_cache=False, use_transcript_cache=False,
+                    use_latency_profile=False)
+    return KaraokePlayer(config)
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    with open(tmp_path / "terminal.out", 'w+b') as out:
+        yield TerminalRenderer(out)
+
+
+@pytest.fixture
+def mixer(monkeypatch):
+    pygame = pytest.importorskip('pygame')
+    starts = []
+    monkeypatch.setattr(pygame.mixer.music, 'play', lambda start=0.0: starts.append(start))
+    return starts
+
+
+def word_track():
+    return build_timing_track(WORDS, DisplayMode.WORD, new_line_threshold=1.0, max_line_length=40)
+
+
+def test_seek_resyncs_to_the_tokens_due_at_the_target(player, renderer, mixer):
+    track = word_track()
+    renderer.set_track(track)
+    clock = AudioClock(lambda: -1.0)
+    assert player._seek(1.8, 0.0, clock, track, len(track), renderer) == 2
+    assert mixer == [1.8]
+    assert clock.position() == pytest.approx(1.8, abs=0.01)
+    assert player._seek(0.0, 1.8, clock, track, len(track), renderer) == 0
+
+
+def test_seek_never_passes_tokens_that_may_still_grow(player, renderer, mixer):
+    track = word_track()
+    renderer.set_track(track)
+    available = len(track) - 1  # Streaming: the last token is unfinished
+    assert player._seek(9.0, 0.0, AudioClock(lambda: -1.0), track, available, renderer) == available
+
+
+def test_seek_before_any_words_have_arrived(player, renderer, mixer):
+    empty = TimingTrack.from_tokens([])
+    renderer.set_track(empty)
+    assert player._seek(10.0, 0.0, AudioClock(lambda: -1.0), empty, -1, renderer) == 0
+    assert player._seek(10.0, 0.0, AudioClock(lambda: -1.0), empty, 0, renderer) == 0
+
+
+# ============================================================================
+# AUDIO CLOCK
+# ============================================================================
+
+def started_clock(mixer_position):
+    clock = AudioClock(lambda: mixer_position[0])
+    clock.start()
+    return clock, clock._start
+
+
+def test_clock_follows_wall_time_until_the_mixer_reports():
+    clock, t0 = started_clock([-1.0])  # get_pos() is -1 before playback starts
+    clock.sample(t0 + 1.0)
+    assert clock.position(t0 + 1.0) == pytest.approx(1.0)
+    assert clock.drift_report() is None
+
+
+def test_clock_slews_gradually_toward_the_mixer():
+    mixer = [0.0]
+    clock, t0 = started_clock(mixer)
+    mixer[0] = 1.05  # Mixer is 50 ms ahead of wall time
+    clock.sample(t0 + 1.0)
+    assert clock.correction == pytest.approx(AudioClock.MAX_SLEW)  # Never jumps
+    for i in range(200):
+        mixer[0] = 1.05 + i * 0.01
+        clock.sample(t0 + 1.0 + i * 0.01)
+    assert clock.correction == pytest.approx(0.05, abs=0.002)
+    assert clock.drift_report()['samples'] == 201
+
+
+def test_clock_converts_song_positions_to_monotonic_deadlines():
+    mixer = [2.0]
+    clock, t0 = started_clock(mixer)
+    clock.sample(t0 + 1.9)
+    deadline = clock.to_monotonic(3.0)
+    assert clock.position(deadline) == pytest.approx(3.0)
+
+
+# ============================================================================
+# TERMINAL RENDERING
+# ============================================================================
+
+def written(renderer):
+    out = renderer._stream
+    out.seek(0)
+    return out.read()
+
+
+def test_frames_splice_line_prefixes_at_newlines(renderer):
+    renderer.set_track(word_track())
+    renderer.render(0, 4)
+    assert written(renderer) == (UI.CYAN + "hello world \n🎵 again ").encode('utf-8')
+
+
+def test_color_is_only_sent_when_it_changes(renderer):
+    renderer.set_track(word_track())
+    renderer.render(0, 1)
+    renderer.render(1, 2)
+    renderer.render(2, 2)  # Empty frame: nothing written
+    assert written(renderer) == (UI.CYAN + "hello world ").encode('utf-8')
+
+
+def test_non_ascii_tokens_are_sliced_on_character_boundaries(renderer):
+    words = [{'word': ' café', 'start': 0.0, 'end': 0.4}, {'word': ' naïve', 'start': 0.5, 'end': 0.9}]
+    track = build_timing_track(words, DisplayMode.CHARACTER, new_line_threshold=1.0, max_line_length=40)
+    renderer.set_track(track)
+    renderer.render(0, 4)
+    renderer.render(4, len(track))
+    assert written(renderer).decode('utf-8') == UI.CYAN + "café naïve"
+
+
+def test_status_notes_are_erased_before_the_next_frame(renderer):
+    renderer.set_track(word_track())
+    renderer.status(" [paused]")
+    renderer.render(0, 1)
+    erase = b"\b" * 9 + b" " * 9 + b"\b" * 9
+    assert written(renderer) == UI.YELLOW.encode() + b" [paused]" + erase + UI.CYAN.encode() + b"hello "
+
+
+# ============================================================================
+# CONTROLS
+# ============================================================================
+
+class PipeStdin:
+    """Terminal stand-in whose keypresses are written to a pipe"""
+
+    def __init__(self, fd):
+        self._fd = fd
+
+    def fileno(self):
+        return self._fd
+
+    def isatty(self):
+        return False  # KeyReader then leaves the terminal mode alone
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="reads keys with select() on POSIX")
+def test_keys_become_playback_commands(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setattr(sys, 'stdin', PipeStdin(read_fd))
+    reader = KeyReader()
+    try:
+        os.write(write_fd, b" \x1b[CQx+")
+        keys = reader._read_keys()
+        assert keys == [' ', '\x1b[C', 'Q', 'x', '+']
+        for key in keys:
+            command = reader.keymap.get(key) or reader.keymap.get(key.lower())
+            if command:
+                reader.commands.put(command)
+        assert reader.poll() == ['pause', 'forward', 'quit', 'nudge_earlier']
+        assert reader.poll() == []
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_lyrics_continue_from_the_pause_point():
+    clock, t0 = started_clock([-1.0])
+    paused_at = t0 + 3.0
+    assert clock.position(paused_at) == pytest.approx(3.0)
+    clock.shift(7.0)  # Resumed after 7 s paused
+    assert clock.position(paused_at + 7.0) == pytest.approx(3.0)
+    assert clock.position(paused_at + 8.0) == pytest.approx(4.0)
+
+
+def test_control_targets(player):
+    track = word_track()  # Lines start at 1.0 s ("hello world") and 5.0 s ("again")
+    assert player._seek_target('forward', 20.0, track, 0) == 30.0
+    assert player._seek_target('back', 4.0, track, 0) == -6.0  # Clamped to 0 by the caller
+    assert player._seek_target('restart_line', 6.0, track, 4) == pytest.approx(4.5)
+    assert player._seek_target('skip_intro', 0.0, track, 0) is None  # Lyrics start within the lead
+
+    late = [dict(word, start=word['start'] + 20.0, end=word['end'] + 20.0) for word in WORDS]
+    intro = build_timing_track(late, DisplayMode.WORD, new_line_threshold=1.0, max_line_length=40)
+    assert player._seek_target('skip_intro', 0.0, intro, 0) == pytest.approx(19.0)
+    assert player._seek_target('skip_intro', 19.5, intro, 0) is None  # Never seeks backwards
@@ -0,0 +1,97 @@
+"""Background model preload: when it starts, what it overlaps and when it is skipped"""
+
+import threading
+
+import pytest
+
+import karaoke_player
+from karaoke_player import Config, KaraokePlayer, ModelPreload, TranscriptionBackend, preload_model
+
+
+class GatedBackend(TranscriptionBackend):
+    """Backend whose load() blocks until the test releases it"""
+    name = "gated"
+    
+    def __init__(self, model_name, *args, **kwargs):
+        super().__init__(model_name)
+        self.release = threading.Event()
+        self.loaded = False
+        self.error = None
+    
+    def load(self):
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        self.loaded = True
+        return self
+    
+    def transcribe(self, audio, options):
+        return []
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    created = []
+    
+    def create_backend(backend, model_name, *args, **kwargs):
+        created.append(GatedBackend(model_name))
+        return created[-1]
+    
+    monkeypatch.setattr(karaoke_player, 'create_backend', create_backend)
+    return created
+
+
+def test_load_runs_in_the_background(backends):
+    preload = ModelPreload(Config(whisper_model='tiny'))
+    assert not preload.done
+    backends[0].release.set()
+    assert preload.wait() is backends[0]
+    assert backends[0].loaded and preload.done
+    assert preload.load_seconds is not None
+    assert 0.0 <= preload.saved_seconds <= preload.load_seconds
+
+
+def test_load_errors_surface_in_wait(backends):
+    preload = ModelPreload(Config(whisper_model='tiny'))
+    backends[0].error = RuntimeError("no such model")
+    backends[0].release.set()
+    with pytest.raises(RuntimeError, match="no such model"):
+        preload.wait()
+
+
+def test_preload_is_only_reused_for_the_same_model(backends):
+    preload = ModelPreload(Config(whisper_model='tiny'))
+    backends[0].release.set()
+    assert preload.matches(Config(whisper_model='tiny', song_query="other song"))
+    assert not preload.matches(Config(whisper_model='small'))
+    assert not preload.matches(Config(whisper_model='tiny', quantize=True))
+    assert KaraokePlayer(Config(whisper_model='small', use_audio_cache=False), preload=preload)._preload is None
+
+
+@pytest.mark.parametrize("options, expected", [
+    ({}, True),
+    ({'daemon_url': "http://127.0.0.1:1"}, False),
+    ({'chunk_workers': 2}, False),
+    ({'chunk_workers': 2, 'align_lyrics': True}, True),  # Alignment still runs locally
+])
+def test_preload_only_when_the_model_is_used_locally(backends, options, expected):
+    preload = preload_model(Config(whisper_model='tiny', **options))
+    assert (preload is not None) == expected
+    for backend in backends:
+        backend.release.set()
+
+
+def test_cached_transcript_skips_the_preload(tmp_path, backends):
+    config = Config(song_query="song", whisper_model='tiny', cache_dir=str(tmp_path), use_audio_cache=False)
+    cached = KaraokePlayer(config, video_info={'id': "seen"})
+    key = cached._video_transcript_key("seen", cached._transcribe_options())
+    cached._transcript_cache.put(key, [{'word': " la", 'start': 0.0, 'end': 0.5}])
+    cached.prepare_model()
+    assert cached._preload is None and not backends
+    
+    fresh = KaraokePlayer(config, video_info={'id': "new"})
+    fresh.prepare_model()
+    assert fresh._preload is not None and len(backends) == 1
+    backends[0].release.set()
+    assert fresh._load_model() is backends[0]
+    assert 'model_preload_seconds' in fresh.profile.notes
@@ -0,0 +1,98 @@
+"""Dynamic int8 Whisper: model cache, cached reload and cache identity"""
+
+import pytest
+
+import karaoke_player
+from karaoke_player import (
+    Config, KaraokePlayer, WhisperBackend, describe_quantization, ensure_quantized_whisper,
+    load_quantized_whisper, quantized_model_path,
+)
+
+
+@pytest.fixture
+def tiny_whisper(monkeypatch):
+    """Stand in a randomly initialised two-layer Whisper for the real checkpoint download"""
+    whisper = pytest.importorskip('whisper')
+    torch = pytest.importorskip('torch')
+    from whisper.model import ModelDimensions, Whisper
+    
+    dims = ModelDimensions(
+        n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=1,
+        n_vocab=51865, n_text_ctx=16, n_text_state=64, n_text_head=2, n_text_layer=1,
+    )
+    loads = []
+    
+    def load_model(name, device='cpu'):
+        loads.append(name)
+        torch.manual_seed(0)
+        model = Whisper(dims)
+        # Allocated with torch.empty; a real checkpoint fills it
+        torch.nn.init.normal_(model.decoder.positional_embedding, std=0.02)
+        return model
+    
+    monkeypatch.setattr(whisper, 'load_model', load_model)
+    return loads
+
+
+def test_quantized_model_path_names_the_scheme(tmp_path):
+    assert quantized_model_path('small', tmp_path) == tmp_path / "small.int8-dynamic.pt"
+
+
+def test_ensure_quantized_whisper_only_quantizes_once(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(karaoke_player, 'quantize_whisper',
+                        lambda name, path: (calls.append(name), path.write_bytes(b'x')))
+    ensure_quantized_whisper('tiny', tmp_path)
+    ensure_quantized_whisper('tiny', tmp_path)
+    assert calls == ['tiny']
+
+
+def test_cached_reload_matches_fresh_quantization(tmp_path, tiny_whisper):
+    import torch
+    from torch.ao.nn.quantized import dynamic as nnqd
+    
+    fresh, stats = load_quantized_whisper('tiny', tmp_path)
+    assert not stats['cached']
+    assert quantized_model_path('tiny', tmp_path).is_file()
+    assert stats['int8_mb'] < stats['fp32_mb']
+    
+    cached, cached_stats = load_quantized_whisper('tiny', tmp_path)
+    assert cached_stats['cached']
+    assert tiny_whisper == ['tiny']  # The fp32 checkpoint is not loaded again
+    assert any(isinstance(m, nnqd.Linear) for m in cached.modules())
+    assert "cached int8 model" in describe_quantization(cached_stats)
+    
+    mel = torch.randn(1, 80, 3000)
+    tokens = torch.zeros(1, 4, dtype=torch.long)
+    with torch.inference_mode():
+        expected = fresh.logits(tokens, fresh.embed_audio(mel))
+        actual = cached.logits(tokens, cached.embed_audio(mel))
+    assert torch.allclose(expected, actual)
+
+
+def test_quantized_backend_decodes_in_fp32():
+    class Model:
+        def transcribe(self, audio, verbose, **options):
+            self.options = options
+            return {'segments': [{'words': [{'word': " hi", 'start': 0.0, 'end': 0.5}]}]}
+    
+    backend = WhisperBackend('tiny', quantize=True)
+    backend.model = Model()
+    words = backend.transcribe(None, {'fp16': True, 'language': 'en'})
+    assert backend.model.options == {'fp16': False, 'language': 'en'}
+    assert [w['word'] for w in words] == [" hi"]
+
+
+def test_describe_quantization_reports_change():
+    line = describe_quantization({
+        'cached': False, 'load_seconds': 2.0, 'fp32_mb': 200.0, 'int8_mb': 50.0,
+        'fp32_seconds': 1.0, 'int8_seconds': 0.5,
+    })
+    assert line.startswith("quantized to int8")
+    assert "200 MB → 50 MB (-75%)" in line
+    assert "2.0× speed" in line
+
+
+def test_quantized_transcripts_are_cached_apart(tmp_path):
+    config = Config(whisper_model='small', quantize=True, cache_dir=str(tmp_path), use_audio_cache=False)
+    assert KaraokePlayer(config)._model_key() == "small:int8-dynamic"
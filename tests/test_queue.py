@@ -0,0 +1,92 @@
+"""Pipelined queue: every song reaches the player thread, failed or not"""
+
+import json
+import threading
+
+import pytest
+
+import karaoke_player
+from karaoke_player import Config, KaraokeQueue, RunProfiler
+
+
+class FakePlayer:
+    """Stands in for KaraokePlayer; queries starting with 'bad' fail to transcribe"""
+
+    played = []
+
+    def __init__(self, config, *args, **kwargs):
+        self.config = config
+        self._model = None
+        self._samples = None
+        self.cleaned = False
+        self.profile = RunProfiler()
+
+    def download_audio(self):
+        return True
+
+    def decode_audio(self):
+        return True
+
+    def transcribe_audio(self):
+        if self.config.song_query.startswith('bad'):
+            raise RuntimeError("model exploded")
+        return [{'word': ' la', 'start': 0.0, 'end': 0.5}]
+
+    def play_karaoke(self, words):
+        FakePlayer.played.append(self.config.song_query)
+
+    def cleanup_audio_file(self):
+        self.cleaned = True
+
+    def run_report(self, success):
+        return self.profile.report(song_query=self.config.song_query, success=success)
+
+
+def run_queue(queries, tmp_path, **options):
+    """Run the queue on a thread so a hang fails the test instead of blocking it"""
+    result = []
+    queue = KaraokeQueue(queries, Config(cache_dir=str(tmp_path), start_delay=0.0, **options))
+    thread = threading.Thread(target=lambda: result.append(queue.run()), daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "queue.run() did not return"
+    return result[0]
+
+
+@pytest.fixture
+def fake_player(monkeypatch):
+    FakePlayer.played = []
+    monkeypatch.setattr(karaoke_player, 'KaraokePlayer', FakePlayer)
+    return FakePlayer
+
+
+def test_queue_plays_songs_in_order(tmp_path, fake_player):
+    assert run_queue(["one", "two", "three"], tmp_path) is True
+    assert fake_player.played == ["one", "two", "three"]
+
+
+def test_transcription_errors_skip_only_that_song(tmp_path, fake_player):
+    assert run_queue(["one", "bad two", "three"], tmp_path) is False
+    assert fake_player.played == ["one", "three"]
+
+
+def test_player_constructor_errors_do_not_hang_the_queue(tmp_path, monkeypatch):
+    def broken_player(config, *args, **kwargs):
+        raise PermissionError(f"cannot create {config.cache_dir}")
+
+    monkeypatch.setattr(karaoke_player, 'KaraokePlayer', broken_player)
+    assert run_queue(["one", "two"], tmp_path) is False
+
+
+def test_queue_writes_a_report_per_song(tmp_path, fake_player):
+    report_file, report_log = tmp_path / "queue.json", tmp_path / "runs.jsonl"
+    run_queue(["one", "bad two"], tmp_path, report_file=str(report_file), report_log=str(report_log))
+
+    lines = [json.loads(line) for line in report_log.read_text().splitlines()]
+    assert [(r['song_query'], r['success']) for r in lines] == [("one", True), ("bad two", False)]
+    assert {s['stage'] for s in lines[0]['stages']} == {'transcription', 'playback'}
+    assert all(s['peak_rss_mb'] is None for s in lines[0]['stages'])  # Songs overlap
+
+    report = json.loads(report_file.read_text())
+    assert report['played'] == 1
+    assert [song['queue_index'] for song in report['songs']] == [0, 1]
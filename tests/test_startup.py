@@ -0,0 +1,50 @@
+"""Startup cost: heavy dependencies load lazily, import-time parsing"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from karaoke_player import HEAVY_MODULES, import_time_report, parse_importtime
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def test_import_does_not_load_heavy_modules():
+    script = (
+        "import sys, karaoke_player; "
+        f"print(','.join(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))"
+    )
+    proc = subprocess.run([sys.executable, '-c', script], cwd=REPO, capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == ""
+
+
+def test_help_does_not_load_heavy_modules():
+    script = (
+        "import sys, karaoke_player\n"
+        "sys.argv = ['karaoke_player.py', '--help']\n"
+        "try:\n    karaoke_player.main()\nexcept SystemExit:\n    pass\n"
+        f"print('LOADED', ','.join(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))"
+    )
+    proc = subprocess.run([sys.executable, '-c', script], cwd=REPO, capture_output=True, text=True, check=True)
+    assert proc.stdout.strip().splitlines()[-1] == "LOADED"
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _io\n"
+        "import time:      2100 |       2500 |     json.decoder\n"
+        "import time:       800 |       3300 | karaoke_player\n"
+        "some other stderr line\n"
+    )
+    assert parse_importtime(stderr) == [
+        ("_io", 1, 120, 120),
+        ("json.decoder", 2, 2100, 2500),
+        ("karaoke_player", 0, 800, 3300),
+    ]
+
+
+def test_import_time_report_finds_no_heavy_modules():
+    report = import_time_report(runs=1)
+    assert report['heavy'] == []
+    assert report['import_ms'] > 0 and report['help_ms'] > 0
@@ -0,0 +1,78 @@
+"""Streaming transcription: windows cut at pauses, every word delivered once"""
+
+import numpy as np
+import pytest
+
+from karaoke_player import WHISPER_SAMPLE_RATE, StreamingTranscriber, TranscriptionBackend, WordStream
+
+
+# (start, end) seconds of each sung word; the 9.8 s word straddles a 10 s grid line
+BURSTS = [(0.5, 1.5), (2.0, 3.5), (4.0, 5.0), (5.5, 7.0), (7.5, 8.4), (9.8, 10.4),
+          (11.0, 12.5), (13.0, 14.0), (16.0, 17.2), (18.0, 19.9), (20.3, 21.0)]
+
+
+def song(seconds=22.0):
+    rate = WHISPER_SAMPLE_RATE
+    samples = np.zeros(int(seconds * rate), dtype=np.float32)
+    for start, end in BURSTS:
+        t = np.arange(int((end - start) * rate)) / rate
+        samples[int(start * rate):int(start * rate) + len(t)] = 0.5 * np.sin(2 * np.pi * 500 * t)
+    return samples
+
+
+class BurstBackend(TranscriptionBackend):
+    """'Hears' one word per loud stretch of the window it is given"""
+
+    name = "bursts"
+
+    def __init__(self):
+        super().__init__("tiny")
+        self.windows = []
+
+    def transcribe(self, audio, options):
+        self.windows.append(len(audio) / WHISPER_SAMPLE_RATE)
+        frame = WHISPER_SAMPLE_RATE // 100
+        loud = np.abs(audio[:len(audio) // frame * frame]).reshape(-1, frame).max(axis=1) > 0.1
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], loud.astype(np.int8), [0]))))
+        return [
+            {'word': ' la', 'start': edges[i] / 100, 'end': edges[i + 1] / 100, 'probability': 1.0}
+            for i in range(0, len(edges), 2)
+        ]
+
+
+def stream_song(window):
+    backend, stream = BurstBackend(), WordStream()
+    transcriber = StreamingTranscriber(backend, song(), {}, window, stream)
+    transcriber.run()
+    assert stream.error is None
+    return backend, stream.snapshot()[0]
+
+
+@pytest.mark.parametrize("window", [5.0, 10.0])
+def test_each_word_is_delivered_once_with_song_timestamps(window):
+    backend, words = stream_song(window)
+    assert len(backend.windows) > 1
+    assert len(words) == len(BURSTS)
+    for word, (start, end) in zip(words, BURSTS):
+        assert (word['start'], word['end']) == pytest.approx((start, end), abs=0.02)
+
+
+def test_windows_respect_the_configured_size():
+    backend, _ = stream_song(10.0)
+    assert max(backend.windows) <= 10.0 + 1.0  # Plus the overlap around the cut
+
+
+def test_progress_is_reported_up_to_each_cut():
+    backend, stream = BurstBackend(), WordStream()
+    progress = []
+    original_extend = stream.extend
+
+    def record(words, until):
+        progress.append((until, [w['start'] for w in words]))
+        original_extend(words, until)
+
+    stream.extend = record
+    StreamingTranscriber(backend, song(), {}, 10.0, stream).run()
+    for until, starts in progress:
+        assert all(start < until for start in starts)
+    assert progress[-1][0] == pytest.approx(22.0)
@@ -0,0 +1,60 @@
+"""Timing engine: line breaking and the token track for every display mode"""
+
+import pytest
+
+from karaoke_player import DisplayMode, build_timing_track
+
+
+WORDS = [
+    {'word': ' hello', 'start': 0.0, 'end': 0.5},
+    {'word': ' world', 'start': 0.6, 'end': 1.0},
+    {'word': ' again', 'start': 2.0, 'end': 2.5},  # 1 s pause: new line
+]
+
+
+def track_tokens(mode):
+    track = build_timing_track(WORDS, mode, new_line_threshold=0.8, max_line_length=40)
+    return [track[i] for i in range(len(track))]
+
+
+def test_line_mode_breaks_on_pauses():
+    assert track_tokens(DisplayMode.LINE) == [
+        ('hello world', 0.0, False), ('\n', 1.95, True), ('again', 2.0, False),
+    ]
+
+
+def test_word_mode_emits_one_token_per_word():
+    assert track_tokens(DisplayMode.WORD) == [
+        ('hello ', 0.0, False), ('world ', 0.6, False), ('\n', 1.95, True), ('again ', 2.0, False),
+    ]
+
+
+def test_character_mode_interpolates_within_words():
+    tokens = track_tokens(DisplayMode.CHARACTER)
+    assert ''.join(text for text, _, _ in tokens) == "hello world \nagain"
+    assert tokens[1][1] == pytest.approx(0.1)  # 'e': second of five characters over 0.5 s
+    assert tokens[5] == (' ', 0.5, False)  # Spaces appear when the word ends
+    assert tokens[11] == (' ', 1.0, False)
+    assert tokens[12] == ('\n', 1.95, True)
+    assert tokens[-1][1] == pytest.approx(2.4)
+
+
+def test_long_lines_are_broken_at_max_length():
+    words = [{'word': f" word{i}", 'start': i * 0.4, 'end': i * 0.4 + 0.3} for i in range(10)]
+    track = build_timing_track(words, DisplayMode.LINE, new_line_threshold=5.0, max_line_length=20)
+    lines = [track.text_at(i) for i in range(len(track)) if not track.newline[i]]
+    assert all(len(line) <= 20 for line in lines)
+    assert ' '.join(lines) == ' '.join(f"word{i}" for i in range(10))
+
+
+def test_timing_track_deadlines_respect_display_order():
+    words = [{'word': ' late', 'start': 1.0, 'end': 1.2}, {'word': ' early', 'start': 0.5, 'end': 0.8}]
+    track = build_timing_track(words, DisplayMode.WORD, new_line_threshold=5.0, max_line_length=40)
+    assert track.due_count(0.9) == 0  # 'early' waits for 'late'
+    assert track.due_count(1.0) == 2
+
+
+def test_line_start_finds_the_first_token_of_a_line():
+    track = build_timing_track(WORDS, DisplayMode.WORD, new_line_threshold=0.8, max_line_length=40)
+    assert track.line_start(1) == 0
+    assert track.line_start(3) == 3
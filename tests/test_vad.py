@@ -0,0 +1,45 @@
+"""Voice-activity pre-pass: region detection and timestamp remapping"""
+
+import numpy as np
+import pytest
+
+from karaoke_player import WHISPER_SAMPLE_RATE, SegmentMap, VoiceActivityDetector
+
+
+def tone_in_noise(seconds=10.0, voiced=(3.0, 5.0)):
+    rate = WHISPER_SAMPLE_RATE
+    rng = np.random.default_rng(1)
+    samples = 0.001 * rng.standard_normal(int(seconds * rate)).astype(np.float32)
+    start, end = int(voiced[0] * rate), int(voiced[1] * rate)
+    t = np.arange(end - start) / rate
+    samples[start:end] += 0.3 * np.sin(2 * np.pi * 800 * t)
+    return samples
+
+
+def test_detect_finds_the_voiced_region_with_padding():
+    regions = VoiceActivityDetector(padding=0.5).detect(tone_in_noise())
+    assert len(regions) == 1
+    start, end = (i / WHISPER_SAMPLE_RATE for i in regions[0])
+    assert start == pytest.approx(2.5, abs=0.1)
+    assert end == pytest.approx(5.5, abs=0.1)
+
+
+def test_compact_keeps_only_voiced_audio_and_maps_it_back():
+    voiced, segments = VoiceActivityDetector(padding=0.5).compact(tone_in_noise())
+    assert len(voiced) / WHISPER_SAMPLE_RATE == pytest.approx(3.0, abs=0.1)
+    assert segments.to_original(0.5) == pytest.approx(3.0, abs=0.1)
+
+
+def test_segment_map_restores_original_times():
+    # Voiced 2-5 s and 10-12 s of the song, packed back to back
+    segments = SegmentMap([(0.0, 2.0, 3.0), (3.0, 10.0, 2.0)])
+    assert segments.to_original(1.0) == 3.0
+    assert segments.to_original(3.5) == 10.5
+    assert segments.to_original(9.0) == 12.0  # Clamped to the end of the last segment
+    words = segments.remap_words([{'word': 'x', 'start': 2.9, 'end': 3.2}])
+    assert words[0]['start'] == pytest.approx(4.9)
+    assert words[0]['end'] == pytest.approx(10.2)
+
+
+def test_empty_segment_map_is_identity():
+    assert SegmentMap([]).to_original(7.5) == 7.5